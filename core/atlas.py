@@ -0,0 +1,140 @@
+"""Atlas de texturas e fila de desenho em lote com ``Surface.fblits``."""
+
+from __future__ import annotations
+
+from typing import Callable, Hashable
+
+import pygame
+
+Position = tuple[int, int]
+
+
+class AtlasFullError(RuntimeError):
+    """Não há mais espaço no atlas para o sprite pedido."""
+
+
+class TextureAtlas:
+    """Empacota sprites pequenos em uma única superfície.
+
+    Os sprites são dispostos em prateleiras (linhas com a altura do maior
+    sprite da linha) e cada um vira uma ``subsurface`` do atlas, que divide os
+    pixels com ele. Com ``like`` o atlas é criado no formato de pixel dessa
+    superfície (normalmente a tela), então os blits não precisam converter
+    nada; sem janela aberta isso substitui ``convert``.
+
+    Sprites podem ser adicionados a qualquer momento, inclusive já durante o
+    jogo (``get`` assa o sprite na primeira vez que ele é pedido).
+    """
+
+    def __init__(
+        self,
+        size: tuple[int, int] = (1024, 1024),
+        like: pygame.Surface | None = None,
+        padding: int = 1,
+    ) -> None:
+        if like is not None:
+            self.surface = pygame.Surface(size, 0, like)
+        else:
+            self.surface = pygame.Surface(size)
+        self.padding = padding
+        self._regions: dict[Hashable, pygame.Surface] = {}
+        self._cursor_x = 0
+        self._cursor_y = 0
+        self._shelf_height = 0
+        self.used_px = 0
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._regions
+
+    def region(self, key: Hashable) -> pygame.Surface | None:
+        """Sprite já empacotado sob ``key``, ou ``None``."""
+
+        return self._regions.get(key)
+
+    def add(self, key: Hashable, sprite: pygame.Surface) -> pygame.Surface:
+        """Copia ``sprite`` para o atlas e retorna a região correspondente."""
+
+        width, height = sprite.get_size()
+        atlas_width, atlas_height = self.surface.get_size()
+        if self._cursor_x + width > atlas_width:
+            self._cursor_x = 0
+            self._cursor_y += self._shelf_height + self.padding
+            self._shelf_height = 0
+        if width > atlas_width or self._cursor_y + height > atlas_height:
+            raise AtlasFullError(
+                f"sem espaço para {width}x{height} no atlas de "
+                f"{atlas_width}x{atlas_height} ({len(self)} sprites)"
+            )
+
+        area = pygame.Rect(self._cursor_x, self._cursor_y, width, height)
+        self.surface.blit(sprite, area)
+        region = self.surface.subsurface(area)
+        self._regions[key] = region
+        self._cursor_x += width + self.padding
+        self._shelf_height = max(self._shelf_height, height)
+        self.used_px += width * height
+        return region
+
+    def get(
+        self, key: Hashable, bake: Callable[[], pygame.Surface]
+    ) -> pygame.Surface:
+        """Região de ``key``; na primeira vez desenha o sprite com ``bake``."""
+
+        region = self._regions.get(key)
+        if region is None:
+            region = self.add(key, bake())
+        return region
+
+    def stats(self) -> dict[str, float]:
+        """Ocupação do atlas, no formato aceito pelo ``FrameProfiler``."""
+
+        width, height = self.surface.get_size()
+        return {
+            "sprites": len(self._regions),
+            "used_px": self.used_px,
+            "fill_ratio": self.used_px / (width * height),
+        }
+
+
+class RenderQueue:
+    """Acumula ``(sprite, posição)`` de um frame e desenha tudo de uma vez.
+
+    ``flush`` envia a fila inteira em uma única chamada de ``Surface.fblits``
+    (ou ``blits`` no pygame sem ``fblits``), trocando centenas de chamadas
+    Python por uma. A ordem de desenho é a ordem em que os sprites entraram.
+    """
+
+    def __init__(self) -> None:
+        self._items: list[tuple[pygame.Surface, Position]] = []
+        self.submitted = 0
+        self.flushes = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, sprite: pygame.Surface, position: Position) -> None:
+        self._items.append((sprite, position))
+
+    def flush(self, surface: pygame.Surface) -> int:
+        """Desenha e esvazia a fila; retorna quantos sprites foram desenhados."""
+
+        items = self._items
+        count = len(items)
+        if count:
+            if hasattr(surface, "fblits"):
+                surface.fblits(items)
+            else:
+                surface.blits(items, doreturn=False)
+            items.clear()
+            self.submitted += count
+            self.flushes += 1
+        return count
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def stats(self) -> dict[str, float]:
+        return {"sprites": self.submitted, "flushes": self.flushes}
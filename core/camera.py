@@ -5,21 +5,94 @@ from __future__ import annotations
 import pygame
 
 
+def lerp_rect(
+    rect: pygame.Rect, previous_topleft: tuple[int, int], alpha: float
+) -> pygame.Rect:
+    """Retorna ``rect`` deslocado para ``alpha`` entre ``previous_topleft`` e o atual."""
+
+    if alpha >= 1.0:
+        return rect
+    resolved = rect.copy()
+    lerp_rect_ip(resolved, previous_topleft, alpha)
+    return resolved
+
+
+def lerp_rect_ip(
+    rect: pygame.Rect, previous_topleft: tuple[int, int], alpha: float
+) -> None:
+    """Versão de ``lerp_rect`` que desloca ``rect`` no lugar."""
+
+    if alpha >= 1.0:
+        return
+    back = 1.0 - max(0.0, alpha)
+    rect.move_ip(
+        round((previous_topleft[0] - rect.x) * back),
+        round((previous_topleft[1] - rect.y) * back),
+    )
+
+
 class Camera:
-    """Mantém um offset para renderizar mundo relativo à tela."""
+    """Mantém um offset para renderizar mundo relativo à tela.
+
+    ``position`` é o estado da simulação. O desenho usa ``render_position``,
+    que ``interpolate`` posiciona entre o passo anterior e o atual quando a
+    simulação roda em passo fixo. Os vetores são atualizados no lugar, então
+    quem precisar de uma cópia deve fazê-la.
+    """
 
     def __init__(self, viewport_size: tuple[int, int]) -> None:
         self.viewport = pygame.Vector2(viewport_size)
         self.position = pygame.Vector2(0, 0)
+        self.previous_position = pygame.Vector2(0, 0)
+        self.render_position = pygame.Vector2(0, 0)
 
     def follow(self, target_center: tuple[float, float]) -> None:
         """Centraliza a câmera no ``target_center``."""
 
-        target = pygame.Vector2(target_center)
-        self.position = target - self.viewport / 2
+        self.position.update(
+            target_center[0] - self.viewport.x / 2,
+            target_center[1] - self.viewport.y / 2,
+        )
+        self.render_position.update(self.position)
+
+    def store_previous(self) -> None:
+        """Guarda a posição atual como ponto de partida da interpolação."""
+
+        self.previous_position.update(self.position)
+
+    def interpolate(self, alpha: float) -> None:
+        """Posiciona a câmera de desenho em ``alpha`` entre o passo anterior e o atual."""
+
+        if alpha >= 1.0:
+            self.render_position.update(self.position)
+            return
+
+        # Mesma fórmula de Vector2.lerp, sem criar um vetor novo.
+        alpha = max(0.0, alpha)
+        back = 1.0 - alpha
+        previous = self.previous_position
+        self.render_position.update(
+            previous.x * back + self.position.x * alpha,
+            previous.y * back + self.position.y * alpha,
+        )
 
     def apply(self, rect: pygame.Rect) -> pygame.Rect:
         """Retorna um novo ``Rect`` ajustado pelo offset da câmera."""
 
-        return rect.move(-int(self.position.x), -int(self.position.y))
+        return rect.move(-int(self.render_position.x), -int(self.render_position.y))
+
+    def apply_ip(self, rect: pygame.Rect) -> pygame.Rect:
+        """Converte ``rect`` para coordenadas de tela no lugar e o retorna."""
+
+        rect.move_ip(-int(self.render_position.x), -int(self.render_position.y))
+        return rect
+
+    def visible_rect(self) -> pygame.Rect:
+        """Retângulo do mundo atualmente visível na tela."""
 
+        return pygame.Rect(
+            int(self.render_position.x),
+            int(self.render_position.y),
+            int(self.viewport.x),
+            int(self.viewport.y),
+        )
@@ -0,0 +1,53 @@
+"""Etapa de culling que descarta o que está fora da área visível da câmera."""
+
+from __future__ import annotations
+
+from typing import Hashable, TypeVar
+
+import pygame
+
+from core.camera import Camera
+from systems.spatial_hash import SpatialHash
+
+T = TypeVar("T", bound=Hashable)
+
+
+class ViewportCuller:
+    """Filtra entidades visíveis consultando um ``SpatialHash``.
+
+    A área visível é inflada por ``margin`` pixels para não cortar elementos
+    desenhados fora do ``rect`` da entidade (como a barra de vida acima do
+    inimigo). Os contadores ``visible_count`` e ``culled_count`` são zerados a
+    cada ``begin_frame`` e acumulam tudo que passou pelo culler no frame.
+    """
+
+    def __init__(self, margin: int = 16) -> None:
+        self.margin = margin
+        self.view_rect = pygame.Rect(0, 0, 0, 0)
+        self.visible_count = 0
+        self.culled_count = 0
+
+    def begin_frame(self, camera: Camera) -> pygame.Rect:
+        """Calcula a área visível do frame e zera os contadores."""
+
+        self.view_rect = camera.visible_rect().inflate(self.margin * 2, self.margin * 2)
+        self.visible_count = 0
+        self.culled_count = 0
+        return self.view_rect
+
+    def visible(self, index: SpatialHash[T]) -> list[T]:
+        """Retorna os objetos do índice que intersectam a área visível."""
+
+        found = index.query_rect(self.view_rect)
+        self.visible_count += len(found)
+        self.culled_count += len(index) - len(found)
+        return found
+
+    def is_visible(self, rect: pygame.Rect) -> bool:
+        """Testa um único retângulo avulso contra a área visível."""
+
+        if self.view_rect.colliderect(rect):
+            self.visible_count += 1
+            return True
+        self.culled_count += 1
+        return False
@@ -0,0 +1,152 @@
+"""Rastreamento de áreas alteradas da tela para ``pygame.display.update(rects)``."""
+
+from __future__ import annotations
+
+from typing import Hashable, Iterable
+
+import pygame
+
+# (x, y, largura, altura) na tela e um valor que muda quando a aparência muda.
+Entry = tuple[tuple[int, int, int, int], Hashable]
+
+
+def merge_rects(rects: Iterable[pygame.Rect]) -> list[pygame.Rect]:
+    """Une retângulos que se sobrepõem até nenhum par se sobrepor."""
+
+    merged: list[pygame.Rect] = []
+    for rect in rects:
+        rect = rect.copy()
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+def draw_frame(
+    surface: pygame.Surface, color, rect: pygame.Rect, width: int = 1
+) -> None:
+    """Desenha só a borda de ``rect``, como ``pygame.draw.rect(..., width=width)``.
+
+    Quando o clip (ou a borda da superfície) corta o retângulo,
+    ``pygame.draw.rect`` com ``width`` pinta colunas a mais; com ``fill`` o
+    resultado não depende do clip, o que o redesenho por áreas sujas exige.
+    """
+
+    x, y, w, h = rect
+    if w <= 2 * width or h <= 2 * width:
+        surface.fill(color, rect)
+        return
+    surface.fill(color, (x, y, w, width))
+    surface.fill(color, (x, y + h - width, w, width))
+    surface.fill(color, (x, y + width, width, h - 2 * width))
+    surface.fill(color, (x + w - width, y + width, width, h - 2 * width))
+
+
+class DirtyRectTracker:
+    """Compara o que foi desenhado em dois frames e devolve só o que mudou.
+
+    A cada frame a cena registra com ``track`` o retângulo de tela e a
+    aparência de cada elemento (entidade, HUD). ``end_frame`` compara com o
+    frame anterior: elementos que se moveram, mudaram de aparência, surgiram
+    ou sumiram sujam a área antiga e a nova. As áreas são unidas quando se
+    sobrepõem e recortadas pela tela.
+
+    O frame inteiro é redesenhado (``end_frame`` retorna ``None``) quando o
+    offset da câmera muda, quando ``force_full`` é chamado ou quando a área
+    suja passa de ``max_dirty_ratio`` da tela ou de ``max_rects`` retângulos,
+    pontos em que atualizar tudo de uma vez sai mais barato.
+    """
+
+    def __init__(
+        self,
+        screen_size: tuple[int, int],
+        max_dirty_ratio: float = 0.5,
+        max_rects: int = 64,
+    ) -> None:
+        self.screen = pygame.Rect((0, 0), screen_size)
+        self.max_dirty_ratio = max_dirty_ratio
+        self.max_rects = max_rects
+        self._previous: dict[Hashable, Entry] = {}
+        self._current: dict[Hashable, Entry] = {}
+        self._previous_offset: tuple[int, int] | None = None
+        self._offset: tuple[int, int] = (0, 0)
+        self._force = True
+        self.last_dirty_area = 0
+        self.last_rect_count = 0
+        self.total_dirty_area = 0
+        self.full_redraws = 0
+        self.partial_redraws = 0
+
+    def begin_frame(self, offset: tuple[int, int]) -> None:
+        """Inicia um frame com a câmera em ``offset`` (pixels inteiros)."""
+
+        self._offset = offset
+        self._current = {}
+
+    def track(
+        self, key: Hashable, rect: pygame.Rect, appearance: Hashable = None
+    ) -> None:
+        self._current[key] = ((rect.x, rect.y, rect.width, rect.height), appearance)
+
+    def force_full(self) -> None:
+        """Faz o próximo ``end_frame`` pedir um redesenho completo."""
+
+        self._force = True
+
+    def end_frame(self) -> list[pygame.Rect] | None:
+        """Áreas sujas do frame, ou ``None`` se a tela toda deve ser redesenhada."""
+
+        previous, current = self._previous, self._current
+        self._previous = current
+        full = self._force or self._offset != self._previous_offset
+        self._previous_offset = self._offset
+        self._force = False
+
+        rects: list[pygame.Rect] = []
+        if not full:
+            for key in previous.keys() | current.keys():
+                before = previous.get(key)
+                after = current.get(key)
+                if before == after:
+                    continue
+                if before is not None:
+                    rects.append(pygame.Rect(before[0]))
+                if after is not None:
+                    rects.append(pygame.Rect(after[0]))
+            rects = [
+                rect.clip(self.screen)
+                for rect in merge_rects(rects)
+                if rect.colliderect(self.screen)
+            ]
+            area = sum(rect.width * rect.height for rect in rects)
+            full = (
+                area > self.screen.width * self.screen.height * self.max_dirty_ratio
+                or len(rects) > self.max_rects
+            )
+
+        if full:
+            self.full_redraws += 1
+            self.last_dirty_area = self.screen.width * self.screen.height
+            self.last_rect_count = 1
+            self.total_dirty_area += self.last_dirty_area
+            return None
+
+        self.partial_redraws += 1
+        self.last_dirty_area = area
+        self.last_rect_count = len(rects)
+        self.total_dirty_area += area
+        return rects
+
+    def stats(self) -> dict[str, float]:
+        """Área suja do último frame e totais, no formato do ``FrameProfiler``."""
+
+        screen_area = self.screen.width * self.screen.height
+        return {
+            "dirty_px": self.last_dirty_area,
+            "dirty_ratio": self.last_dirty_area / screen_area if screen_area else 0.0,
+            "rects": self.last_rect_count,
+            "full_redraws": self.full_redraws,
+            "partial_redraws": self.partial_redraws,
+        }
@@ -1,29 +1,106 @@
+import logging
+import os
+import time
+from pathlib import Path
+
 import pygame
 
+from core.perf_overlay import PerfOverlay
+from core.profiler import FrameProfiler
+from core.resources import ResourceManager
 from core.scene import Scene
+from core.text_cache import TextCache
+
+logger = logging.getLogger(__name__)
 
 
 class Game:
-    """Loop principal do jogo e gerenciamento de cenas."""
+    """Loop principal do jogo e gerenciamento de cenas.
+
+    A simulação avança em passos fixos de ``1 / sim_hz`` segundos, acumulando o
+    tempo real de cada frame. No máximo ``max_catchup_steps`` passos rodam por
+    frame; o atraso excedente é descartado para evitar a espiral da morte. O
+    desenho recebe ``alpha`` (fração do próximo passo já decorrida) para
+    interpolar posições entre passos.
+
+    Com ``headless`` nenhuma janela é aberta: a cena desenha em uma superfície
+    em memória e ``run_headless`` avança a simulação sem limite de FPS.
+
+    Com ``dirty_rects`` a cena informa quais áreas mudaram (``draw_dirty``) e
+    só elas são enviadas com ``pygame.display.update(rects)``, em vez de um
+    ``flip`` da tela inteira a cada frame.
 
-    def __init__(self, width: int = 960, height: int = 540, target_fps: int = 60) -> None:
-        pygame.init()
+    ``F3`` alterna o overlay de desempenho e ``F4`` exporta o histórico do
+    profiler para ``profile_dir`` em CSV e JSON; uma falha ao gravar é
+    registrada no log e o jogo continua.
+
+    ``resources`` guarda fontes, configs e mapas carregados uma única vez no
+    processo; com ``hot_reload`` arquivos alterados no disco são recarregados
+    na próxima consulta.
+    """
+
+    def __init__(
+        self,
+        width: int = 960,
+        height: int = 540,
+        target_fps: int = 60,
+        sim_hz: int = 60,
+        max_catchup_steps: int = 5,
+        headless: bool = False,
+        hot_reload: bool = False,
+        dirty_rects: bool = False,
+    ) -> None:
+        self.headless = headless
+        self.dirty_rects = dirty_rects
+        self._full_redraw = True
+        if headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        # Só o vídeo (com eventos e teclado); ``pygame.init`` também abriria
+        # áudio e joysticks, que o jogo não usa. Fontes são iniciadas sob demanda.
+        pygame.display.init()
         self.size = (width, height)
-        self.screen = pygame.display.set_mode(self.size)
-        pygame.display.set_caption("ARPG Prototype")
+        if headless:
+            self.screen = pygame.Surface(self.size)
+        else:
+            self.screen = pygame.display.set_mode(self.size)
+            pygame.display.set_caption("ARPG Prototype")
+        self.profiler = FrameProfiler()
+        self.text_cache = TextCache()
+        self.profiler.add_counter_source("text_cache", self.text_cache.stats)
+        self.resources = ResourceManager(hot_reload=hot_reload)
+        self.profiler.add_counter_source("resources", self.resources.stats)
+        self.perf_overlay = PerfOverlay(budget_ms=1000.0 / target_fps)
+        self.profile_dir = Path("profiles")
         self.clock = pygame.time.Clock()
         self.target_fps = target_fps
+        self.sim_hz = sim_hz
+        self.fixed_delta = 1.0 / sim_hz
+        self.max_catchup_steps = max_catchup_steps
+        self.accumulator = 0.0
         self.active_scene: Scene | None = None
         self.running = True
 
     def set_scene(self, scene: Scene) -> None:
+        if self.active_scene is not None and self.active_scene is not scene:
+            self.active_scene.exit()
         self.active_scene = scene
+        self._full_redraw = True
         scene.enter()
 
     def handle_events(self) -> None:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.perf_overlay.toggle()
+                self._full_redraw = True
+                continue
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                try:
+                    self.export_profile()
+                except OSError as error:
+                    logger.warning("não foi possível exportar o profile: %s", error)
+                continue
             if self.active_scene:
                 self.active_scene.handle_event(event)
 
@@ -31,15 +108,98 @@ class Game:
         if self.active_scene:
             self.active_scene.update(delta_time)
 
-    def draw(self) -> None:
-        if self.active_scene:
-            self.active_scene.draw(self.screen)
-        pygame.display.flip()
+    def draw(self, alpha: float = 1.0) -> None:
+        rects = None
+        with self.profiler.section("draw"):
+            if self.active_scene:
+                if self.dirty_rects and not self.perf_overlay.visible:
+                    rects = self.active_scene.draw_dirty(
+                        self.screen, alpha, full=self._full_redraw
+                    )
+                    self._full_redraw = False
+                else:
+                    self.active_scene.draw(self.screen, alpha)
+            self.perf_overlay.draw(self.screen, self.profiler)
+        with self.profiler.section("flip"):
+            if rects is None:
+                pygame.display.flip()
+            elif rects:
+                pygame.display.update(rects)
+
+    def export_profile(self) -> tuple[Path, Path]:
+        """Exporta o ring buffer do profiler; retorna os caminhos CSV e JSON.
+
+        O nome leva data, hora e milissegundos, com um contador se ainda assim
+        coincidir, para que exportações seguidas não se sobrescrevam.
+        """
+
+        now = time.time()
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now))
+        stamp = f"{stamp}-{int(now * 1000) % 1000:03d}"
+        base = self.profile_dir / f"profile-{stamp}"
+        attempt = 1
+        while base.with_suffix(".csv").exists() or base.with_suffix(".json").exists():
+            attempt += 1
+            base = self.profile_dir / f"profile-{stamp}-{attempt}"
+        return (
+            self.profiler.export_csv(base.with_suffix(".csv")),
+            self.profiler.export_json(base.with_suffix(".json")),
+        )
+
+    def advance(self, frame_time: float) -> int:
+        """Acumula ``frame_time`` e roda os passos fixos devidos; retorna quantos."""
+
+        self.accumulator += frame_time
+        steps = 0
+        while self.accumulator >= self.fixed_delta and steps < self.max_catchup_steps:
+            self.update(self.fixed_delta)
+            self.accumulator -= self.fixed_delta
+            steps += 1
+
+        if self.accumulator >= self.fixed_delta:
+            self.accumulator %= self.fixed_delta
+        return steps
+
+    def interpolation_alpha(self) -> float:
+        return self.accumulator / self.fixed_delta
 
     def run(self) -> None:
         while self.running:
-            delta_time = self.clock.tick(self.target_fps) / 1000.0
-            self.handle_events()
-            self.update(delta_time)
-            self.draw()
+            frame_time = self.clock.tick(self.target_fps) / 1000.0
+            self.profiler.begin_frame()
+            with self.profiler.section("handle_events"):
+                self.resources.poll()
+                self.handle_events()
+            with self.profiler.section("update"):
+                self.advance(frame_time)
+            self.draw(self.interpolation_alpha())
+            self.profiler.end_frame()
+        if self.active_scene is not None:
+            self.active_scene.exit()
         pygame.quit()
+
+    def run_headless(self, ticks: int, render: bool = False) -> int:
+        """Roda ``ticks`` passos fixos o mais rápido possível; retorna quantos rodaram.
+
+        Não há janela, vsync nem limite de FPS. Com ``render`` a cena também é
+        desenhada na superfície em memória a cada passo, pelo mesmo caminho de
+        ``draw`` (inclusive ``draw_dirty`` quando ``dirty_rects`` está ligado).
+        """
+
+        completed = 0
+        while completed < ticks and self.running:
+            self.profiler.begin_frame()
+            with self.profiler.section("update"):
+                self.update(self.fixed_delta)
+            if render and self.active_scene:
+                with self.profiler.section("draw"):
+                    if self.dirty_rects:
+                        self.active_scene.draw_dirty(
+                            self.screen, 1.0, full=self._full_redraw
+                        )
+                        self._full_redraw = False
+                    else:
+                        self.active_scene.draw(self.screen)
+            self.profiler.end_frame()
+            completed += 1
+        return completed
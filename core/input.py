@@ -0,0 +1,88 @@
+"""Fontes de input por tick: teclado ao vivo ou sequências roteirizadas."""
+
+from __future__ import annotations
+
+from typing import NamedTuple, Sequence
+
+import pygame
+
+
+class InputFrame(NamedTuple):
+    """Estado de input consumido pela cena em um passo de simulação."""
+
+    up: bool = False
+    down: bool = False
+    left: bool = False
+    right: bool = False
+    attack: bool = False
+
+    def direction(self) -> pygame.Vector2:
+        """Vetor de direção (não normalizado) equivalente às teclas pressionadas."""
+
+        direction = pygame.Vector2(0, 0)
+        if self.up:
+            direction.y -= 1
+        if self.down:
+            direction.y += 1
+        if self.left:
+            direction.x -= 1
+        if self.right:
+            direction.x += 1
+        return direction
+
+
+IDLE = InputFrame()
+
+
+class KeyboardInput:
+    """Lê o teclado a cada passo; o ataque continua vindo de ``KEYDOWN``."""
+
+    def poll(self) -> InputFrame:
+        keys = pygame.key.get_pressed()
+        return InputFrame(
+            up=bool(keys[pygame.K_w] or keys[pygame.K_UP]),
+            down=bool(keys[pygame.K_s] or keys[pygame.K_DOWN]),
+            left=bool(keys[pygame.K_a] or keys[pygame.K_LEFT]),
+            right=bool(keys[pygame.K_d] or keys[pygame.K_RIGHT]),
+        )
+
+
+class ScriptedInput:
+    """Reproduz uma sequência fixa de ``InputFrame``, um por passo.
+
+    Com ``loop`` a sequência recomeça ao terminar; caso contrário o input fica
+    parado depois do último frame.
+    """
+
+    def __init__(self, frames: Sequence[InputFrame], loop: bool = True) -> None:
+        self.frames = list(frames)
+        self.loop = loop
+        self.tick = 0
+
+    def poll(self) -> InputFrame:
+        if not self.frames:
+            return IDLE
+
+        index = self.tick
+        self.tick += 1
+        if self.loop:
+            return self.frames[index % len(self.frames)]
+        if index < len(self.frames):
+            return self.frames[index]
+        return IDLE
+
+    @classmethod
+    def patrol(cls, leg_ticks: int = 90, attack_every: int = 20) -> "ScriptedInput":
+        """Roteiro de benchmark: anda em quadrado atacando periodicamente."""
+
+        legs = (
+            InputFrame(right=True),
+            InputFrame(down=True),
+            InputFrame(left=True),
+            InputFrame(up=True),
+        )
+        frames: list[InputFrame] = []
+        for leg in legs:
+            for tick in range(leg_ticks):
+                frames.append(leg._replace(attack=tick % attack_every == 0))
+        return cls(frames)
@@ -0,0 +1,72 @@
+"""Carregamento de recursos em segundo plano atrás de uma tela mínima."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Sequence
+
+LoadTask = Callable[[], object]
+
+
+class BackgroundLoader:
+    """Roda tarefas de carregamento em ordem, fora da thread principal.
+
+    As tarefas normalmente aquecem o ``ResourceManager`` (fontes, configs,
+    mapas); a thread principal só consulta ``progress`` e ``done`` para
+    continuar desenhando frames. ``check`` repassa para a thread principal a
+    primeira exceção de uma tarefa.
+
+    Sem ``threaded`` cada tarefa roda na hora em ``start``, o que mantém
+    headless e benchmarks determinísticos.
+    """
+
+    def __init__(self, tasks: Sequence[LoadTask], threaded: bool = True) -> None:
+        self.tasks = list(tasks)
+        self.threaded = threaded
+        self._futures: list[Future[object]] = []
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def started(self) -> bool:
+        return bool(self._futures) or not self.tasks
+
+    @property
+    def progress(self) -> float:
+        """Fração das tarefas concluídas (0 a 1)."""
+
+        if not self.tasks:
+            return 1.0
+        finished = sum(1 for future in self._futures if future.done())
+        return finished / len(self.tasks)
+
+    @property
+    def done(self) -> bool:
+        return self.started and all(future.done() for future in self._futures)
+
+    def start(self) -> None:
+        if self.started:
+            return
+        if not self.threaded:
+            for task in self.tasks:
+                future: Future[object] = Future()
+                try:
+                    future.set_result(task())
+                except Exception as error:  # repassada em ``check``
+                    future.set_exception(error)
+                self._futures.append(future)
+            return
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="loader")
+        self._futures = [self._executor.submit(task) for task in self.tasks]
+
+    def check(self) -> None:
+        """Relança na thread principal o erro da primeira tarefa que falhou."""
+
+        for future in self._futures:
+            if future.done() and future.exception() is not None:
+                raise future.exception()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
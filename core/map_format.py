@@ -0,0 +1,305 @@
+"""Formato binário compilado para mapas Tiled/JSON, carregado via ``mmap``.
+
+O JSON do Tiled é prático de editar mas caro de interpretar em mapas grandes.
+``compile_map`` converte o JSON uma única vez para um arquivo binário com as
+camadas de tiles em arrays compactos, os colisores já mesclados e os pontos de
+spawn. ``load_map`` mapeia esse arquivo em memória e expõe as camadas como
+``memoryview`` sobre o próprio ``mmap``, sem copiar os tiles.
+
+O cache fica em ``data/.cache`` e é invalidado pelo SHA-256 do arquivo fonte
+(e pela versão do formato), guardado no cabeçalho do binário.
+
+Layout (little-endian)::
+
+    cabeçalho   HEADER
+    camadas     LAYER_ENTRY x layer_count, seguidas dos dados (alinhados em 4)
+    colisores   COLLIDER x collider_count   (em tiles: x, y, largura, altura)
+    spawns      SPAWN x spawn_count         (tipo, x, y em tiles)
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import pygame
+
+from systems.wall_merge import merge_tiles
+
+MAGIC = b"PMAP"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHIIIII32s")
+LAYER_ENTRY = struct.Struct("<24scxxxI")
+LAYER_NAME_SIZE = LAYER_ENTRY.size - 8
+COLLIDER = struct.Struct("<IIII")
+SPAWN = struct.Struct("<III")
+
+SPAWN_KINDS = ("player_spawn", "enemy_spawn")
+# Bits de espelhamento/rotação que o Tiled grava nos gids.
+TILED_FLIP_MASK = 0xF0000000
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / ".cache"
+
+
+class MapFormatError(ValueError):
+    """Arquivo de mapa (fonte ou compilado) inválido."""
+
+
+class CompiledMap:
+    """Mapa carregado de um binário compilado, com as camadas sobre o ``mmap``.
+
+    ``layers`` associa o nome de cada camada de tiles a uma lista de linhas;
+    cada linha é um ``memoryview`` do arquivo mapeado e pode ser indexada como
+    uma lista (``tiles[y][x]``). O mapeamento é feito com cópia na escrita,
+    então editar tiles em memória não altera o arquivo em disco.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        view = memoryview(self._mmap)
+
+        if len(view) < HEADER.size:
+            raise MapFormatError(f"{path}: arquivo truncado")
+        (
+            magic,
+            version,
+            layer_count,
+            self.width,
+            self.height,
+            self.tile_size,
+            collider_count,
+            spawn_count,
+            self.source_hash,
+        ) = HEADER.unpack_from(view)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise MapFormatError(f"{path}: formato ou versão desconhecidos")
+
+        self.layers: dict[str, list[memoryview]] = {}
+        tile_count = self.width * self.height
+        offset = _align(HEADER.size + LAYER_ENTRY.size * layer_count)
+        for entry in range(layer_count):
+            raw_name, typecode, data_offset = LAYER_ENTRY.unpack_from(
+                view, HEADER.size + LAYER_ENTRY.size * entry
+            )
+            try:
+                name = raw_name.rstrip(b"\0").decode("utf-8")
+            except UnicodeDecodeError as error:
+                raise MapFormatError(f"{path}: nome de camada inválido") from error
+            code = typecode.decode("ascii")
+            end = data_offset + tile_count * struct.calcsize(code)
+            data = view[data_offset:end].cast(code)
+            self.layers[name] = [
+                data[y * self.width : (y + 1) * self.width] for y in range(self.height)
+            ]
+            offset = max(offset, _align(end))
+
+        self.colliders = [
+            tuple(entry)
+            for entry in struct.iter_unpack(
+                COLLIDER.format,
+                view[offset : offset + collider_count * COLLIDER.size],
+            )
+        ]
+        offset += collider_count * COLLIDER.size
+
+        self.player_spawn: tuple[int, int] | None = None
+        self.enemy_spawns: list[tuple[int, int]] = []
+        for kind, x, y in struct.iter_unpack(
+            SPAWN.format, view[offset : offset + spawn_count * SPAWN.size]
+        ):
+            if SPAWN_KINDS[kind] == "player_spawn":
+                self.player_spawn = (x, y)
+            else:
+                self.enemy_spawns.append((x, y))
+
+    @property
+    def tiles(self) -> list[memoryview]:
+        """Primeira camada de tiles, usada para colisão e desenho."""
+
+        return next(iter(self.layers.values()))
+
+    def collider_rects(self, tile_size: int | None = None) -> list[pygame.Rect]:
+        """Colisores pré-mesclados convertidos para pixels."""
+
+        size = tile_size or self.tile_size
+        return [
+            pygame.Rect(x * size, y * size, width * size, rows * size)
+            for x, y, width, rows in self.colliders
+        ]
+
+
+def load_map(
+    source: str | Path, cache_dir: str | Path | None = None, solid: int = 1
+) -> CompiledMap:
+    """Carrega ``source`` a partir do cache, recompilando se estiver desatualizado."""
+
+    source = Path(source)
+    target = cache_path(source, cache_dir)
+    digest = hashlib.sha256(source.read_bytes()).digest()
+    if cached_hash(target) != digest:
+        compile_map(source, target, solid)
+    return CompiledMap(target)
+
+
+def cache_path(source: Path, cache_dir: str | Path | None = None) -> Path:
+    """Arquivo de cache de ``source``: o nome do mapa e um hash do caminho.
+
+    O hash do caminho absoluto evita que mapas de mesmo nome em pastas
+    diferentes (``a/town.json`` e ``b/town.json``) disputem o mesmo arquivo.
+    """
+
+    resolved = str(Path(source).resolve()).encode("utf-8")
+    tag = hashlib.sha256(resolved).hexdigest()[:12]
+    return Path(cache_dir or DEFAULT_CACHE_DIR) / f"{source.stem}-{tag}.pmap"
+
+
+def cached_hash(target: Path) -> bytes | None:
+    """Hash do fonte gravado em ``target`` ou ``None`` se não houver cache válido."""
+
+    try:
+        with target.open("rb") as file:
+            header = file.read(HEADER.size)
+    except OSError:
+        return None
+    if len(header) < HEADER.size:
+        return None
+
+    fields = HEADER.unpack(header)
+    if fields[0] != MAGIC or fields[1] != FORMAT_VERSION:
+        return None
+    return fields[-1]
+
+
+def compile_map(source: str | Path, target: str | Path, solid: int = 1) -> int:
+    """Compila o JSON do Tiled em ``source`` para ``target`` e retorna o tamanho.
+
+    A primeira camada de tiles define a colisão: tiles iguais a ``solid`` viram
+    colisores mesclados. Objetos com ``type``/``class`` ``player_spawn`` ou
+    ``enemy_spawn`` viram pontos de spawn em coordenadas de tile.
+    """
+
+    source = Path(source)
+    target = Path(target)
+    raw = source.read_bytes()
+    try:
+        document = json.loads(raw)
+    except json.JSONDecodeError as error:
+        raise MapFormatError(f"{source}: JSON inválido ({error})") from error
+
+    width = int(document["width"])
+    height = int(document["height"])
+    tile_size = int(document["tilewidth"])
+    layers = [
+        (layer["name"], _layer_tiles(layer, width * height, source))
+        for layer in document.get("layers", [])
+        if layer.get("type") == "tilelayer"
+    ]
+    if not layers:
+        raise MapFormatError(f"{source}: nenhuma camada de tiles")
+    names = [_layer_name(name) for name, _ in layers]
+    for index, name in enumerate(names):
+        if name in names[:index]:
+            raise MapFormatError(
+                f"{source}: camadas com o mesmo nome depois de truncar: {name!r}"
+            )
+
+    grid = [layers[0][1][y * width : (y + 1) * width] for y in range(height)]
+    colliders = merge_tiles(grid, solid)
+    spawns = list(_spawns(document, tile_size))
+
+    payload = bytearray(
+        HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            len(layers),
+            width,
+            height,
+            tile_size,
+            len(colliders),
+            len(spawns),
+            hashlib.sha256(raw).digest(),
+        )
+    )
+    data_offset = _align(len(payload) + LAYER_ENTRY.size * len(layers))
+    blobs: list[bytes] = []
+    for name, (_, tiles) in zip(names, layers):
+        typecode = _typecode(tiles)
+        blob = struct.pack(f"<{len(tiles)}{typecode}", *tiles)
+        encoded = name.encode("utf-8")
+        payload += LAYER_ENTRY.pack(encoded, typecode.encode("ascii"), data_offset)
+        blobs.append(blob)
+        data_offset = _align(data_offset + len(blob))
+
+    for blob in blobs:
+        payload += b"\0" * (_align(len(payload)) - len(payload))
+        payload += blob
+    payload += b"\0" * (_align(len(payload)) - len(payload))
+    for collider in colliders:
+        payload += COLLIDER.pack(*collider)
+    for kind, x, y in spawns:
+        payload += SPAWN.pack(SPAWN_KINDS.index(kind), x, y)
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Nome temporário único: dois processos podem recompilar o mesmo mapa.
+    with tempfile.NamedTemporaryFile(
+        dir=target.parent, prefix=target.name + ".", suffix=".tmp", delete=False
+    ) as file:
+        temporary = Path(file.name)
+    try:
+        temporary.write_bytes(payload)
+        os.replace(temporary, target)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+    return len(payload)
+
+
+def _layer_name(name: str) -> str:
+    """Nome como fica gravado: truncado sem partir um caractere UTF-8."""
+
+    encoded = name.encode("utf-8")[:LAYER_NAME_SIZE]
+    return encoded.decode("utf-8", "ignore")
+
+
+def _layer_tiles(layer: dict, expected: int, source: Path) -> list[int]:
+    data = layer.get("data")
+    if layer.get("encoding") == "base64":
+        if layer.get("compression"):
+            raise MapFormatError(f"{source}: camadas comprimidas não são suportadas")
+        raw = base64.b64decode(data)
+        data = [value for (value,) in struct.iter_unpack("<I", raw)]
+    if not isinstance(data, list) or len(data) != expected:
+        raise MapFormatError(f"{source}: camada {layer.get('name')!r} com tamanho errado")
+    return [int(gid) & ~TILED_FLIP_MASK for gid in data]
+
+
+def _spawns(document: dict, tile_size: int) -> Iterable[tuple[str, int, int]]:
+    for layer in document.get("layers", []):
+        if layer.get("type") != "objectgroup":
+            continue
+        for obj in layer.get("objects", []):
+            kind = obj.get("class") or obj.get("type")
+            if kind in SPAWN_KINDS:
+                yield kind, int(obj["x"] // tile_size), int(obj["y"] // tile_size)
+
+
+def _typecode(tiles: Sequence[int]) -> str:
+    largest = max(tiles, default=0)
+    if largest < 1 << 8:
+        return "B"
+    if largest < 1 << 16:
+        return "H"
+    return "I"
+
+
+def _align(offset: int) -> int:
+    return (offset + 3) & ~3
@@ -0,0 +1,82 @@
+"""Overlay de desempenho com percentis e gráfico dos tempos de frame."""
+
+from __future__ import annotations
+
+import pygame
+
+from core.profiler import FRAME_KEY, FrameProfiler
+
+PANEL_COLOR = (10, 10, 16, 190)
+TEXT_COLOR = (220, 230, 220)
+BAR_COLOR = (110, 200, 120)
+SLOW_BAR_COLOR = (230, 110, 90)
+BUDGET_LINE_COLOR = (240, 220, 120)
+PHASES = ("handle_events", "update", "draw", "flip")
+GRAPH_SIZE = (240, 60)
+VALUE_COLUMN_X = 110
+
+
+class PerfOverlay:
+    """Desenha p50/p99 do frame e das fases principais, mais um gráfico.
+
+    O gráfico mostra as últimas amostras do ``FrameProfiler`` como barras
+    verticais; a linha amarela marca o orçamento de ``budget_ms`` por frame.
+    """
+
+    def __init__(self, budget_ms: float = 1000.0 / 60.0) -> None:
+        self.visible = False
+        self.budget_ms = budget_ms
+        self.font: pygame.font.Font | None = None
+
+    def toggle(self) -> None:
+        self.visible = not self.visible
+
+    def draw(self, surface: pygame.Surface, profiler: FrameProfiler) -> None:
+        if not self.visible:
+            return
+        if self.font is None:
+            pygame.font.init()
+            self.font = pygame.font.SysFont(None, 18)
+
+        lines = [("ms", "p50 / p99")]
+        for name in (FRAME_KEY, *PHASES):
+            lines.append(
+                (
+                    name,
+                    f"{profiler.percentile(50, name):.2f} / "
+                    f"{profiler.percentile(99, name):.2f}",
+                )
+            )
+
+        width = GRAPH_SIZE[0] + 16
+        height = len(lines) * 16 + GRAPH_SIZE[1] + 20
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill(PANEL_COLOR)
+        for i, (label, values) in enumerate(lines):
+            y = 6 + i * 16
+            panel.blit(self.font.render(label, True, TEXT_COLOR), (8, y))
+            panel.blit(self.font.render(values, True, TEXT_COLOR), (VALUE_COLUMN_X, y))
+
+        graph_top = len(lines) * 16 + 12
+        self._draw_graph(panel, profiler.series(FRAME_KEY), (8, graph_top))
+        surface.blit(panel, (surface.get_width() - width - 8, 8))
+
+    def _draw_graph(
+        self, panel: pygame.Surface, frame_times: list[float], origin: tuple[int, int]
+    ) -> None:
+        graph_width, graph_height = GRAPH_SIZE
+        left, top = origin
+        scale = graph_height / (self.budget_ms * 2)
+        recent = frame_times[-graph_width:]
+        start_x = left + graph_width - len(recent)
+        for i, value in enumerate(recent):
+            bar_height = min(graph_height, max(1, int(value * scale)))
+            color = SLOW_BAR_COLOR if value > self.budget_ms else BAR_COLOR
+            panel.fill(
+                color, (start_x + i, top + graph_height - bar_height, 1, bar_height)
+            )
+
+        budget_y = top + graph_height - int(self.budget_ms * scale)
+        pygame.draw.line(
+            panel, BUDGET_LINE_COLOR, (left, budget_y), (left + graph_width, budget_y)
+        )
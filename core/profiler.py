@@ -0,0 +1,165 @@
+"""Medição de tempo por fase do frame e da simulação."""
+
+from __future__ import annotations
+
+import csv
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+FRAME_KEY = "frame"
+
+
+class FrameProfiler:
+    """Acumula tempo gasto em seções nomeadas e guarda um histórico por frame.
+
+    ``section`` é um context manager barato; com ``enabled`` desligado ele não
+    mede nada. ``totals`` guarda segundos acumulados e ``calls`` quantas vezes
+    cada seção rodou desde o último ``reset``.
+
+    Entre ``begin_frame`` e ``end_frame`` os tempos de cada seção também são
+    somados em uma amostra do frame (em milissegundos), que vai para um ring
+    buffer de ``capacity`` posições. Fontes externas de contadores (como o
+    cache de texto) podem ser registradas com ``add_counter_source`` e entram
+    na mesma amostra.
+    """
+
+    def __init__(self, enabled: bool = True, capacity: int = 600) -> None:
+        self.enabled = enabled
+        self.capacity = capacity
+        self.totals: dict[str, float] = {}
+        self.calls: dict[str, int] = {}
+        self._samples: list[dict[str, float] | None] = [None] * capacity
+        self._head = 0
+        self._count = 0
+        self._current: dict[str, float] | None = None
+        self._frame_start = 0.0
+        self._counter_sources: dict[str, Callable[[], dict[str, float]]] = {}
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if self._current is not None:
+            self._current[name] = self._current.get(name, 0.0) + seconds * 1000.0
+
+    def reset(self) -> None:
+        self.totals.clear()
+        self.calls.clear()
+
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        self._current = {}
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        """Fecha a amostra do frame atual e a grava no ring buffer."""
+
+        if self._current is None:
+            return
+
+        sample = self._current
+        sample[FRAME_KEY] = (time.perf_counter() - self._frame_start) * 1000.0
+        for prefix, source in self._counter_sources.items():
+            for name, value in source().items():
+                sample[f"{prefix}.{name}"] = float(value)
+
+        self._samples[self._head] = sample
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self._current = None
+
+    def add_counter_source(
+        self, prefix: str, source: Callable[[], dict[str, float]]
+    ) -> None:
+        """Registra uma função cujos contadores são anexados a cada amostra."""
+
+        self._counter_sources[prefix] = source
+
+    def remove_counter_source(self, prefix: str) -> None:
+        """Remove uma fonte de contadores; ignora prefixos desconhecidos."""
+
+        self._counter_sources.pop(prefix, None)
+
+    def samples(self) -> list[dict[str, float]]:
+        """Amostras guardadas, da mais antiga para a mais recente."""
+
+        start = (self._head - self._count) % self.capacity
+        ordered = self._samples[start:] + self._samples[:start]
+        return [sample for sample in ordered if sample is not None]
+
+    def series(self, name: str = FRAME_KEY) -> list[float]:
+        return [sample.get(name, 0.0) for sample in self.samples()]
+
+    def percentile(self, percent: float, name: str = FRAME_KEY) -> float:
+        """Percentil (0-100) dos valores de ``name`` no buffer, por ranking."""
+
+        values = sorted(self.series(name))
+        if not values:
+            return 0.0
+        rank = round(percent / 100.0 * (len(values) - 1))
+        return values[max(0, min(len(values) - 1, rank))]
+
+    def columns(self) -> list[str]:
+        names: set[str] = set()
+        for sample in self.samples():
+            names.update(sample)
+        names.discard(FRAME_KEY)
+        return [FRAME_KEY, *sorted(names)]
+
+    def export_csv(self, path: str | Path) -> Path:
+        """Grava o buffer em CSV (uma linha por frame, tempos em ms)."""
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        columns = self.columns()
+        with path.open("w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["index", *columns])
+            for index, sample in enumerate(self.samples()):
+                writer.writerow(
+                    [index, *(f"{sample.get(name, 0.0):.4f}" for name in columns)]
+                )
+        return path
+
+    def export_json(self, path: str | Path) -> Path:
+        """Grava o buffer e um resumo de percentis em JSON.
+
+        ``units`` vale para os tempos das seções; as colunas listadas em
+        ``counters`` vêm de ``add_counter_source`` e são valores absolutos.
+        """
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        columns = self.columns()
+        prefixes = tuple(f"{prefix}." for prefix in self._counter_sources)
+        summary = {
+            name: {
+                "p50": self.percentile(50, name),
+                "p99": self.percentile(99, name),
+            }
+            for name in columns
+        }
+        payload = {
+            "units": "ms",
+            "counters": [name for name in columns if name.startswith(prefixes)],
+            "summary": summary,
+            "samples": self.samples(),
+        }
+        with path.open("w", encoding="utf-8") as file:
+            json.dump(payload, file, indent=2)
+        return path
@@ -0,0 +1,292 @@
+"""Gravação de input por tick em log binário e reprodução determinística.
+
+A simulação da ``GameScene`` depende só do estado inicial (mapa, spawns,
+classe e seed do loot) e do ``InputFrame`` de cada passo fixo. O
+``InputRecorder`` guarda esses dados e, a cada ``checkpoint_every`` ticks, um
+checksum do estado da cena; o ``ReplayInput`` devolve os mesmos frames, então
+uma cena montada com ``ReplayLog.build_scene`` repete a partida tick a tick e
+pode conferir os checksums.
+
+Layout (little-endian)::
+
+    cabeçalho   HEADER
+    metadados   JSON comprimido com zlib (parâmetros da cena)
+    input       RUN x run_count         (máscara de teclas, repetições)
+    checkpoints CHECKPOINT x checkpoint_count   (tick, checksum)
+    eventos     EVENT x event_count, cada um seguido do nome da classe
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from core.input import IDLE, InputFrame
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para type checkers
+    from core.game import Game
+    from scenes.game_scene import GameScene
+
+MAGIC = b"PRPL"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHIIIII")
+RUN = struct.Struct("<BH")
+CHECKPOINT = struct.Struct("<IQ")
+EVENT = struct.Struct("<IB")
+
+MAX_RUN = 0xFFFF
+CHECKPOINT_EVERY = 60
+BUTTONS = ("up", "down", "left", "right", "attack")
+
+
+class ReplayFormatError(ValueError):
+    """Log de replay inválido ou de versão desconhecida."""
+
+
+class ReplayMismatch(RuntimeError):
+    """O estado reproduzido divergiu do gravado em um checkpoint."""
+
+
+def pack_frame(frame: InputFrame) -> int:
+    return sum(1 << bit for bit, pressed in enumerate(frame) if pressed)
+
+
+def unpack_frame(mask: int) -> InputFrame:
+    return InputFrame(*(bool(mask >> bit & 1) for bit in range(len(BUTTONS))))
+
+
+class ReplayLog:
+    """Conteúdo de um replay: metadados da cena, input e checkpoints.
+
+    ``masks`` tem uma máscara de teclas por tick; ``class_changes`` lista
+    ``(tick, classe)`` para trocas de classe feitas no meio da partida.
+    """
+
+    def __init__(
+        self,
+        metadata: dict[str, Any],
+        masks: list[int] | None = None,
+        checkpoints: list[tuple[int, int]] | None = None,
+        class_changes: list[tuple[int, str]] | None = None,
+    ) -> None:
+        self.metadata = metadata
+        self.masks = masks if masks is not None else []
+        self.checkpoints = checkpoints if checkpoints is not None else []
+        self.class_changes = class_changes if class_changes is not None else []
+
+    @property
+    def ticks(self) -> int:
+        return len(self.masks)
+
+    def save(self, path: str | Path) -> int:
+        """Grava o log em ``path``; retorna o tamanho em bytes."""
+
+        runs: list[tuple[int, int]] = []
+        for mask in self.masks:
+            if runs and runs[-1][0] == mask and runs[-1][1] < MAX_RUN:
+                runs[-1] = (mask, runs[-1][1] + 1)
+            else:
+                runs.append((mask, 1))
+
+        metadata = zlib.compress(json.dumps(self.metadata).encode("utf-8"), 9)
+        parts = [
+            HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                len(self.masks),
+                len(runs),
+                len(self.checkpoints),
+                len(self.class_changes),
+                len(metadata),
+            ),
+            metadata,
+        ]
+        parts.extend(RUN.pack(mask, count) for mask, count in runs)
+        parts.extend(CHECKPOINT.pack(tick, value) for tick, value in self.checkpoints)
+        for tick, name in self.class_changes:
+            encoded = name.encode("utf-8")
+            parts.append(EVENT.pack(tick, len(encoded)) + encoded)
+
+        data = b"".join(parts)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return len(data)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ReplayLog":
+        data = Path(path).read_bytes()
+        if len(data) < HEADER.size:
+            raise ReplayFormatError(f"{path}: arquivo truncado")
+        magic, version, ticks, run_count, checkpoint_count, event_count, meta_size = (
+            HEADER.unpack_from(data)
+        )
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ReplayFormatError(f"{path}: formato ou versão desconhecidos")
+
+        offset = HEADER.size
+        try:
+            metadata = json.loads(zlib.decompress(data[offset : offset + meta_size]))
+            offset += meta_size
+
+            masks: list[int] = []
+            for mask, count in RUN.iter_unpack(
+                data[offset : offset + run_count * RUN.size]
+            ):
+                masks.extend([mask] * count)
+            offset += run_count * RUN.size
+
+            checkpoints = list(
+                CHECKPOINT.iter_unpack(
+                    data[offset : offset + checkpoint_count * CHECKPOINT.size]
+                )
+            )
+            offset += checkpoint_count * CHECKPOINT.size
+
+            class_changes = []
+            for _ in range(event_count):
+                tick, size = EVENT.unpack_from(data, offset)
+                offset += EVENT.size
+                class_changes.append((tick, data[offset : offset + size].decode("utf-8")))
+                offset += size
+        except (zlib.error, struct.error, ValueError) as error:
+            raise ReplayFormatError(f"{path}: conteúdo inválido ({error})") from error
+
+        if len(masks) != ticks:
+            raise ReplayFormatError(f"{path}: esperados {ticks} ticks, lidos {len(masks)}")
+        return cls(metadata, masks, checkpoints, class_changes)
+
+    def build_scene(self, game: "Game") -> "GameScene":
+        """Monta a cena no estado inicial gravado, lendo input do replay."""
+
+        from scenes.game_scene import GameScene
+
+        meta = self.metadata
+        return GameScene(
+            game,
+            use_swarm=meta["use_swarm"],
+            tilemap=meta.get("tilemap"),
+            enemy_spawns=[tuple(spawn) for spawn in meta["enemy_spawns"]],
+            input_source=ReplayInput(self.masks),
+            map_path=meta.get("map_path"),
+            streaming=meta["streaming"],
+            ai_lod=meta["ai_lod"],
+            seed=meta["seed"],
+            player_class=meta["player_class"],
+        )
+
+
+class InputRecorder:
+    """Grava o input efetivo de cada tick de uma ``GameScene``.
+
+    A cena chama ``start`` ao ser criada com ``recorder=...``, ``record`` ao
+    fim de cada passo e ``finish`` ao sair; ``path`` recebe o log ao final. Grava
+    uma cena por vez: reiniciar a cena encerra a gravação.
+    """
+
+    def __init__(
+        self, path: str | Path | None = None, checkpoint_every: int = CHECKPOINT_EVERY
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.checkpoint_every = checkpoint_every
+        self.log: ReplayLog | None = None
+        self._scene: "GameScene | None" = None
+
+    @property
+    def recording(self) -> bool:
+        return self._scene is not None
+
+    def start(self, scene: "GameScene") -> None:
+        if self.recording:
+            raise RuntimeError("o gravador já está em uso por outra cena")
+
+        self._scene = scene
+        metadata: dict[str, Any] = {
+            "sim_hz": scene.game.sim_hz,
+            "seed": scene.loot_seed,
+            "player_class": scene.selected_class,
+            "use_swarm": scene.use_swarm,
+            "streaming": scene.streaming,
+            "ai_lod": scene.ai_lod is not None,
+            "map_path": str(scene.map_path) if scene.map_path is not None else None,
+            "enemy_spawns": [list(spawn) for spawn in scene.enemy_spawns],
+        }
+        if scene.map_path is None and not scene.uses_default_map:
+            metadata["tilemap"] = [list(row) for row in scene.tilemap]
+        self.log = ReplayLog(metadata)
+
+    def record(self, frame: InputFrame) -> None:
+        """Registra o input de um tick já simulado e, se for a vez, um checkpoint."""
+
+        if self.log is None or self._scene is None:
+            return
+        self.log.masks.append(pack_frame(frame))
+        tick = self.log.ticks
+        if self.checkpoint_every and tick % self.checkpoint_every == 0:
+            self.log.checkpoints.append((tick, self._scene.state_checksum()))
+
+    def record_class_change(self, class_name: str) -> None:
+        if self.log is not None:
+            self.log.class_changes.append((self.log.ticks, class_name))
+
+    def finish(self) -> ReplayLog | None:
+        """Encerra a gravação e grava o log em ``path``, se houver."""
+
+        log = self.log
+        self._scene = None
+        if log is not None and self.path is not None:
+            log.save(self.path)
+        return log
+
+
+class ReplayInput:
+    """Fonte de input que devolve os frames gravados, um por tick."""
+
+    def __init__(self, masks: list[int]) -> None:
+        self.masks = masks
+        self.tick = 0
+
+    def poll(self) -> InputFrame:
+        index = self.tick
+        self.tick += 1
+        if index < len(self.masks):
+            return unpack_frame(self.masks[index])
+        return IDLE
+
+
+def play(
+    log: ReplayLog, game: "Game", verify: bool = True, render: bool = False
+) -> "GameScene":
+    """Reproduz ``log`` headless o mais rápido possível.
+
+    Com ``verify`` compara o checksum da cena em cada checkpoint e levanta
+    ``ReplayMismatch`` na primeira divergência.
+    """
+
+    if game.sim_hz != log.metadata["sim_hz"]:
+        raise ValueError(
+            f"replay gravado a {log.metadata['sim_hz']} Hz, jogo a {game.sim_hz} Hz"
+        )
+
+    scene = log.build_scene(game)
+    game.running = True
+    game.set_scene(scene)
+    checkpoints = dict(log.checkpoints) if verify else {}
+    changes = sorted(log.class_changes)
+    next_change = 0
+
+    for tick in range(log.ticks):
+        while next_change < len(changes) and changes[next_change][0] == tick:
+            scene._set_player_class(changes[next_change][1])
+            next_change += 1
+        game.run_headless(1, render=render)
+        expected = checkpoints.get(tick + 1)
+        if expected is not None and scene.state_checksum() != expected:
+            raise ReplayMismatch(
+                f"checksum divergente no tick {tick + 1}: "
+                f"{scene.state_checksum():016x} != {expected:016x}"
+            )
+    return scene
@@ -0,0 +1,184 @@
+"""Cache de recursos do processo: fontes, configs, mapas e superfícies por chave."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Hashable, TypeVar
+
+import pygame
+
+from core.map_format import CompiledMap, load_map
+
+T = TypeVar("T")
+
+
+class ResourceManager:
+    """Carrega cada recurso uma única vez e o entrega por chave.
+
+    ``get`` é o ponto de extensão genérico: na primeira consulta de uma chave o
+    ``loader`` roda e o resultado fica guardado; as próximas consultas não
+    tocam no disco. ``font``, ``json``, ``compiled_map`` e ``image`` são atalhos
+    com chaves padronizadas. Os valores são compartilhados entre cenas e não
+    devem ser alterados por quem os recebe.
+
+    ``invalidate`` e ``invalidate_path`` descartam entradas explicitamente.
+    Com ``hot_reload``, ``poll`` compara a data de modificação dos arquivos de
+    origem (no máximo a cada ``poll_interval`` segundos) e descarta as entradas
+    cujos arquivos mudaram; a próxima consulta carrega a versão nova.
+
+    ``get`` pode ser chamado pelo ``BackgroundLoader`` em outra thread; as
+    tabelas internas só são alteradas ou percorridas sob ``_lock``. O
+    ``loader`` em si roda fora do lock.
+    """
+
+    def __init__(self, hot_reload: bool = False, poll_interval: float = 0.5) -> None:
+        self.hot_reload = hot_reload
+        self.poll_interval = poll_interval
+        self._entries: dict[Hashable, Any] = {}
+        self._sources: dict[Hashable, tuple[Path, float]] = {}
+        self._lock = threading.Lock()
+        self._next_poll = 0.0
+        self.hits = 0
+        self.loads = 0
+        self.reloads = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, key: Hashable, loader: Callable[[], T], source: str | Path | None = None
+    ) -> T:
+        """Retorna o recurso ``key``, carregando-o com ``loader`` se necessário.
+
+        ``source`` é o arquivo de origem, vigiado por ``poll`` e usado por
+        ``invalidate_path``.
+        """
+
+        try:
+            value = self._entries[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return value
+
+        value = loader()
+        if source is not None:
+            path = Path(source).resolve()
+            watched = (path, _mtime(path))
+        with self._lock:
+            self._entries[key] = value
+            self.loads += 1
+            if source is not None:
+                self._sources[key] = watched
+        return value
+
+    def font(self, size: int, name: str | None = None) -> pygame.font.Font:
+        """``SysFont`` compartilhada; procurar fontes do sistema é lento.
+
+        O módulo de fontes é inicializado na primeira fonte pedida, já que o
+        ``Game`` não o inicializa na partida.
+        """
+
+        def load() -> pygame.font.Font:
+            pygame.font.init()
+            return pygame.font.SysFont(name, size)
+
+        return self.get(("font", name, size), load)
+
+    def json(self, path: str | Path) -> Any:
+        path = Path(path).resolve()
+
+        def load() -> Any:
+            with path.open(encoding="utf-8") as file:
+                return json.load(file)
+
+        return self.get(("json", path), load, path)
+
+    def compiled_map(self, path: str | Path) -> CompiledMap:
+        path = Path(path).resolve()
+        return self.get(("map", path), lambda: load_map(path), path)
+
+    def image(self, path: str | Path, alpha: bool = True) -> pygame.Surface:
+        """Imagem do disco, convertida para o formato da tela quando houver janela."""
+
+        path = Path(path).resolve()
+
+        def load() -> pygame.Surface:
+            surface = pygame.image.load(path)
+            if pygame.display.get_surface() is None:
+                return surface
+            return surface.convert_alpha() if alpha else surface.convert()
+
+        return self.get(("image", path, alpha), load, path)
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Descarta ``key``; retorna se havia algo guardado."""
+
+        with self._lock:
+            return self._discard(key)
+
+    def invalidate_path(self, path: str | Path) -> list[Hashable]:
+        """Descarta todas as entradas carregadas a partir de ``path``."""
+
+        path = Path(path).resolve()
+        with self._lock:
+            keys = [key for key, (source, _) in self._sources.items() if source == path]
+            for key in keys:
+                self._discard(key)
+        return keys
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sources.clear()
+
+    def poll(self) -> list[Hashable]:
+        """Com ``hot_reload``, descarta entradas cujos arquivos mudaram no disco."""
+
+        now = time.monotonic()
+        if not self.hot_reload or now < self._next_poll:
+            return []
+        self._next_poll = now + self.poll_interval
+
+        # ``stat`` roda sobre uma cópia, sem segurar o lock durante o I/O.
+        with self._lock:
+            sources = list(self._sources.items())
+        changed = [key for key, (path, mtime) in sources if _mtime(path) != mtime]
+        with self._lock:
+            for key in changed:
+                self._discard(key)
+            self.reloads += len(changed)
+        return changed
+
+    def stats(self) -> dict[str, float]:
+        """Contadores acumulados, no formato aceito pelo ``FrameProfiler``."""
+
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "loads": self.loads,
+            "reloads": self.reloads,
+        }
+
+    def _discard(self, key: Hashable) -> bool:
+        """``invalidate`` sem o lock; quem chama já o segura."""
+
+        self._sources.pop(key, None)
+        if key not in self._entries:
+            return False
+        del self._entries[key]
+        return True
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return -1.0
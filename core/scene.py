@@ -10,11 +10,30 @@ class Scene:
     def enter(self) -> None:
         """Chamado quando a cena é ativada."""
 
+    def exit(self) -> None:
+        """Chamado quando a cena é substituída; libera recursos da cena."""
+
     def handle_event(self, event: pygame.event.Event) -> None:
         """Processa eventos de input da cena."""
 
     def update(self, delta_time: float) -> None:
-        """Atualiza lógica da cena."""
+        """Atualiza lógica da cena em um passo fixo de ``delta_time`` segundos."""
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> None:
+        """Desenha a cena na superfície alvo.
+
+        ``alpha`` (0 a 1) indica quanto do próximo passo de simulação já passou,
+        permitindo interpolar entre o estado anterior e o atual.
+        """
+
+    def draw_dirty(
+        self, surface: pygame.Surface, alpha: float = 1.0, full: bool = False
+    ) -> "list[pygame.Rect] | None":
+        """Desenha só o que mudou; retorna as áreas alteradas da tela.
+
+        ``None`` indica que a tela inteira foi redesenhada. ``full`` pede um
+        redesenho completo. A implementação padrão sempre redesenha tudo.
+        """
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """Desenha a cena na superfície alvo."""
+        self.draw(surface, alpha)
+        return None
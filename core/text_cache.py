@@ -0,0 +1,64 @@
+"""Cache LRU de superfícies de texto já rasterizadas."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+Color = tuple[int, int, int]
+TextKey = tuple[pygame.font.Font, str, Color, bool]
+
+
+class TextCache:
+    """Reaproveita o resultado de ``font.render`` para textos repetidos.
+
+    A chave é ``(font, texto, cor, antialias)``; ao passar de ``capacity``
+    entradas a menos usada recentemente é descartada. Assim linhas de HUD só
+    são rasterizadas de novo quando o valor exibido muda.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        self.capacity = capacity
+        self._entries: OrderedDict[TextKey, pygame.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def render(
+        self, font: pygame.font.Font, text: str, antialias: bool, color: Color
+    ) -> pygame.Surface:
+        """Mesma assinatura de ``Font.render``, mas consultando o cache antes."""
+
+        key = (font, text, tuple(color), antialias)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._entries[key] = surface
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Contadores acumulados, no formato aceito pelo ``FrameProfiler``."""
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
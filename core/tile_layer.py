@@ -0,0 +1,180 @@
+"""Camada estática do mapa pré-renderizada em blocos (chunks) de tiles."""
+
+from __future__ import annotations
+
+from typing import MutableSequence, Sequence
+
+import pygame
+
+from core.camera import Camera
+
+Color = tuple[int, int, int]
+
+
+class ChunkedTileLayer:
+    """Renderiza o tilemap uma única vez em superfícies de ``chunk_tiles``².
+
+    A cada frame apenas os chunks que intersectam a área visível da câmera são
+    copiados para a tela, então o custo de desenho depende do tamanho da tela e
+    não do tamanho do mapa. Chunks só são refeitos quando algum tile muda.
+    """
+
+    def __init__(
+        self,
+        tilemap: Sequence[MutableSequence[int]],
+        tile_size: int,
+        palette: dict[int, Color],
+        default_color: Color,
+        chunk_tiles: int = 16,
+    ) -> None:
+        self.tilemap = tilemap
+        self.tile_size = tile_size
+        self.palette = palette
+        self.default_color = default_color
+        self.chunk_tiles = chunk_tiles
+        self.chunk_pixels = chunk_tiles * tile_size
+        self.rows = len(tilemap)
+        self.columns = max((len(row) for row in tilemap), default=0)
+        self.chunks_x = -(-self.columns // chunk_tiles)
+        self.chunks_y = -(-self.rows // chunk_tiles)
+        self._chunks: dict[tuple[int, int], pygame.Surface] = {}
+        self._dirty: set[tuple[int, int]] = set()
+        self.chunks_drawn = 0
+        self.chunks_baked = 0
+        # Incrementada sempre que algum chunk muda; redesenhos parciais comparam.
+        self.revision = 0
+
+    def set_tile(self, x: int, y: int, value: int) -> None:
+        """Altera um tile do mapa e marca o chunk correspondente para refazer."""
+
+        if self.tilemap[y][x] == value:
+            return
+        self.tilemap[y][x] = value
+        self.invalidate_tile(x, y)
+
+    def invalidate_tile(self, x: int, y: int) -> None:
+        """Marca o chunk do tile ``(x, y)`` como desatualizado."""
+
+        key = (x // self.chunk_tiles, y // self.chunk_tiles)
+        if key in self._chunks:
+            self._dirty.add(key)
+            self.revision += 1
+
+    def invalidate_all(self) -> None:
+        """Descarta todos os chunks; serão refeitos sob demanda."""
+
+        self._chunks.clear()
+        self._dirty.clear()
+        self.revision += 1
+
+    def prepare_chunk(self, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        """Desenha um chunk em uma superfície nova sem registrá-lo.
+
+        Não toca no estado da camada nem no display, então pode rodar em uma
+        thread de carregamento: a superfície sai no formato padrão e
+        ``adopt_chunk`` a converte para o formato da tela na thread principal.
+        """
+
+        return self._paint_chunk(chunk_x, chunk_y, None, convert=False)
+
+    def adopt_chunk(self, chunk_x: int, chunk_y: int, chunk: pygame.Surface) -> None:
+        """Registra um chunk preparado fora do laço de desenho.
+
+        Deve ser chamado na thread principal: é aqui que a superfície é
+        convertida para o formato da tela.
+        """
+
+        key = (chunk_x, chunk_y)
+        self._chunks[key] = _display_format(chunk)
+        self._dirty.discard(key)
+        self.chunks_baked += 1
+        self.revision += 1
+
+    def drop_chunk(self, chunk_x: int, chunk_y: int) -> None:
+        """Libera a superfície de um chunk; ele é refeito se voltar à tela."""
+
+        key = (chunk_x, chunk_y)
+        self._chunks.pop(key, None)
+        self._dirty.discard(key)
+        self.revision += 1
+
+    def draw(self, surface: pygame.Surface, camera: Camera) -> None:
+        """Copia para ``surface`` os chunks visíveis pela câmera."""
+
+        view = camera.visible_rect()
+        size = self.chunk_pixels
+        first_x = max(0, view.left // size)
+        last_x = min(self.chunks_x - 1, (view.right - 1) // size)
+        first_y = max(0, view.top // size)
+        last_y = min(self.chunks_y - 1, (view.bottom - 1) // size)
+
+        blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                chunk = self._get_chunk(chunk_x, chunk_y)
+                blits.append(
+                    (chunk, (chunk_x * size - view.left, chunk_y * size - view.top))
+                )
+
+        if blits:
+            surface.blits(blits, doreturn=False)
+        self.chunks_drawn = len(blits)
+
+    def _get_chunk(self, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        key = (chunk_x, chunk_y)
+        chunk = self._chunks.get(key)
+        if chunk is None or key in self._dirty:
+            chunk = self._bake_chunk(chunk_x, chunk_y, chunk)
+            self._chunks[key] = chunk
+            self._dirty.discard(key)
+        return chunk
+
+    def _bake_chunk(
+        self, chunk_x: int, chunk_y: int, reuse: pygame.Surface | None
+    ) -> pygame.Surface:
+        """Desenha os tiles de um chunk em uma superfície própria."""
+
+        chunk = self._paint_chunk(chunk_x, chunk_y, reuse)
+        self.chunks_baked += 1
+        return chunk
+
+    def _paint_chunk(
+        self,
+        chunk_x: int,
+        chunk_y: int,
+        reuse: pygame.Surface | None,
+        convert: bool = True,
+    ) -> pygame.Surface:
+        first_col = chunk_x * self.chunk_tiles
+        first_row = chunk_y * self.chunk_tiles
+        last_col = min(self.columns, first_col + self.chunk_tiles)
+        last_row = min(self.rows, first_row + self.chunk_tiles)
+        tile = self.tile_size
+
+        chunk = reuse
+        if chunk is None:
+            chunk = pygame.Surface(
+                ((last_col - first_col) * tile, (last_row - first_row) * tile)
+            )
+            if convert:
+                chunk = _display_format(chunk)
+
+        chunk.fill(self.default_color)
+        for y in range(first_row, last_row):
+            row = self.tilemap[y]
+            for x in range(first_col, min(last_col, len(row))):
+                color = self.palette.get(row[x], self.default_color)
+                if color != self.default_color:
+                    chunk.fill(
+                        color,
+                        ((x - first_col) * tile, (y - first_row) * tile, tile, tile),
+                    )
+        return chunk
+
+
+def _display_format(surface: pygame.Surface) -> pygame.Surface:
+    """Converte para o formato da tela quando houver janela (só na thread principal)."""
+
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert()
@@ -1,21 +1,65 @@
 """Entidade simples de inimigo com IA de perseguição."""
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
 import pygame
 
-from systems.collision import move_with_collisions
+from core.camera import lerp_rect_ip
+from systems.collision import Colliders, move_with_collisions_ip
 
 if TYPE_CHECKING:  # pragma: no cover - apenas para type checkers
+    from core.atlas import RenderQueue, TextureAtlas
+    from core.camera import Camera
     from entities.player import Player
+    from systems.flow_field import FlowField
 
 ENEMY_COLOR = (200, 90, 90)
 ENEMY_DEAD_COLOR = (80, 60, 60)
+HEALTH_BAR_BACKGROUND = (25, 20, 20)
+HEALTH_BAR_COLOR = (150, 220, 120)
+HEALTH_BAR_HEIGHT = 6
+HEALTH_BAR_GAP = 2
+
+# Retângulos de rascunho reaproveitados pelo desenho (só na thread principal).
+_SCREEN_RECT = pygame.Rect(0, 0, 0, 0)
+_BAR_RECT = pygame.Rect(0, 0, 0, 0)
+
+
+def _bake_body(width: int, height: int, alive: bool) -> pygame.Surface:
+    sprite = pygame.Surface((width, height))
+    sprite.fill(ENEMY_COLOR if alive else ENEMY_DEAD_COLOR)
+    return sprite
+
+
+def _bake_health_bar(width: int, filled: int) -> pygame.Surface:
+    sprite = pygame.Surface((width, HEALTH_BAR_HEIGHT))
+    sprite.fill(HEALTH_BAR_BACKGROUND)
+    if filled > 0:
+        sprite.fill(HEALTH_BAR_COLOR, (0, 0, filled, HEALTH_BAR_HEIGHT))
+    return sprite
 
 
 class Enemy:
-    """Inimigo básico que busca o player e pode morrer ao receber dano."""
+    """Inimigo básico que busca o player e pode morrer ao receber dano.
+
+    Usa ``__slots__`` e atualiza o próprio ``rect`` no lugar, para que
+    milhares de inimigos não gerem objetos temporários a cada tick.
+    """
+
+    __slots__ = (
+        "pool_slot",
+        "rect",
+        "previous_topleft",
+        "speed",
+        "max_health",
+        "health",
+        "alive",
+        "contact_damage",
+        "hit_cooldown",
+        "hit_timer",
+    )
 
     def __init__(
         self,
@@ -26,8 +70,24 @@ class Enemy:
         contact_damage: float = 10.0,
         hit_cooldown: float = 0.6,
     ) -> None:
+        self.pool_slot = -1
         self.rect = pygame.Rect(0, 0, size, size)
+        self.reset(spawn_pos, size, speed, health, contact_damage, hit_cooldown)
+
+    def reset(
+        self,
+        spawn_pos: tuple[int, int],
+        size: int = 28,
+        speed: float = 140.0,
+        health: int = 30,
+        contact_damage: float = 10.0,
+        hit_cooldown: float = 0.6,
+    ) -> None:
+        """(Re)inicializa o inimigo; usado pelo ``EntityPool`` ao reaproveitá-lo."""
+
+        self.rect.update(0, 0, size, size)
         self.rect.center = spawn_pos
+        self.previous_topleft = self.rect.topleft
         self.speed = speed
         self.max_health = health
         self.health = float(health)
@@ -40,22 +100,39 @@ class Enemy:
         self,
         delta_time: float,
         player_center: tuple[float, float],
-        colliders: list[pygame.Rect],
+        colliders: Colliders,
+        flow_field: "FlowField | None" = None,
     ) -> None:
-        """Move em direção ao player enquanto estiver vivo."""
+        """Move em direção ao player enquanto estiver vivo.
+
+        Com um ``flow_field`` o inimigo segue o próximo tile do caminho até o
+        player em vez de andar em linha reta contra as paredes.
+        """
 
         self._update_timers(delta_time)
 
         if not self.alive:
             return
 
-        direction = pygame.Vector2(player_center) - pygame.Vector2(self.rect.center)
-        if direction.length_squared() == 0:
+        rect = self.rect
+        target = player_center
+        if flow_field is not None:
+            target = flow_field.waypoint(rect.center) or player_center
+
+        # Mesma conta de Vector2.normalize() * speed * dt, sem criar vetores.
+        dx = target[0] - rect.centerx
+        dy = target[1] - rect.centery
+        if dx == 0 and dy == 0:
             return
 
-        direction = direction.normalize()
-        movement = direction * self.speed * delta_time
-        self.rect = move_with_collisions(self.rect, movement, colliders)
+        length = math.sqrt(dx * dx + dy * dy)
+        speed = self.speed
+        move_with_collisions_ip(
+            rect,
+            dx / length * speed * delta_time,
+            dy / length * speed * delta_time,
+            colliders,
+        )
 
     def try_hit(self, player: "Player") -> bool:
         """Tenta aplicar dano de contato respeitando cooldown e i-frames."""
@@ -82,26 +159,80 @@ class Enemy:
         if self.health == 0:
             self.alive = False
 
-    def draw(self, surface: pygame.Surface, camera_apply) -> None:
-        """Desenha o inimigo com barra de vida simples."""
+    def draw(self, surface: pygame.Surface, camera: "Camera", alpha: float = 1.0) -> None:
+        """Desenha o inimigo com barra de vida simples.
 
-        screen_rect = camera_apply(self.rect)
+        ``alpha`` interpola a posição entre ``previous_topleft`` e a atual.
+        """
+
+        screen_rect = _SCREEN_RECT
+        screen_rect.update(self.rect)
+        lerp_rect_ip(screen_rect, self.previous_topleft, alpha)
+        camera.apply_ip(screen_rect)
         color = ENEMY_COLOR if self.alive else ENEMY_DEAD_COLOR
         pygame.draw.rect(surface, color, screen_rect)
 
         # Barra de vida acima da cabeça
         bar_width = screen_rect.width
-        bar_height = 6
-        bar_x = screen_rect.left
-        bar_y = screen_rect.top - bar_height - 2
-        outline_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-        pygame.draw.rect(surface, (25, 20, 20), outline_rect)
+        bar_rect = _BAR_RECT
+        bar_rect.update(
+            screen_rect.left,
+            screen_rect.top - HEALTH_BAR_HEIGHT - HEALTH_BAR_GAP,
+            bar_width,
+            HEALTH_BAR_HEIGHT,
+        )
+        pygame.draw.rect(surface, HEALTH_BAR_BACKGROUND, bar_rect)
 
         if self.max_health > 0:
             health_ratio = self.health / self.max_health
-            inner_width = int(bar_width * health_ratio)
-            inner_rect = pygame.Rect(bar_x, bar_y, inner_width, bar_height)
-            pygame.draw.rect(surface, (150, 220, 120), inner_rect)
+            bar_rect.width = int(bar_width * health_ratio)
+            pygame.draw.rect(surface, HEALTH_BAR_COLOR, bar_rect)
+
+    def queue_draw(
+        self,
+        queue: "RenderQueue",
+        atlas: "TextureAtlas",
+        camera: "Camera",
+        alpha: float = 1.0,
+    ) -> None:
+        """Mesmo resultado de ``draw``, mas com sprites do atlas enfileirados.
+
+        O corpo e a barra de vida (um quadro por largura preenchida) são
+        assados no atlas na primeira vez que aparecem.
+        """
+
+        screen_rect = _SCREEN_RECT
+        screen_rect.update(self.rect)
+        lerp_rect_ip(screen_rect, self.previous_topleft, alpha)
+        camera.apply_ip(screen_rect)
+        width, height = screen_rect.size
+        alive = self.alive
+
+        key = ("enemy", width, height, alive)
+        body = atlas.region(key)
+        if body is None:
+            body = atlas.add(key, _bake_body(width, height, alive))
+        queue.add(body, screen_rect.topleft)
+
+        filled = 0
+        if self.max_health > 0:
+            filled = min(width, int(width * (self.health / self.max_health)))
+        key = ("health_bar", width, filled)
+        bar = atlas.region(key)
+        if bar is None:
+            bar = atlas.add(key, _bake_health_bar(width, filled))
+        bar_top = screen_rect.top - HEALTH_BAR_HEIGHT - HEALTH_BAR_GAP
+        queue.add(bar, (screen_rect.left, bar_top))
+
+    def screen_bounds(self, camera: "Camera", alpha: float = 1.0) -> pygame.Rect:
+        """Área da tela coberta por ``draw`` (corpo e barra de vida)."""
+
+        bounds = self.rect.copy()
+        lerp_rect_ip(bounds, self.previous_topleft, alpha)
+        camera.apply_ip(bounds)
+        bounds.top -= HEALTH_BAR_HEIGHT + HEALTH_BAR_GAP
+        bounds.height += HEALTH_BAR_HEIGHT + HEALTH_BAR_GAP
+        return bounds
 
     def _update_timers(self, delta_time: float) -> None:
         """Avança temporizadores internos relacionados ao ataque."""
@@ -1,26 +1,68 @@
 """Itens simples que podem ser coletados após derrotar inimigos."""
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pygame
 
+from core.dirty_rects import draw_frame
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para type checkers
+    from core.atlas import RenderQueue, TextureAtlas
+    from core.camera import Camera
+
 COIN_COLOR = (230, 210, 80)
 ITEM_COLOR = (120, 200, 220)
 OUTLINE_COLOR = (25, 20, 20)
 
+_SCREEN_RECT = pygame.Rect(0, 0, 0, 0)
+
+
+def _bake_sprite(kind: str, size: tuple[int, int]) -> pygame.Surface:
+    sprite = pygame.Surface(size)
+    sprite.fill(COIN_COLOR if kind == "coin" else ITEM_COLOR)
+    draw_frame(sprite, OUTLINE_COLOR, sprite.get_rect(), 2)
+    return sprite
+
 
 class LootPickup:
     """Pequeno item estático que o player pode coletar."""
 
+    __slots__ = ("pool_slot", "kind", "rect")
+
     def __init__(self, position: tuple[int, int], kind: str) -> None:
+        self.pool_slot = -1
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(position, kind)
+
+    def reset(self, position: tuple[int, int], kind: str) -> None:
+        """(Re)inicializa o item; usado pelo ``EntityPool`` ao reaproveitá-lo."""
+
         self.kind = kind
         size = 18 if kind == "coin" else 22
-        self.rect = pygame.Rect(0, 0, size, size)
+        self.rect.update(0, 0, size, size)
         self.rect.center = position
 
-    def draw(self, surface: pygame.Surface, camera_apply) -> None:
+    def draw(self, surface: pygame.Surface, camera: "Camera") -> None:
         """Desenha o item no chão com uma borda simples."""
 
-        screen_rect = camera_apply(self.rect)
+        screen_rect = _SCREEN_RECT
+        screen_rect.update(self.rect)
+        camera.apply_ip(screen_rect)
         color = COIN_COLOR if self.kind == "coin" else ITEM_COLOR
         pygame.draw.rect(surface, color, screen_rect)
-        pygame.draw.rect(surface, OUTLINE_COLOR, screen_rect, width=2)
+        draw_frame(surface, OUTLINE_COLOR, screen_rect, 2)
+
+    def queue_draw(
+        self, queue: "RenderQueue", atlas: "TextureAtlas", camera: "Camera"
+    ) -> None:
+        """Mesmo resultado de ``draw``, com o sprite do atlas enfileirado."""
+
+        screen_rect = _SCREEN_RECT
+        screen_rect.update(self.rect)
+        camera.apply_ip(screen_rect)
+        key = ("pickup", self.kind, screen_rect.width, screen_rect.height)
+        sprite = atlas.region(key)
+        if sprite is None:
+            sprite = atlas.add(key, _bake_sprite(self.kind, screen_rect.size))
+        queue.add(sprite, screen_rect.topleft)
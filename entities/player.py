@@ -2,13 +2,46 @@
 
 from __future__ import annotations
 
+import math
+from typing import TYPE_CHECKING, Iterable
+
 import pygame
 
-from systems.collision import move_with_collisions
+from systems.collision import Colliders, move_with_collisions_ip
+from systems.spatial_hash import SpatialHash
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para type checkers
+    from entities.enemy import Enemy
 
 
 class Player:
-    """Representa o jogador com estado próprio e ações básicas."""
+    """Representa o jogador com estado próprio e ações básicas.
+
+    ``rect``, ``vel`` e ``facing_direction`` são atualizados no lugar pelo
+    movimento; copie-os se precisar guardar um valor antigo.
+    """
+
+    __slots__ = (
+        "rect",
+        "previous_topleft",
+        "vel",
+        "speed",
+        "max_hp",
+        "hp",
+        "max_mana",
+        "mana",
+        "alive",
+        "invulnerability_duration",
+        "invulnerability_timer",
+        "facing_direction",
+        "skill",
+        "attack_cooldown",
+        "attack_duration",
+        "attack_timer",
+        "attack_range",
+        "attack_damage",
+        "last_attack_rect",
+    )
 
     def __init__(
         self,
@@ -22,6 +55,7 @@ class Player:
     ) -> None:
         self.rect = pygame.Rect(0, 0, size, size)
         self.rect.center = spawn_pos
+        self.previous_topleft = self.rect.topleft
         self.vel = pygame.Vector2()
         self.speed = speed
         self.max_hp = max_hp
@@ -42,25 +76,28 @@ class Player:
         self.last_attack_rect: pygame.Rect | None = None
 
     def move(
-        self, direction: pygame.Vector2, delta_time: float, colliders: list[pygame.Rect]
+        self, direction: pygame.Vector2, delta_time: float, colliders: Colliders
     ) -> None:
         """Atualiza a posição com colisão e mantém direção/física básica."""
 
         if direction.length_squared() > 0:
-            direction = direction.normalize()
-            self.facing_direction = direction
-
-        movement = direction * self.speed * delta_time
-        self.vel = movement
-        self.rect = move_with_collisions(self.rect, movement, colliders)
+            facing = self.facing_direction
+            facing.update(direction)
+            facing.normalize_ip()
+            self.vel.update(
+                facing.x * self.speed * delta_time, facing.y * self.speed * delta_time
+            )
+        else:
+            self.vel.update(0, 0)
+        move_with_collisions_ip(self.rect, self.vel.x, self.vel.y, colliders)
 
     def update(
-        self, direction: pygame.Vector2, delta_time: float, colliders: list[pygame.Rect]
+        self, direction: pygame.Vector2, delta_time: float, colliders: Colliders
     ) -> None:
         """Move o jogador e avança temporizadores em um único passo."""
 
         if not self.alive:
-            self.vel = pygame.Vector2()
+            self.vel.update(0, 0)
             self.update_timers(delta_time)
             return
 
@@ -107,9 +144,13 @@ class Player:
         return int(self.invulnerability_timer / flash_interval) % 2 == 0
 
     def attack(
-        self, enemies: list["Enemy"], colliders: list[pygame.Rect]
+        self, enemies: Iterable["Enemy"] | SpatialHash["Enemy"], colliders: Colliders
     ) -> tuple[pygame.Rect, list["Enemy"]] | None:
-        """Realiza o ataque na direção atual e aplica dano nos inimigos."""
+        """Realiza o ataque na direção atual e aplica dano nos inimigos.
+
+        Com um ``SpatialHash`` apenas os inimigos nas células do golpe são
+        testados, e o índice é atualizado após o knockback de cada um.
+        """
 
         if self.attack_cooldown > 0:
             return None
@@ -119,30 +160,44 @@ class Player:
         self.attack_cooldown = 0.45
         self.attack_timer = self.attack_duration
 
+        index = enemies if isinstance(enemies, SpatialHash) else None
+        candidates = index.query_rect(attack_rect) if index is not None else list(enemies)
+
         defeated: list["Enemy"] = []
-        for enemy in list(enemies):
+        for enemy in candidates:
             if not attack_rect.colliderect(enemy.rect):
                 continue
 
             alive_before = enemy.alive
             enemy.take_damage(self.attack_damage)
             self._push_enemy(enemy, colliders)
+            if index is not None:
+                index.update(enemy, enemy.rect)
 
             if alive_before and not enemy.alive:
                 defeated.append(enemy)
 
         return attack_rect, defeated
 
-    def _push_enemy(self, enemy: "Enemy", colliders: list[pygame.Rect]) -> None:
+    def _push_enemy(self, enemy: "Enemy", colliders: Colliders) -> None:
         """Empurra o inimigo atingido e corrige contra paredes em seguida."""
 
         knockback_distance = 16
-        direction = pygame.Vector2(enemy.rect.center) - pygame.Vector2(self.rect.center)
-        if direction.length_squared() == 0:
-            direction = self.facing_direction
-
-        movement = direction.normalize() * knockback_distance
-        enemy.rect = move_with_collisions(enemy.rect, movement, colliders)
+        rect = enemy.rect
+        dx = rect.centerx - self.rect.centerx
+        dy = rect.centery - self.rect.centery
+        if dx == 0 and dy == 0:
+            dx, dy = self.facing_direction
+
+        length = math.sqrt(dx * dx + dy * dy)
+        move_with_collisions_ip(
+            rect,
+            dx / length * knockback_distance,
+            dy / length * knockback_distance,
+            colliders,
+        )
+        # Reatribuído para proxies como ``SwarmEnemy``, cujo ``rect`` é uma cópia.
+        enemy.rect = rect
 
     def _build_attack_rect(self) -> pygame.Rect:
         """Cria um retângulo de ataque na direção em que o player está olhando."""
@@ -1,10 +1,32 @@
+import argparse
+
 from core.game import Game
+from core.replay import InputRecorder
 from scenes.game_scene import GameScene
+from scenes.loading_scene import LoadingScene
 
 
 def main() -> None:
-    game = Game()
-    game.set_scene(GameScene(game))
+    parser = argparse.ArgumentParser(description="ARPG Prototype")
+    parser.add_argument(
+        "--record", metavar="ARQUIVO", help="grava o input da partida para replay"
+    )
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        help="atualiza na tela só as áreas que mudaram",
+    )
+    args = parser.parse_args()
+
+    game = Game(dirty_rects=args.dirty_rects)
+    recorder = InputRecorder(args.record) if args.record else None
+    game.set_scene(
+        LoadingScene(
+            game,
+            GameScene.preload(game.resources),
+            lambda: GameScene(game, recorder=recorder),
+        )
+    )
     game.run()
 
 
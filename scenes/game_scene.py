@@ -2,18 +2,41 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
 import random
+import struct
 from pathlib import Path
+from typing import TYPE_CHECKING, Protocol, Sequence
 
 import pygame
 
-from core.camera import Camera
+from core.atlas import RenderQueue, TextureAtlas
+from core.camera import Camera, lerp_rect_ip
+from core.culling import ViewportCuller
+from core.dirty_rects import DirtyRectTracker, draw_frame
+from core.input import IDLE, InputFrame, KeyboardInput
+from core.loader import LoadTask
+from core.map_format import CompiledMap
+from core.resources import ResourceManager
 from core.scene import Scene
+from core.tile_layer import ChunkedTileLayer
 from entities.enemy import Enemy
 from entities.player import Player
 from entities.pickup import LootPickup
-from systems.collision import move_with_collisions, soft_separate
+from systems.ai_lod import AILevelOfDetail, tiers_for_viewport
+from systems.collision_grid import CollisionGrid
+from systems.crowd import CrowdSeparation
+from systems.flow_field import FlowField
+from systems.pool import EntityPool
+from systems.projectiles import OWNER_ENEMY, OWNER_PLAYER, ProjectileSystem
+from systems.raycast import Raycaster
+from systems.spatial_hash import SpatialHash
+from systems.streaming import ChunkKey, WorldStreamer
+from systems.swarm import EnemySwarm
+from systems.wall_merge import count_solid, merge_walls
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para type checkers
+    from core.replay import InputRecorder
 
 TILE_SIZE = 48
 PLAYER_SIZE = 32
@@ -24,6 +47,17 @@ PLAYER_INVULNERABLE_OUTLINE = (255, 240, 180)
 FLOOR_COLOR = (40, 45, 60)
 WALL_COLOR = (90, 110, 145)
 BACKGROUND_COLOR = (20, 20, 30)
+SPATIAL_CELL_SIZE = TILE_SIZE * 2
+# Nós do Dijkstra do campo de fluxo por passo; mapas pequenos fecham em um passo.
+FLOW_FIELD_NODES_PER_UPDATE = 4096
+# Separações de pares por passo; mantém a multidão em ~3 ms com 2000 inimigos.
+CROWD_MAX_RESOLUTIONS = 96
+HUD_TEXT_COLOR = (230, 230, 230)
+
+Color = tuple[int, int, int]
+
+DEFAULT_ENEMY_SPAWNS = [(15, 8), (9, 4)]
+CLASSES_PATH = Path(__file__).resolve().parent.parent / "data" / "classes.json"
 
 TILEMAP = [
     [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
@@ -41,28 +75,183 @@ TILEMAP = [
 ]
 
 
-class GameScene(Scene):
-    """Mapeia um tilemap simples e impede o player de atravessar paredes."""
+class InputSource(Protocol):
+    def poll(self) -> InputFrame:
+        ...
 
-    def __init__(self, game: "Game") -> None:
+
+class GameScene(Scene):
+    """Mapeia um tilemap simples e impede o player de atravessar paredes.
+
+    ``tilemap``, ``enemy_spawns`` (em coordenadas de tile) e ``input_source``
+    permitem rodar a cena com mapas gerados e input roteirizado, como nos
+    benchmarks headless. ``map_path`` aponta para um mapa Tiled/JSON, que é
+    carregado já compilado (veja ``core.map_format``) com colisores e spawns
+    pré-calculados. Com ``streaming`` só os chunks ao redor da câmera ficam
+    residentes (paredes, superfícies e inimigos; veja ``WorldStreamer``).
+    ``ai_lod`` reduz a frequência da IA de inimigos fora da tela e faz dormir
+    os que estão muito longe do player (veja ``AILevelOfDetail``). ``seed`` fixa
+    o sorteio de loot da cena (sem ela uma seed é sorteada e guardada em
+    ``loot_seed``) e ``player_class`` escolhe a classe inicial. Com
+    ``recorder`` o input de cada passo é gravado para replay (veja
+    ``core.replay``). ``draw_dirty`` redesenha só as áreas que mudaram
+    enquanto a câmera está parada (veja ``DirtyRectTracker``). Com
+    ``batched_sprites`` inimigos e itens são desenhados com sprites de um
+    ``TextureAtlas`` compartilhado, enviados em lote por uma ``RenderQueue``.
+    ``raycaster`` responde linha de visão e trajetórias contra as paredes
+    (veja ``Raycaster``). Projéteis criados com ``spawn_projectile`` ficam em
+    um ``ProjectileSystem`` (numpy), criado no primeiro disparo.
+
+    Classes, fontes, mapas compilados e paredes vêm de ``game.resources``;
+    reiniciar a cena ou trocar de classe não lê nada do disco.
+    """
+
+    def __init__(
+        self,
+        game: "Game",
+        use_swarm: bool = False,
+        tilemap: list[list[int]] | None = None,
+        enemy_spawns: Sequence[tuple[int, int]] | None = None,
+        input_source: InputSource | None = None,
+        map_path: str | Path | None = None,
+        streaming: bool = False,
+        ai_lod: bool = True,
+        seed: int | None = None,
+        player_class: str | None = None,
+        recorder: "InputRecorder | None" = None,
+        batched_sprites: bool = True,
+    ) -> None:
         super().__init__(game)
+        self.seed = seed
+        self.loot_seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.loot_seed)
+        self.player_class = player_class
+        self.use_swarm = use_swarm
+        self.streaming = streaming
+        self.ai_lod = (
+            AILevelOfDetail(tiers_for_viewport(game.size)) if ai_lod else None
+        )
+        self.map_path = map_path
+        self.compiled_map: CompiledMap | None = None
+        default_spawns = DEFAULT_ENEMY_SPAWNS
+        if map_path is not None:
+            self.compiled_map = game.resources.compiled_map(map_path)
+            if self.compiled_map.tile_size != TILE_SIZE:
+                raise ValueError(
+                    f"{map_path}: tiles de {self.compiled_map.tile_size}px, "
+                    f"esperado {TILE_SIZE}px"
+                )
+            default_spawns = self.compiled_map.enemy_spawns
+            if tilemap is None:
+                tilemap = self.compiled_map.tiles
+        self.tilemap = tilemap if tilemap is not None else TILEMAP
+        self.enemy_spawns = list(
+            enemy_spawns if enemy_spawns is not None else default_spawns
+        )
+        self.input_source = input_source or KeyboardInput()
+        self.profiler = game.profiler
         self.classes = self._load_classes()
-        self.selected_class = self._default_class_name()
+        self.selected_class = player_class or self._default_class_name()
         spawn_point = self._find_spawn_point()
         self.player = self._create_player(spawn_point, self.selected_class)
         self.camera = Camera(game.size)
-        self.wall_rects = self._build_walls()
+        self.wall_tile_count = count_solid(self.tilemap)
+        self.wall_rects = [] if streaming else self._build_walls()
+        self.collision_world = CollisionGrid(self.wall_rects, TILE_SIZE)
+        self.flow_field = FlowField(
+            self.tilemap, TILE_SIZE, nodes_per_update=FLOW_FIELD_NODES_PER_UPDATE
+        )
+        self.raycaster = Raycaster(self.tilemap, TILE_SIZE)
+        self.projectiles: ProjectileSystem | None = None
+        self.tile_layer = ChunkedTileLayer(
+            self.tilemap, TILE_SIZE, palette={1: WALL_COLOR}, default_color=FLOOR_COLOR
+        )
+        self.streamer: WorldStreamer | None = None
+        if streaming:
+            # Headless roda sem thread para manter benchmarks e replays determinísticos.
+            self.streamer = WorldStreamer(
+                self.tilemap,
+                TILE_SIZE,
+                self.collision_world,
+                self.tile_layer,
+                self.enemy_spawns,
+                threaded=not game.headless,
+            )
         self.enemies = self._spawn_enemies()
-        self.pickups: list[LootPickup] = []
+        self.pickups: EntityPool[LootPickup] = EntityPool(LootPickup)
+        self.enemy_index: SpatialHash[Enemy] = SpatialHash(SPATIAL_CELL_SIZE)
+        self.pickup_index: SpatialHash[LootPickup] = SpatialHash(SPATIAL_CELL_SIZE)
+        for enemy in self.enemies:
+            self.enemy_index.insert(enemy, enemy.rect)
+        if self.streamer is not None:
+            self.camera.follow(self.player.rect.center)
+            self._stream_world(blocking=True)
+        self.culler = ViewportCuller()
+        self._player_screen_rect = pygame.Rect(0, 0, 0, 0)
+        self.dirty_tracker = DirtyRectTracker(game.size)
+        self._tracked_pickups: list[tuple[LootPickup, pygame.Rect]] = []
+        self._tracked_enemies: list[tuple[Enemy, pygame.Rect]] = []
+        self.sprite_atlas: TextureAtlas | None = None
+        self.render_queue = RenderQueue()
+        if batched_sprites:
+            self.sprite_atlas = game.resources.get(
+                "sprite_atlas", lambda: TextureAtlas(like=game.screen)
+            )
+            self.profiler.add_counter_source("render.atlas", self.sprite_atlas.stats)
+        self.crowd = CrowdSeparation(max_resolutions=CROWD_MAX_RESOLUTIONS)
+        self._crowd_members: list[Enemy] = []
+        self.profiler.add_counter_source("pool.pickups", self.pickups.stats)
+        if isinstance(self.enemies, EntityPool):
+            self.profiler.add_counter_source("pool.enemies", self.enemies.stats)
+        if game.dirty_rects:
+            self.profiler.add_counter_source("render.dirty", self.dirty_tracker.stats)
+        self.profiler.add_counter_source("raycast", self.raycaster.stats)
         self.attack_requested = False
+        self.kills = 0
         self.coins_collected = 0
         self.items_collected = 0
-        self.font = pygame.font.SysFont(None, 22)
-        self.title_font = pygame.font.SysFont(None, 72)
+        self.font = game.resources.font(22)
+        self.title_font = game.resources.font(72)
         self.game_over = False
+        self.recorder = recorder
+        if recorder is not None:
+            recorder.start(self)
+
+    @staticmethod
+    def preload(
+        resources: ResourceManager, map_path: str | Path | None = None
+    ) -> list[LoadTask]:
+        """Tarefas que carregam de antemão o que o construtor lê do disco.
+
+        Usadas pela ``LoadingScene`` para montar a cena sem travar o primeiro
+        frame com a busca de fontes e a leitura de configs e mapas.
+        """
+
+        tasks: list[LoadTask] = [
+            lambda: resources.json(CLASSES_PATH),
+            lambda: resources.font(22),
+            lambda: resources.font(72),
+        ]
+        if map_path is not None:
+            tasks.append(lambda: resources.compiled_map(map_path))
+        return tasks
 
     def enter(self) -> None:
         self.camera.follow(self.player.rect.center)
+        # Sem isso o primeiro desenho antes de um passo interpolaria desde (0, 0).
+        self.camera.store_previous()
+
+    def exit(self) -> None:
+        self.profiler.remove_counter_source("pool.pickups")
+        self.profiler.remove_counter_source("pool.enemies")
+        self.profiler.remove_counter_source("render.dirty")
+        self.profiler.remove_counter_source("render.atlas")
+        self.profiler.remove_counter_source("raycast")
+        self.profiler.remove_counter_source("projectiles")
+        if self.streamer is not None:
+            self.streamer.shutdown()
+        if self.recorder is not None:
+            self.recorder.finish()
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -78,99 +267,331 @@ class GameScene(Scene):
                 self._set_player_class(class_name)
 
     def update(self, delta_time: float) -> None:
+        self._store_previous_state()
         if self.game_over:
-            self.player.vel = pygame.Vector2()
+            self.player.vel.update(0, 0)
             self.camera.follow(self.player.rect.center)
+            if self.recorder is not None:
+                self.recorder.record(IDLE)
             return
 
+        profiler = self.profiler
         self.player.update_timers(delta_time)
-
-        direction = pygame.Vector2(0, 0)
-        if self.player.alive:
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_w] or keys[pygame.K_UP]:
-                direction.y -= 1
-            if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-                direction.y += 1
-            if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-                direction.x -= 1
-            if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-                direction.x += 1
-
-            if self.attack_requested and self.player.can_attack():
-                self._perform_attack()
-            self.player.move(direction, delta_time, self.wall_rects)
-        else:
-            self.player.vel = pygame.Vector2()
-        self.attack_requested = False
-
-        for enemy in self.enemies:
-            enemy.update(delta_time, self.player.rect.center, self.wall_rects)
-        self._resolve_player_enemy_overlaps()
-        self._check_player_damage()
-        self._check_pickup_collisions()
+        frame = self.input_source.poll()
+
+        with profiler.section("update.player"):
+            if self.player.alive:
+                direction = frame.direction()
+                attack = self.attack_requested or frame.attack
+                if attack != frame.attack:
+                    frame = frame._replace(attack=attack)
+                if attack and self.player.can_attack():
+                    self._perform_attack()
+                self.player.move(direction, delta_time, self.collision_world)
+            else:
+                self.player.vel.update(0, 0)
+            self.attack_requested = False
+
+        with profiler.section("update.flow_field"):
+            self.flow_field.update(self.player.rect.center)
+        with profiler.section("update.enemies"):
+            self._update_enemies(delta_time)
+        with profiler.section("update.overlaps"):
+            self._resolve_overlaps()
+        if self.projectiles is not None:
+            with profiler.section("update.projectiles"):
+                self._update_projectiles(delta_time)
+        with profiler.section("update.damage"):
+            self._check_player_damage()
+        with profiler.section("update.pickups"):
+            self._check_pickup_collisions()
         if not self.player.alive:
             self.game_over = True
         self.camera.follow(self.player.rect.center)
-
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(BACKGROUND_COLOR)
-
-        for y, row in enumerate(TILEMAP):
-            for x, tile in enumerate(row):
-                world_rect = pygame.Rect(
-                    x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE
-                )
-                screen_rect = self.camera.apply(world_rect)
-                color = WALL_COLOR if tile == 1 else FLOOR_COLOR
-                pygame.draw.rect(surface, color, screen_rect)
-
-        for pickup in self.pickups:
-            pickup.draw(surface, self.camera.apply)
-
-        player_rect = self.camera.apply(self.player.rect)
-        player_color = PLAYER_COLOR
-        outline_color = None
-        if self.player.is_invulnerable():
-            player_color = (
-                PLAYER_INVULNERABLE_COLOR
-                if self.player.invulnerability_flash_on()
-                else PLAYER_COLOR
-            )
-            outline_color = PLAYER_INVULNERABLE_OUTLINE
-
+        if self.streamer is not None:
+            with profiler.section("update.streaming"):
+                self._stream_world()
+        if self.recorder is not None:
+            self.recorder.record(frame)
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> None:
+        self.camera.interpolate(alpha)
+        self.culler.begin_frame(self.camera)
+        self._draw_area(surface, alpha, None)
+
+    def draw_dirty(
+        self, surface: pygame.Surface, alpha: float = 1.0, full: bool = False
+    ) -> list[pygame.Rect] | None:
+        """Redesenha só as áreas onde algo mudou desde o frame anterior.
+
+        Primeiro registra no ``DirtyRectTracker`` a área e a aparência de cada
+        elemento visível; depois redesenha cada área suja com o clip da
+        superfície restrito a ela. Se a câmera se moveu, o mapa mudou ou a
+        área suja for grande demais, cai no desenho completo e retorna ``None``.
+        """
+
+        camera = self.camera
+        camera.interpolate(alpha)
+        view = self.culler.begin_frame(camera)
+        tracker = self.dirty_tracker
+        if full:
+            tracker.force_full()
+        offset = (int(camera.render_position.x), int(camera.render_position.y))
+        tracker.begin_frame(offset)
+        self._track_drawables(tracker, alpha, view)
+
+        rects = tracker.end_frame()
+        if rects is None:
+            self._draw_area(surface, alpha, None)
+            return None
+
+        for rect in rects:
+            surface.set_clip(rect)
+            self._draw_area(surface, alpha, rect)
+        surface.set_clip(None)
+        return rects
+
+    def _track_drawables(
+        self, tracker: DirtyRectTracker, alpha: float, view: pygame.Rect
+    ) -> None:
+        camera = self.camera
+        screen = tracker.screen
+        tracker.track("tiles", screen, self.tile_layer.revision)
+        tracker.track("game_over", screen, self.game_over)
+
+        self._tracked_pickups = []
+        for pickup in self.pickup_index.query_rect(view):
+            bounds = camera.apply(pickup.rect)
+            tracker.track(pickup, bounds, pickup.kind)
+            self._tracked_pickups.append((pickup, bounds))
+        self._tracked_enemies = []
+        for enemy in self.enemy_index.query_rect(view):
+            bounds = enemy.screen_bounds(camera, alpha)
+            tracker.track(enemy, bounds, (enemy.alive, enemy.health))
+            self._tracked_enemies.append((enemy, bounds))
+
+        player = self.player
+        player_rect = player.rect.copy()
+        lerp_rect_ip(player_rect, player.previous_topleft, alpha)
+        camera.apply_ip(player_rect)
+        player_color, outline_color = self._player_colors()
+        if outline_color:
+            player_rect.inflate_ip(6, 6)
+        tracker.track("player", player_rect, player_color)
+        if self._attack_visible():
+            tracker.track("attack", camera.apply(player.last_attack_rect))
+
+        if self.projectiles is not None:
+            bounds = self.projectiles.screen_bounds(camera, alpha)
+            if bounds is not None:
+                signature = self.projectiles.screen_signature(camera, alpha)
+                tracker.track("projectiles", bounds, signature)
+
+        lines = self._hud_lines()
+        hud_rect = pygame.Rect(12, 12, 0, 0)
+        for i, text in enumerate(lines):
+            rendered = self.game.text_cache.render(self.font, text, True, HUD_TEXT_COLOR)
+            hud_rect.union_ip(rendered.get_rect(topleft=(12, 12 + i * 22)))
+        tracker.track("hud", hud_rect, tuple(lines))
+
+    def _draw_area(
+        self, surface: pygame.Surface, alpha: float, area: pygame.Rect | None
+    ) -> None:
+        """Desenha a cena inteira (``area`` ``None``) ou só o que toca ``area``.
+
+        Com ``area`` só entram as entidades cujas áreas registradas em
+        ``_track_drawables`` tocam ``area``; o clip da superfície corta o resto.
+        """
+
+        if area is None:
+            surface.fill(BACKGROUND_COLOR)
+            pickups = self.culler.visible(self.pickup_index)
+            enemies = self.culler.visible(self.enemy_index)
+        else:
+            surface.fill(BACKGROUND_COLOR, area)
+            pickups = [
+                pickup
+                for pickup, bounds in self._tracked_pickups
+                if bounds.colliderect(area)
+            ]
+            enemies = [
+                enemy for enemy, bounds in self._tracked_enemies if bounds.colliderect(area)
+            ]
+
+        self.tile_layer.draw(surface, self.camera)
+
+        atlas = self.sprite_atlas
+        queue = self.render_queue
+        if atlas is not None:
+            for pickup in pickups:
+                pickup.queue_draw(queue, atlas, self.camera)
+            queue.flush(surface)
+        else:
+            for pickup in pickups:
+                pickup.draw(surface, self.camera)
+
+        player_rect = self._player_screen_rect
+        player_rect.update(self.player.rect)
+        lerp_rect_ip(player_rect, self.player.previous_topleft, alpha)
+        self.camera.apply_ip(player_rect)
+        player_color, outline_color = self._player_colors()
         pygame.draw.rect(surface, player_color, player_rect)
         if outline_color:
             outline_rect = player_rect.inflate(6, 6)
-            pygame.draw.rect(surface, outline_color, outline_rect, width=2)
+            draw_frame(surface, outline_color, outline_rect, 2)
 
-        if self.player.last_attack_rect and self.player.attack_timer > 0:
-            pygame.draw.rect(
+        if self._attack_visible():
+            draw_frame(
                 surface,
                 PLAYER_ATTACK_COLOR,
                 self.camera.apply(self.player.last_attack_rect),
-                width=2,
+                2,
             )
 
-        for enemy in self.enemies:
-            enemy.draw(surface, self.camera.apply)
+        if atlas is not None:
+            for enemy in enemies:
+                enemy.queue_draw(queue, atlas, self.camera, alpha)
+            queue.flush(surface)
+        else:
+            for enemy in enemies:
+                enemy.draw(surface, self.camera, alpha)
+
+        if self.projectiles is not None:
+            self.projectiles.draw(surface, self.camera, alpha, atlas)
 
         self._draw_hud(surface)
         if self.game_over:
             self._draw_game_over(surface)
 
+    def _player_colors(self) -> tuple[Color, Color | None]:
+        """Cor do player e do contorno (``None`` sem contorno) neste frame."""
+
+        if not self.player.is_invulnerable():
+            return PLAYER_COLOR, None
+        color = (
+            PLAYER_INVULNERABLE_COLOR
+            if self.player.invulnerability_flash_on()
+            else PLAYER_COLOR
+        )
+        return color, PLAYER_INVULNERABLE_OUTLINE
+
+    def _attack_visible(self) -> bool:
+        return (
+            self.player.last_attack_rect is not None
+            and self.player.attack_timer > 0
+            and self.culler.is_visible(self.player.last_attack_rect)
+        )
+
+    def _store_previous_state(self) -> None:
+        """Guarda posições do início do passo para interpolar o desenho."""
+
+        self.camera.store_previous()
+        self.player.previous_topleft = self.player.rect.topleft
+        if isinstance(self.enemies, EnemySwarm):
+            self.enemies.store_previous()
+            return
+
+        # Inimigos dormindo não se movem; seu ``previous_topleft`` já está em dia.
+        enemies = self.ai_lod.awake if self.ai_lod is not None else self.enemies
+        for enemy in enemies:
+            enemy.previous_topleft = enemy.rect.topleft
+
     def _build_walls(self) -> list[pygame.Rect]:
-        walls: list[pygame.Rect] = []
-        for y, row in enumerate(TILEMAP):
-            for x, tile in enumerate(row):
-                if tile == 1:
-                    walls.append(
-                        pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                    )
-        return walls
+        """Colisores das paredes com tiles contíguos mesclados em retângulos."""
+
+        resources = self.game.resources
+        if self._tiles_from_map():
+            source = Path(self.map_path).resolve()
+            return resources.get(
+                ("walls", source), self.compiled_map.collider_rects, source
+            )
+        if self.tilemap is TILEMAP:
+            return resources.get(
+                ("walls", "default"), lambda: merge_walls(TILEMAP, TILE_SIZE)
+            )
+        return merge_walls(self.tilemap, TILE_SIZE)
+
+    @property
+    def uses_default_map(self) -> bool:
+        return self.tilemap is TILEMAP
+
+    def state_checksum(self) -> int:
+        """Checksum de 64 bits do estado simulado, usado nos checkpoints de replay.
+
+        Cobre player, inimigos (posição e vida), drops e contadores, na ordem
+        de iteração das coleções, que é determinística.
+        """
+
+        digest = hashlib.blake2b(digest_size=8)
+        player = self.player
+        digest.update(self.selected_class.encode("utf-8"))
+        digest.update(
+            struct.pack(
+                "<4i2d3i",
+                *player.rect,
+                player.hp,
+                player.mana,
+                self.kills,
+                self.coins_collected,
+                self.items_collected,
+            )
+        )
+        for enemy in self.enemies:
+            digest.update(struct.pack("<4id", *enemy.rect, enemy.health))
+        for pickup in self.pickups:
+            digest.update(struct.pack("<4i", *pickup.rect))
+            digest.update(pickup.kind.encode("utf-8"))
+        projectiles = self.projectiles
+        if projectiles is not None:
+            live = projectiles.active
+            for array in (projectiles.x, projectiles.y, projectiles.hits_left):
+                digest.update(array[live].tobytes())
+        return int.from_bytes(digest.digest(), "little")
+
+    def enemies_in_sight(self, radius: float) -> list[Enemy]:
+        """Inimigos vivos a até ``radius`` pixels que têm linha de visão ao player.
+
+        Um raio por inimigo, todos na mesma chamada ao ``raycaster``.
+        """
+
+        center = self.player.rect.center
+        nearby = [
+            enemy
+            for enemy in self.enemy_index.query_radius(center, radius)
+            if enemy.alive
+        ]
+        sight = self.raycaster.visible_many(
+            (enemy.rect.center for enemy in nearby), center
+        )
+        return [enemy for enemy, visible in zip(nearby, sight) if visible]
+
+    def spawn_projectile(
+        self,
+        position: tuple[float, float],
+        velocity: tuple[float, float],
+        damage: float,
+        owner: int = OWNER_PLAYER,
+        **options,
+    ) -> int:
+        """Dispara um projétil (veja ``ProjectileSystem.spawn``); retorna o slot.
+
+        O ``ProjectileSystem`` e o ``numpy`` só são carregados no primeiro disparo.
+        """
+
+        if self.projectiles is None:
+            self.projectiles = ProjectileSystem(self.tilemap, TILE_SIZE)
+            self.profiler.add_counter_source("projectiles", self.projectiles.stats)
+        return self.projectiles.spawn(position, velocity, damage, owner=owner, **options)
+
+    def _tiles_from_map(self) -> bool:
+        return self.compiled_map is not None and self.tilemap is self.compiled_map.tiles
 
     def _find_spawn_point(self) -> tuple[int, int]:
-        for y, row in enumerate(TILEMAP):
+        if self.compiled_map is not None and self.compiled_map.player_spawn:
+            x, y = self.compiled_map.player_spawn
+            return (x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2)
+
+        for y, row in enumerate(self.tilemap):
             for x, tile in enumerate(row):
                 if tile == 0:
                     return (
@@ -179,63 +600,220 @@ class GameScene(Scene):
                     )
         return (TILE_SIZE, TILE_SIZE)
 
-    def _spawn_enemies(self) -> list[Enemy]:
-        """Cria inimigos em pontos pré-definidos do mapa."""
+    def _spawn_enemies(self) -> EntityPool[Enemy] | EnemySwarm:
+        """Cria inimigos em pontos pré-definidos do mapa.
+
+        Os inimigos ficam em um ``EntityPool``, com spawn e remoção O(1) e
+        reaproveitamento das instâncias de inimigos mortos. Com ``use_swarm``
+        eles vivem em um ``EnemySwarm`` vetorizado, que expõe a mesma
+        interface de spawn, iteração, pertinência e remoção.
+        """
+
+        # Com streaming os inimigos nascem adormecidos e acordam com o chunk.
+        spawn_tiles = [] if self.streamer is not None else self.enemy_spawns
+        if self.use_swarm:
+            swarm = EnemySwarm(self.tilemap, TILE_SIZE, capacity=max(1, len(spawn_tiles)))
+            for x, y in spawn_tiles:
+                swarm.spawn(
+                    (x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2)
+                )
+            return swarm
 
-        spawn_tiles = [(15, 8), (9, 4)]
-        enemies: list[Enemy] = []
+        enemies: EntityPool[Enemy] = EntityPool(Enemy)
         for x, y in spawn_tiles:
-            center = (x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2)
-            enemies.append(Enemy(center))
+            enemies.spawn(
+                (x * TILE_SIZE + TILE_SIZE // 2, y * TILE_SIZE + TILE_SIZE // 2)
+            )
         return enemies
 
+    def _update_enemies(self, delta_time: float) -> None:
+        """Move os inimigos e mantém o hash espacial em dia com as novas posições.
+
+        Em um ``EnemySwarm`` o movimento é feito em lote e o índice é
+        sincronizado logo depois. Com ``ai_lod`` só os inimigos agendados para
+        este tick atualizam, cada um com o tempo acumulado desde a última vez,
+        tanto com objetos ``Enemy`` quanto no enxame.
+        """
+
+        player_center = self.player.rect.center
+        lod = self.ai_lod
+        if isinstance(self.enemies, EnemySwarm):
+            flow_field = self.flow_field
+            if lod is None:
+                self.enemies.update(delta_time, player_center, flow_field=flow_field)
+                self._sync_enemy_index()
+                return
+            scheduled = lod.schedule(self.enemy_index, player_center, delta_time)
+            self.enemies.update(
+                delta_time, player_center, flow_field=flow_field, scheduled=scheduled
+            )
+            for enemy, _ in scheduled:
+                self.enemy_index.update(enemy, enemy.rect)
+            return
+
+        if lod is not None:
+            scheduled = lod.schedule(self.enemy_index, player_center, delta_time)
+        else:
+            scheduled = [(enemy, delta_time) for enemy in self.enemies]
+
+        enemy_index = self.enemy_index
+        for enemy, elapsed in scheduled:
+            enemy.update(elapsed, player_center, self.collision_world, self.flow_field)
+            enemy_index.update(enemy, enemy.rect)
+
+    def _stream_world(self, blocking: bool = False) -> None:
+        """Carrega/descarrega chunks ao redor da câmera e acorda/adormece inimigos."""
+
+        center = self.camera.position + self.camera.viewport / 2
+        loaded, unloaded = self.streamer.update((center.x, center.y), blocking)
+        for key in unloaded:
+            self._put_chunk_to_sleep(key)
+        for key in loaded:
+            for position, health in self.streamer.take_dormant(key):
+                self._wake_enemy(position, health)
+        self._put_strays_to_sleep()
+
+    def _put_chunk_to_sleep(self, key: ChunkKey) -> None:
+        """Tira da simulação os inimigos cujo centro está no chunk descarregado."""
+
+        sleeping = []
+        for enemy in self.enemy_index.query_rect(self.streamer.chunk_rect(key)):
+            if self.streamer.chunk_of(enemy.rect.center) == key:
+                sleeping.append((enemy.rect.center, enemy.health))
+                self._remove_enemy(enemy)
+        self.streamer.store_dormant(key, sleeping)
+
+    def _put_strays_to_sleep(self) -> None:
+        """Adormece inimigos que saíram dos chunks carregados.
+
+        Um inimigo empurrado (pela separação da multidão, por exemplo) para
+        um chunk que nunca foi carregado andaria ali sem colisores de parede.
+        Ele passa a dormir no chunk em que está e acorda quando o chunk
+        carregar.
+        """
+
+        streamer = self.streamer
+        loaded = streamer.loaded
+        strays = [
+            enemy
+            for enemy in self.enemies
+            if streamer.chunk_of(enemy.rect.center) not in loaded
+        ]
+        for enemy in strays:
+            center = enemy.rect.center
+            streamer.store_dormant(streamer.chunk_of(center), [(center, enemy.health)])
+            self._remove_enemy(enemy)
+
+    def _wake_enemy(self, center: tuple[int, int], health: float | None) -> Enemy:
+        enemy = self.enemies.spawn(center)
+        if health is not None:
+            enemy.health = health
+        self.enemy_index.insert(enemy, enemy.rect)
+        return enemy
+
+    def _remove_enemy(self, enemy: Enemy) -> None:
+        """Remove o inimigo da cena e do hash espacial em O(1)."""
+
+        if enemy in self.enemies:
+            self.enemies.remove(enemy)
+        self.enemy_index.remove(enemy)
+        if self.ai_lod is not None:
+            self.ai_lod.forget(enemy)
+
     def _perform_attack(self) -> None:
         """Executa o ataque do jogador e processa inimigos derrotados."""
 
-        attack_result = self.player.attack(self.enemies, self.wall_rects)
+        attack_result = self.player.attack(self.enemy_index, self.collision_world)
         if not attack_result:
             return
 
         _, defeated = attack_result
+        self.kills += len(defeated)
         for enemy in defeated:
             self._spawn_loot(enemy.rect.center)
-            if enemy in self.enemies:
-                self.enemies.remove(enemy)
+            self._remove_enemy(enemy)
+
+    def _update_projectiles(self, delta_time: float) -> None:
+        """Move os projéteis e aplica o dano dos acertos em inimigos e no player.
+
+        Só os inimigos na área varrida pelos projéteis neste passo viram alvos.
+        """
+
+        projectiles = self.projectiles
+        area = projectiles.swept_bounds(delta_time)
+        if area is None:
+            return
+
+        enemies = [enemy for enemy in self.enemy_index.query_rect(area) if enemy.alive]
+        targets = {OWNER_PLAYER: [enemy.rect for enemy in enemies]}
+        if self.player.alive:
+            targets[OWNER_ENEMY] = [self.player.rect]
+        hits = projectiles.update(delta_time, targets)
+
+        defeated = []
+        for owner, target, damage in zip(
+            hits.owner.tolist(), hits.target.tolist(), hits.damage.tolist()
+        ):
+            if owner == OWNER_ENEMY:
+                self.player.take_damage(damage)
+                continue
+            enemy = enemies[target]
+            if not enemy.alive:
+                continue
+            enemy.take_damage(damage)
+            if not enemy.alive:
+                defeated.append(enemy)
+
+        self.kills += len(defeated)
+        for enemy in defeated:
+            self._spawn_loot(enemy.rect.center)
+            self._remove_enemy(enemy)
 
     def _spawn_loot(self, position: tuple[int, int]) -> None:
         """Sorteia um drop simples quando o inimigo morre."""
 
-        loot_type = "coin" if random.random() < 0.6 else "item"
-        self.pickups.append(LootPickup(position, loot_type))
+        loot_type = "coin" if self.rng.random() < 0.6 else "item"
+        pickup = self.pickups.spawn(position, loot_type)
+        self.pickup_index.insert(pickup, pickup.rect)
 
     def _check_pickup_collisions(self) -> None:
-        """Remove itens coletados e atualiza contadores."""
+        """Remove itens coletados e atualiza contadores.
+
+        Só os itens sob o player são consultados no hash espacial; o item
+        coletado volta para o pool.
+        """
 
-        for pickup in list(self.pickups):
-            if self.player.rect.colliderect(pickup.rect):
-                if pickup.kind == "coin":
-                    self.coins_collected += 1
-                else:
-                    self.items_collected += 1
-                self.pickups.remove(pickup)
+        for pickup in self.pickup_index.query_rect(self.player.rect):
+            if pickup.kind == "coin":
+                self.coins_collected += 1
+            else:
+                self.items_collected += 1
+            self.pickups.remove(pickup)
+            self.pickup_index.remove(pickup)
 
     def _draw_hud(self, surface: pygame.Surface) -> None:
         """Exibe contadores simples de drops no canto superior esquerdo."""
 
-        hud_lines = [
+        text_cache = self.game.text_cache
+        for i, text in enumerate(self._hud_lines()):
+            rendered = text_cache.render(self.font, text, True, HUD_TEXT_COLOR)
+            surface.blit(rendered, (12, 12 + i * 22))
+
+    def _hud_lines(self) -> list[str]:
+        return [
             f"Classe: {self.selected_class}",
             f"Vida: {int(self.player.hp)}/{int(self.player.max_hp)}",
             f"Mana: {int(self.player.mana)}/{int(self.player.max_mana)}",
             f"Moedas: {self.coins_collected}",
             f"Itens: {self.items_collected}",
         ]
-        for i, text in enumerate(hud_lines):
-            rendered = self.font.render(text, True, (230, 230, 230))
-            surface.blit(rendered, (12, 12 + i * 22))
 
     def _draw_game_over(self, surface: pygame.Surface) -> None:
-        title = self.title_font.render("Game Over", True, (255, 80, 80))
-        prompt = self.font.render("Pressione R para reiniciar", True, (230, 230, 230))
+        text_cache = self.game.text_cache
+        title = text_cache.render(self.title_font, "Game Over", True, (255, 80, 80))
+        prompt = text_cache.render(
+            self.font, "Pressione R para reiniciar", True, (230, 230, 230)
+        )
 
         title_rect = title.get_rect(center=(self.game.size[0] // 2, self.game.size[1] // 2 - 20))
         prompt_rect = prompt.get_rect(center=(self.game.size[0] // 2, self.game.size[1] // 2 + 24))
@@ -244,10 +822,7 @@ class GameScene(Scene):
         surface.blit(prompt, prompt_rect)
 
     def _load_classes(self) -> dict[str, dict[str, float | str]]:
-        classes_path = Path(__file__).resolve().parent.parent / "data" / "classes.json"
-        with classes_path.open(encoding="utf-8") as file:
-            class_data = json.load(file)
-
+        class_data = self.game.resources.json(CLASSES_PATH)
         if not class_data:
             raise ValueError("Nenhuma classe configurada encontrada em classes.json")
         return class_data
@@ -285,6 +860,8 @@ class GameScene(Scene):
         if class_name not in self.classes or class_name == self.selected_class:
             return
 
+        if self.recorder is not None:
+            self.recorder.record_class_change(class_name)
         current_position = self.player.rect.center
         self.selected_class = class_name
         self.player = self._create_player(current_position, class_name)
@@ -296,32 +873,48 @@ class GameScene(Scene):
         if not self.player.alive:
             return
 
-        for enemy in self.enemies:
+        for enemy in self.enemy_index.query_rect(self.player.rect):
             if enemy.try_hit(self.player):
                 break
 
     def _restart_scene(self) -> None:
         """Reinicia a cena do jogo do zero."""
 
-        self.game.set_scene(GameScene(self.game))
+        self.game.set_scene(
+            GameScene(
+                self.game,
+                use_swarm=self.use_swarm,
+                tilemap=None if self._tiles_from_map() else self.tilemap,
+                enemy_spawns=self.enemy_spawns,
+                input_source=self.input_source,
+                map_path=self.map_path,
+                streaming=self.streaming,
+                ai_lod=self.ai_lod is not None,
+                seed=self.seed,
+                player_class=self.player_class,
+                batched_sprites=self.sprite_atlas is not None,
+            )
+        )
 
-    def _resolve_player_enemy_overlaps(self) -> None:
-        """Empurra suavemente player e inimigos quando se sobrepõem."""
+    def _resolve_overlaps(self) -> None:
+        """Separa inimigos entre si e do player, com o player mais pesado.
 
-        if not self.player.alive:
-            return
+        O ``CrowdSeparation`` encontra vizinhos por grade e respeita um
+        orçamento fixo de pares por frame; só os inimigos movidos voltam para
+        o hash espacial. Com ``ai_lod`` apenas os inimigos acordados entram.
+        A lista de membros é reaproveitada entre frames.
+        """
 
-        for enemy in self.enemies:
-            if not enemy.alive or not enemy.rect.colliderect(self.player.rect):
-                continue
+        player = self.player if self.player.alive else None
+        members = self._crowd_members
+        members.extend(self.enemies if self.ai_lod is None else self.ai_lod.awake)
+        moved = self.crowd.resolve(members, self.collision_world, player)
+        members.clear()
+        for enemy in moved:
+            self.enemy_index.update(enemy, enemy.rect)
 
-            resolved_player, resolved_enemy = soft_separate(
-                self.player.rect,
-                enemy.rect,
-                self.wall_rects,
-                push_share_a=0.3,
-            )
-
-            self.player.rect = resolved_player
-            enemy.rect = resolved_enemy
+    def _sync_enemy_index(self) -> None:
+        """Atualiza o hash espacial com a posição atual de todos os inimigos."""
 
+        for enemy in self.enemies:
+            self.enemy_index.update(enemy, enemy.rect)
@@ -0,0 +1,70 @@
+"""Cena de carregamento exibida no primeiro frame."""
+
+from __future__ import annotations
+
+from typing import Callable, Sequence
+
+import pygame
+
+from core.loader import BackgroundLoader, LoadTask
+from core.scene import Scene
+
+BACKGROUND_COLOR = (20, 20, 30)
+BAR_BACKGROUND = (45, 50, 70)
+BAR_COLOR = (230, 230, 120)
+BAR_SIZE = (320, 10)
+
+
+class LoadingScene(Scene):
+    """Mostra uma barra de progresso enquanto ``tasks`` rodam em segundo plano.
+
+    O desenho não usa fontes nem imagens, então o primeiro frame sai assim que
+    a janela existe. Quando todas as tarefas terminam, ``build`` cria a
+    próxima cena, que encontra os recursos já carregados em
+    ``game.resources``. A troca também é verificada no ``draw``, para não
+    esperar o primeiro passo fixo da simulação.
+    """
+
+    def __init__(
+        self,
+        game: "Game",
+        tasks: Sequence[LoadTask],
+        build: Callable[[], Scene],
+    ) -> None:
+        super().__init__(game)
+        self.build = build
+        self.loader = BackgroundLoader(tasks, threaded=not game.headless)
+        self._bar = pygame.Rect((0, 0), BAR_SIZE)
+        self._bar.center = (game.size[0] // 2, game.size[1] // 2)
+
+    def enter(self) -> None:
+        self.loader.start()
+
+    def exit(self) -> None:
+        self.loader.shutdown()
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.game.running = False
+
+    def update(self, delta_time: float) -> None:
+        self._finish_if_loaded()
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> None:
+        if self._finish_if_loaded():
+            self.game.active_scene.draw(surface, alpha)
+            return
+
+        surface.fill(BACKGROUND_COLOR)
+        pygame.draw.rect(surface, BAR_BACKGROUND, self._bar)
+        filled = self._bar.copy()
+        filled.width = round(self._bar.width * self.loader.progress)
+        if filled.width:
+            pygame.draw.rect(surface, BAR_COLOR, filled)
+
+    def _finish_if_loaded(self) -> bool:
+        self.loader.check()
+        if self.game.active_scene is not self or not self.loader.done:
+            return False
+        self.game.set_scene(self.build())
+        return True
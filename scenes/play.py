@@ -42,7 +42,7 @@ class PlayScene(Scene):
         self.player_pos += direction * self.speed * delta_time
         self._clamp_player()
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0) -> None:
         surface.fill(BACKGROUND_COLOR)
         pygame.draw.rect(surface, FLOOR_COLOR, self.arena_rect)
         pygame.draw.rect(surface, BORDER_COLOR, self.arena_rect, width=3)
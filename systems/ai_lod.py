@@ -0,0 +1,154 @@
+"""Nível de detalhe da IA: inimigos distantes pensam menos vezes ou dormem."""
+
+from __future__ import annotations
+
+import math
+from typing import Hashable, Protocol, Sequence, TypeVar
+
+import pygame
+
+from systems.spatial_hash import SpatialHash
+
+# (distância máxima em px, intervalo em ticks) do mais próximo ao mais distante.
+DEFAULT_TIERS = ((480.0, 1), (960.0, 2), (1440.0, 4))
+WAKE_MARGIN = 96.0
+# Folga além da meia diagonal da tela: meia entidade e um pouco de movimento.
+VIEW_MARGIN = 32.0
+
+
+def tiers_for_viewport(
+    viewport_size: tuple[float, float],
+    tiers: Sequence[tuple[float, int]] = DEFAULT_TIERS,
+    margin: float = VIEW_MARGIN,
+) -> list[tuple[float, int]]:
+    """Afasta as faixas para que a primeira cubra a tela inteira.
+
+    Com a câmera centrada no player, um inimigo visível está a no máximo meia
+    diagonal da tela; se a primeira faixa terminasse antes disso, inimigos
+    nos cantos da tela andariam aos trancos. Todas as faixas são deslocadas
+    pela mesma distância, preservando a largura entre elas.
+    """
+
+    tiers = sorted(tiers)
+    reach = math.hypot(viewport_size[0], viewport_size[1]) / 2 + margin
+    shift = max(0.0, reach - tiers[0][0])
+    return [(distance + shift, interval) for distance, interval in tiers]
+
+
+class Schedulable(Protocol):
+    rect: pygame.Rect
+    previous_topleft: tuple[int, int]
+
+
+T = TypeVar("T", bound=Hashable)
+
+
+class AILevelOfDetail:
+    """Escolhe, a cada tick, quais inimigos rodam a IA e com quanto tempo.
+
+    Inimigos até a distância da faixa ``(distância, intervalo)`` correspondente
+    atualizam a cada ``intervalo`` ticks, recebendo o ``delta_time`` acumulado
+    desde a última atualização. Os ticks de cada inimigo são defasados para
+    que as faixas lentas não pesem todas no mesmo frame.
+
+    Além da última faixa o inimigo dorme: não é visitado, não acumula tempo e
+    fica parado até o player voltar a chegar perto. Para não alternar entre
+    acordado e dormindo na borda, quem está acordado só dorme depois de passar
+    de ``sleep_distance + wake_margin``.
+
+    As consultas usam o ``SpatialHash`` dos inimigos, então o custo por frame
+    cresce com a quantidade de inimigos próximos, não com a população total.
+    """
+
+    def __init__(
+        self,
+        tiers: Sequence[tuple[float, int]] = DEFAULT_TIERS,
+        wake_margin: float = WAKE_MARGIN,
+    ) -> None:
+        if not tiers:
+            raise ValueError("informe ao menos uma faixa de distância")
+
+        self.tiers = sorted(tiers)
+        self.sleep_distance = self.tiers[-1][0]
+        self.wake_margin = wake_margin
+        self.awake: dict[Schedulable, None] = {}
+        self._elapsed: dict[Schedulable, float] = {}
+        self._phase: dict[Schedulable, int] = {}
+        self._next_phase = 0
+        self._tick = 0
+        self.last_awake = 0
+        self.last_updated = 0
+        self.last_fell_asleep = 0
+
+    def schedule(
+        self,
+        index: SpatialHash[T],
+        center: tuple[float, float],
+        delta_time: float,
+    ) -> list[tuple[T, float]]:
+        """Lista ``(inimigo, tempo acumulado)`` de quem deve atualizar neste tick.
+
+        A ordem segue a do ``SpatialHash`` (ordem de inserção), mantendo a
+        simulação determinística.
+        """
+
+        self._tick += 1
+        cx, cy = center
+        limit = self.sleep_distance
+        keep_limit = limit + self.wake_margin
+        seen: dict[Schedulable, None] = {}
+        due: list[tuple[T, float]] = []
+
+        for enemy in index.query_radius(center, keep_limit):
+            ex, ey = enemy.rect.center
+            distance = math.hypot(ex - cx, ey - cy)
+            if distance > keep_limit or (distance > limit and enemy not in self.awake):
+                continue
+
+            seen[enemy] = None
+            elapsed = self._elapsed.get(enemy, 0.0) + delta_time
+            phase = self._phase.get(enemy)
+            if phase is None:
+                phase = self._phase[enemy] = self._next_phase
+                self._next_phase += 1
+            if (self._tick + phase) % self._interval(distance) == 0:
+                due.append((enemy, elapsed))
+                elapsed = 0.0
+            self._elapsed[enemy] = elapsed
+
+        fell_asleep = 0
+        for enemy in self.awake:
+            if enemy not in seen:
+                self._put_to_sleep(enemy)
+                fell_asleep += 1
+
+        self.awake = seen
+        self.last_awake = len(seen)
+        self.last_updated = len(due)
+        self.last_fell_asleep = fell_asleep
+        return due
+
+    def forget(self, enemy: Schedulable) -> None:
+        """Descarta o estado de um inimigo removido da cena."""
+
+        self.awake.pop(enemy, None)
+        self._elapsed.pop(enemy, None)
+        self._phase.pop(enemy, None)
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "awake": self.last_awake,
+            "updated": self.last_updated,
+            "fell_asleep": self.last_fell_asleep,
+        }
+
+    def _interval(self, distance: float) -> int:
+        for max_distance, interval in self.tiers:
+            if distance <= max_distance:
+                return interval
+        return self.tiers[-1][1]
+
+    def _put_to_sleep(self, enemy: Schedulable) -> None:
+        # Parado enquanto dorme: sem interpolação pendente e sem tempo acumulado.
+        enemy.previous_topleft = enemy.rect.topleft
+        self._elapsed.pop(enemy, None)
@@ -2,47 +2,71 @@
 
 from __future__ import annotations
 
+from typing import Union
+
 import pygame
 
+from systems.collision_grid import CollisionGrid
+
+Colliders = Union[list[pygame.Rect], CollisionGrid]
+
 
 def move_with_collisions(
-    rect: pygame.Rect, movement: pygame.Vector2, colliders: list[pygame.Rect]
+    rect: pygame.Rect, movement: pygame.Vector2, colliders: Colliders
 ) -> pygame.Rect:
     """Move o ``rect`` considerando colisores AABB.
 
     O movimento é resolvido por eixo (primeiro X depois Y) para evitar que o
-    retângulo atravesse paredes quando se move na diagonal.
+    retângulo atravesse paredes quando se move na diagonal. Quando
+    ``colliders`` é uma ``CollisionGrid`` apenas as células próximas são
+    testadas, com o mesmo resultado da varredura completa.
     """
 
     resolved = rect.copy()
-    step_x = int(round(movement.x))
-    step_y = int(round(movement.y))
+    move_with_collisions_ip(resolved, movement.x, movement.y, colliders)
+    return resolved
+
+
+def move_with_collisions_ip(
+    rect: pygame.Rect, dx: float, dy: float, colliders: Colliders
+) -> None:
+    """Como ``move_with_collisions``, mas altera ``rect`` no lugar.
+
+    Recebe o deslocamento já decomposto em ``dx``/``dy`` para que os caminhos
+    quentes (player e inimigos, a cada tick) não criem ``Vector2`` nem
+    ``Rect`` novos.
+    """
+
+    if isinstance(colliders, CollisionGrid):
+        colliders.move_ip(rect, dx, dy)
+        return
+
+    step_x = int(round(dx))
+    step_y = int(round(dy))
 
     if step_x:
-        resolved.x += step_x
+        rect.x += step_x
         for collider in colliders:
-            if resolved.colliderect(collider):
+            if rect.colliderect(collider):
                 if step_x > 0:
-                    resolved.right = collider.left
+                    rect.right = collider.left
                 else:
-                    resolved.left = collider.right
+                    rect.left = collider.right
 
     if step_y:
-        resolved.y += step_y
+        rect.y += step_y
         for collider in colliders:
-            if resolved.colliderect(collider):
+            if rect.colliderect(collider):
                 if step_y > 0:
-                    resolved.bottom = collider.top
+                    rect.bottom = collider.top
                 else:
-                    resolved.top = collider.bottom
-
-    return resolved
+                    rect.top = collider.bottom
 
 
 def soft_separate(
     rect_a: pygame.Rect,
     rect_b: pygame.Rect,
-    colliders: list[pygame.Rect],
+    colliders: Colliders,
     push_share_a: float = 0.5,
 ) -> tuple[pygame.Rect, pygame.Rect]:
     """Empurra dois ``pygame.Rect`` sobrepostos no eixo de menor invasão.
@@ -0,0 +1,219 @@
+"""Grade uniforme de colisores estáticos usada como broadphase de movimento."""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Sequence
+
+import pygame
+
+from systems.wall_merge import merge_walls
+
+
+class CollisionGrid:
+    """Indexa colisores AABB em células de tamanho fixo.
+
+    Cada colisor recebe um índice na ordem em que foi inserido. A resolução de
+    movimento consulta apenas as células tocadas pelo retângulo deslocado em
+    cada eixo e percorre os candidatos nessa mesma ordem, reproduzindo o
+    resultado de ``move_with_collisions`` com a lista completa de colisores.
+
+    ``remove`` libera o índice de um colisor, que é reaproveitado pelo próximo
+    ``add``; a iteração segue a ordem dos índices vivos.
+    """
+
+    def __init__(self, colliders: Iterable[pygame.Rect], cell_size: int) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size precisa ser positivo")
+
+        self.cell_size = cell_size
+        self.colliders: list[pygame.Rect | None] = []
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        self._free: list[int] = []
+        for collider in colliders:
+            self.add(collider)
+
+    @classmethod
+    def from_tilemap(
+        cls,
+        tilemap: Sequence[Sequence[int]],
+        tile_size: int,
+        solid: int = 1,
+        merge: bool = False,
+    ) -> "CollisionGrid":
+        """Cria a grade com um colisor por tile sólido, em ordem linha a linha.
+
+        Com ``merge=True`` os tiles contíguos viram retângulos maiores (veja
+        ``systems.wall_merge``), o que reduz os candidatos por consulta.
+        """
+
+        if merge:
+            return cls(merge_walls(tilemap, tile_size, solid), tile_size)
+
+        colliders = [
+            pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size)
+            for y, row in enumerate(tilemap)
+            for x, tile in enumerate(row)
+            if tile == solid
+        ]
+        return cls(colliders, tile_size)
+
+    def __len__(self) -> int:
+        return len(self.colliders) - len(self._free)
+
+    def __iter__(self) -> Iterator[pygame.Rect]:
+        return (collider for collider in self.colliders if collider is not None)
+
+    def add(self, collider: pygame.Rect) -> int:
+        """Registra um colisor e retorna o índice atribuído a ele."""
+
+        if self._free:
+            index = self._free.pop()
+            self.colliders[index] = collider
+        else:
+            index = len(self.colliders)
+            self.colliders.append(collider)
+        for cell in self._cells_for(collider):
+            self._cells.setdefault(cell, []).append(index)
+        return index
+
+    def remove(self, index: int) -> None:
+        """Remove o colisor de ``index`` das células e libera o índice."""
+
+        collider = self.colliders[index]
+        if collider is None:
+            return
+
+        for cell in self._cells_for(collider):
+            bucket = self._cells[cell]
+            bucket.remove(index)
+            if not bucket:
+                del self._cells[cell]
+        self.colliders[index] = None
+        self._free.append(index)
+
+    def query(self, rect: pygame.Rect) -> list[pygame.Rect]:
+        """Retorna os colisores que intersectam ``rect`` na ordem de inserção."""
+
+        return [
+            self.colliders[index]
+            for index in self._candidates(rect)
+            if rect.colliderect(self.colliders[index])
+        ]
+
+    def move(self, rect: pygame.Rect, movement: pygame.Vector2) -> pygame.Rect:
+        """Equivalente a ``move_with_collisions`` usando apenas células próximas."""
+
+        resolved = rect.copy()
+        self.move_ip(resolved, movement.x, movement.y)
+        return resolved
+
+    def move_ip(self, rect: pygame.Rect, dx: float, dy: float) -> None:
+        """Versão de ``move`` que desloca ``rect`` no lugar.
+
+        Não monta listas de candidatos; o único objeto temporário por eixo é o
+        do ``round`` do deslocamento.
+        """
+
+        step_x = int(round(dx))
+        step_y = int(round(dy))
+
+        if step_x:
+            rect.x += step_x
+            self._resolve_axis(rect, step_x, horizontal=True)
+
+        if step_y:
+            rect.y += step_y
+            self._resolve_axis(rect, step_y, horizontal=False)
+
+    def _resolve_axis(self, resolved: pygame.Rect, step: int, horizontal: bool) -> None:
+        """Corrige ``resolved`` contra os colisores próximos em um único eixo.
+
+        Depois de cada correção o próximo colisor é procurado a partir da nova
+        posição, mas somente entre índices maiores que o último tratado,
+        exatamente como a varredura linear faria.
+        """
+
+        last_index = -1
+        while True:
+            index = self._first_hit(resolved, last_index)
+            if index < 0:
+                return
+
+            collider = self.colliders[index]
+            if horizontal:
+                if step > 0:
+                    resolved.right = collider.left
+                else:
+                    resolved.left = collider.right
+            elif step > 0:
+                resolved.bottom = collider.top
+            else:
+                resolved.top = collider.bottom
+            last_index = index
+
+    def _first_hit(self, rect: pygame.Rect, after: int) -> int:
+        """Menor índice maior que ``after`` de um colisor que intersecta ``rect``.
+
+        Percorre as células diretamente, sem montar listas de candidatos (os
+        laços ``while`` evitam até os objetos ``range``), e retorna ``-1`` se
+        nenhum colisor for atingido.
+        """
+
+        if rect.width <= 0 or rect.height <= 0:
+            return -1
+
+        size = self.cell_size
+        cells = self._cells
+        colliders = self.colliders
+        first_x = rect.left // size
+        last_x = (rect.right - 1) // size
+        last_y = (rect.bottom - 1) // size
+        best = -1
+        cell_y = rect.top // size
+        while cell_y <= last_y:
+            cell_x = first_x
+            while cell_x <= last_x:
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    for index in bucket:
+                        if (
+                            index > after
+                            and (best < 0 or index < best)
+                            and rect.colliderect(colliders[index])
+                        ):
+                            best = index
+                cell_x += 1
+            cell_y += 1
+        return best
+
+    def _candidates(self, rect: pygame.Rect) -> list[int]:
+        """Índices (ordenados) dos colisores nas células de ``rect``."""
+
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+
+        size = self.cell_size
+        cells = self._cells
+        found: list[int] = []
+        for cell_y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for cell_x in range(rect.left // size, (rect.right - 1) // size + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    found.extend(bucket)
+
+        if len(found) > 1:
+            found = sorted(set(found))
+        return found
+
+    def _cells_for(self, rect: pygame.Rect) -> Iterator[tuple[int, int]]:
+        if rect.width <= 0 or rect.height <= 0:
+            return
+
+        size = self.cell_size
+        first_x = rect.left // size
+        last_x = (rect.right - 1) // size
+        first_y = rect.top // size
+        last_y = (rect.bottom - 1) // size
+        for cell_y in range(first_y, last_y + 1):
+            for cell_x in range(first_x, last_x + 1):
+                yield (cell_x, cell_y)
@@ -0,0 +1,203 @@
+"""Separação de multidão: empurra entidades sobrepostas usando uma grade uniforme."""
+
+from __future__ import annotations
+
+import time
+from operator import attrgetter
+from typing import Protocol, Sequence
+
+import pygame
+
+from systems.collision import Colliders, soft_separate
+
+PLAYER_PUSH_SHARE = 0.3
+ENEMY_PUSH_SHARE = 0.5
+# Metade do estêncil 3x3: cada par de células vizinhas é visitado uma vez só.
+FORWARD_NEIGHBOURS = ((1, 0), (-1, 1), (0, 1), (1, 1))
+_WIDTH = attrgetter("width")
+_HEIGHT = attrgetter("height")
+
+
+class CrowdMember(Protocol):
+    rect: pygame.Rect
+    alive: bool
+
+
+class CrowdSeparation:
+    """Resolve sobreposições inimigo-inimigo e inimigo-player com ``soft_separate``.
+
+    A cada ``resolve`` as entidades são distribuídas (pelo centro) em células do
+    tamanho da maior entidade, de modo que só pares da mesma célula ou de
+    células vizinhas são testados, em vez de todos os pares. Cada par usa a
+    divisão de empurrão de ``soft_separate``: 50/50 entre inimigos e
+    ``player_push_share`` para o player, que fica mais pesado. Paredes são
+    respeitadas via ``colliders``.
+
+    ``max_pair_tests`` limita quantos pares são testados por frame e
+    ``max_resolutions`` (opcional) quantos pares sobrepostos são separados; o
+    custo está quase todo nas separações, que resolvem paredes, então é este
+    limite que fixa o trabalho de forma determinística. ``time_budget_ms``
+    (opcional) limita também o tempo de relógio. Os três são verificados a
+    cada célula. Quando o
+    orçamento estoura, o próximo frame começa pela célula seguinte, então
+    todas as regiões da multidão acabam sendo atendidas.
+    """
+
+    def __init__(
+        self,
+        max_pair_tests: int = 8000,
+        time_budget_ms: float | None = None,
+        max_resolutions: int | None = None,
+        enemy_push_share: float = ENEMY_PUSH_SHARE,
+        player_push_share: float = PLAYER_PUSH_SHARE,
+    ) -> None:
+        self.max_pair_tests = max_pair_tests
+        self.time_budget_ms = time_budget_ms
+        self.max_resolutions = max_resolutions
+        self.enemy_push_share = enemy_push_share
+        self.player_push_share = player_push_share
+        self.last_pairs_tested = 0
+        self.last_pairs_resolved = 0
+        self.last_budget_exhausted = False
+        self.last_ms = 0.0
+        self._cursor = 0
+
+    def resolve(
+        self,
+        members: Sequence[CrowdMember],
+        colliders: Colliders,
+        player: CrowdMember | None = None,
+    ) -> list[CrowdMember]:
+        """Separa os membros sobrepostos e retorna os que foram movidos.
+
+        Os retângulos são escritos de volta em ``member.rect`` (e em
+        ``player.rect``) apenas para quem se moveu.
+        """
+
+        start = time.perf_counter()
+        deadline = None
+        if self.time_budget_ms is not None:
+            deadline = start + self.time_budget_ms / 1000.0
+
+        rects = [member.rect for member in members]
+        alive = [member.alive for member in members]
+        moved = [False] * len(members)
+        cell_size = max(
+            1,
+            max(map(_WIDTH, rects), default=1),
+            max(map(_HEIGHT, rects), default=1),
+        )
+        cells = self._bucket(rects, cell_size)
+
+        tested = 0
+        resolved = 0
+        exhausted = False
+        share = self.enemy_push_share
+        max_resolutions = self.max_resolutions
+        keys = list(cells)
+        cursor = self._cursor % len(keys) if keys else 0
+        self._cursor = 0
+        for step in range(len(keys)):
+            key = keys[(cursor + step) % len(keys)]
+            bucket = cells[key]
+            pairs = [
+                (first, second)
+                for position, first in enumerate(bucket)
+                for second in bucket[position + 1 :]
+            ]
+            for offset_x, offset_y in FORWARD_NEIGHBOURS:
+                neighbours = cells.get((key[0] + offset_x, key[1] + offset_y))
+                if neighbours:
+                    pairs.extend(
+                        (first, second) for first in bucket for second in neighbours
+                    )
+
+            for first, second in pairs:
+                if not (alive[first] and alive[second]):
+                    continue
+                tested += 1
+                if not rects[first].colliderect(rects[second]):
+                    continue
+                rects[first], rects[second] = soft_separate(
+                    rects[first], rects[second], colliders, push_share_a=share
+                )
+                moved[first] = moved[second] = True
+                resolved += 1
+
+            # Verificado depois da célula: ao menos uma é atendida por frame.
+            if (
+                tested >= self.max_pair_tests
+                or (max_resolutions is not None and resolved >= max_resolutions)
+                or (deadline is not None and time.perf_counter() > deadline)
+            ):
+                self._cursor = cursor + step + 1
+                exhausted = step + 1 < len(keys)
+                break
+
+        if player is not None and player.alive:
+            resolved += self._resolve_player(
+                player, rects, alive, moved, cells, cell_size, colliders
+            )
+
+        changed: list[CrowdMember] = []
+        for index, member in enumerate(members):
+            if moved[index]:
+                member.rect = rects[index]
+                changed.append(member)
+
+        self.last_pairs_tested = tested
+        self.last_pairs_resolved = resolved
+        self.last_budget_exhausted = exhausted
+        self.last_ms = (time.perf_counter() - start) * 1000.0
+        return changed
+
+    def _resolve_player(
+        self,
+        player: CrowdMember,
+        rects: list[pygame.Rect],
+        alive: list[bool],
+        moved: list[bool],
+        cells: dict[tuple[int, int], list[int]],
+        cell_size: int,
+        colliders: Colliders,
+    ) -> int:
+        """Separa o player dos inimigos próximos; o player recebe a menor parte."""
+
+        player_rect = player.rect
+        search = player_rect.inflate(cell_size * 2, cell_size * 2)
+        first_x, last_x = search.left // cell_size, (search.right - 1) // cell_size
+        first_y, last_y = search.top // cell_size, (search.bottom - 1) // cell_size
+        candidates: set[int] = set()
+        for cell_y in range(first_y, last_y + 1):
+            for cell_x in range(first_x, last_x + 1):
+                candidates.update(cells.get((cell_x, cell_y), ()))
+
+        resolved = 0
+        for index in sorted(candidates):
+            if not alive[index] or not rects[index].colliderect(player_rect):
+                continue
+            player_rect, rects[index] = soft_separate(
+                player_rect,
+                rects[index],
+                colliders,
+                push_share_a=self.player_push_share,
+            )
+            moved[index] = True
+            resolved += 1
+
+        player.rect = player_rect
+        return resolved
+
+    @staticmethod
+    def _bucket(
+        rects: list[pygame.Rect], cell_size: int
+    ) -> dict[tuple[int, int], list[int]]:
+        cells: dict[tuple[int, int], list[int]] = {}
+        for index, rect in enumerate(rects):
+            key = (rect.centerx // cell_size, rect.centery // cell_size)
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [index]
+            else:
+                bucket.append(index)
+        return cells
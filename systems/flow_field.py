@@ -0,0 +1,227 @@
+"""Campo de fluxo (Dijkstra) compartilhado por todos os perseguidores."""
+
+from __future__ import annotations
+
+import heapq
+import time
+from typing import Sequence
+
+UNREACHABLE = -1
+STRAIGHT_COST = 10
+DIAGONAL_COST = 14
+NEIGHBOURS = (
+    (1, 0, STRAIGHT_COST),
+    (-1, 0, STRAIGHT_COST),
+    (0, 1, STRAIGHT_COST),
+    (0, -1, STRAIGHT_COST),
+    (1, 1, DIAGONAL_COST),
+    (1, -1, DIAGONAL_COST),
+    (-1, 1, DIAGONAL_COST),
+    (-1, -1, DIAGONAL_COST),
+)
+
+
+class FlowField:
+    """Distâncias até o tile do player e o próximo tile de cada tile andável.
+
+    O campo só é recalculado quando o alvo muda de tile. Com
+    ``nodes_per_update`` o cálculo é fatiado entre vários ``update`` (o campo
+    anterior continua válido até o novo terminar), limitando o custo por frame.
+    Um cálculo em andamento nunca é descartado: se o alvo mudar de tile antes
+    do fim, o próximo cálculo parte do alvo mais recente assim que este
+    terminar, então campos novos continuam saindo mesmo com o alvo sempre em
+    movimento. O primeiro campo é calculado inteiro, sem orçamento.
+    ``last_update_ms`` e ``last_build_ms`` expõem o tempo gasto para ajuste.
+    Diagonais só são permitidas quando os dois tiles ortogonais estão livres,
+    evitando que os inimigos cortem quinas de parede.
+    """
+
+    def __init__(
+        self,
+        tilemap: Sequence[Sequence[int]],
+        tile_size: int,
+        solid: int = 1,
+        nodes_per_update: int | None = None,
+    ) -> None:
+        self.tile_size = tile_size
+        self.height = len(tilemap)
+        self.width = max((len(row) for row in tilemap), default=0)
+        self.walkable = [False] * (self.width * self.height)
+        for y, row in enumerate(tilemap):
+            for x, tile in enumerate(row):
+                self.walkable[y * self.width + x] = tile != solid
+        self.nodes_per_update = nodes_per_update
+
+        self.target_tile: tuple[int, int] | None = None
+        self.distance: list[int] = [UNREACHABLE] * len(self.walkable)
+        self.next_tile: list[int] = [UNREACHABLE] * len(self.walkable)
+        self.version = 0
+        self.last_update_ms = 0.0
+        self.last_build_ms = 0.0
+        self.last_nodes_expanded = 0
+
+        self._pending_target: tuple[int, int] | None = None
+        self._requested_target: tuple[int, int] | None = None
+        self._pending_distance: list[int] = []
+        self._pending_heap: list[tuple[int, int]] = []
+        self._pending_nodes = 0
+        self._pending_ms = 0.0
+
+    def tile_at(self, position: tuple[float, float]) -> tuple[int, int]:
+        return (int(position[0] // self.tile_size), int(position[1] // self.tile_size))
+
+    def update(self, target_position: tuple[float, float]) -> bool:
+        """Avança o cálculo rumo ao tile de ``target_position``.
+
+        Retorna ``True`` quando um novo campo ficou pronto nesta chamada.
+        """
+
+        start = time.perf_counter()
+        tile = self.tile_at(target_position)
+        if self._is_walkable(*tile):
+            self._requested_target = tile
+        requested = self._requested_target
+        if (
+            self._pending_target is None
+            and requested is not None
+            and requested != self.target_tile
+        ):
+            self._start(requested)
+
+        finished = False
+        if self._pending_target is not None:
+            finished = self._advance(unbounded=self.target_tile is None)
+
+        elapsed = (time.perf_counter() - start) * 1000.0
+        self.last_update_ms = elapsed
+        if self._pending_target is not None or finished:
+            self._pending_ms += elapsed
+        if finished:
+            self.last_build_ms = self._pending_ms
+        return finished
+
+    def is_pending(self) -> bool:
+        return self._pending_target is not None
+
+    def waypoint(self, position: tuple[float, float]) -> tuple[float, float] | None:
+        """Centro do próximo tile rumo ao alvo a partir de ``position``.
+
+        Retorna ``None`` no tile do alvo, fora do mapa ou em tiles sem
+        caminho; nesses casos quem consulta deve buscar o alvo diretamente.
+        """
+
+        x, y = self.tile_at(position)
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+
+        next_index = self.next_tile[y * self.width + x]
+        if next_index == UNREACHABLE:
+            return None
+
+        half = self.tile_size / 2
+        return (
+            (next_index % self.width) * self.tile_size + half,
+            (next_index // self.width) * self.tile_size + half,
+        )
+
+    def _is_walkable(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height and self.walkable[
+            y * self.width + x
+        ]
+
+    def _start(self, tile: tuple[int, int]) -> None:
+        index = tile[1] * self.width + tile[0]
+        self._pending_target = tile
+        self._pending_distance = [UNREACHABLE] * len(self.walkable)
+        self._pending_distance[index] = 0
+        self._pending_heap = [(0, index)]
+        self._pending_nodes = 0
+        self._pending_ms = 0.0
+
+    def _advance(self, unbounded: bool = False) -> bool:
+        """Expande nós do Dijkstra pendente até o orçamento; ``True`` se terminou."""
+
+        width = self.width
+        height = self.height
+        walkable = self.walkable
+        distance = self._pending_distance
+        heap = self._pending_heap
+        budget = None if unbounded else self.nodes_per_update
+        expanded = 0
+
+        while heap:
+            if budget is not None and expanded >= budget:
+                self._pending_nodes += expanded
+                return False
+
+            cost, index = heapq.heappop(heap)
+            if cost > distance[index]:
+                continue
+            expanded += 1
+
+            x = index % width
+            y = index // width
+            for dx, dy, step_cost in NEIGHBOURS:
+                nx = x + dx
+                ny = y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                neighbour = ny * width + nx
+                if not walkable[neighbour]:
+                    continue
+                if dx and dy and not (
+                    walkable[y * width + nx] and walkable[ny * width + x]
+                ):
+                    continue
+                new_cost = cost + step_cost
+                known = distance[neighbour]
+                if known == UNREACHABLE or new_cost < known:
+                    distance[neighbour] = new_cost
+                    heapq.heappush(heap, (new_cost, neighbour))
+
+        self._pending_nodes += expanded
+        self._finish()
+        return True
+
+    def _finish(self) -> None:
+        """Publica o campo calculado e deriva o próximo tile de cada tile."""
+
+        width = self.width
+        height = self.height
+        walkable = self.walkable
+        distance = self._pending_distance
+        next_tile = [UNREACHABLE] * len(distance)
+
+        for index, own in enumerate(distance):
+            if own <= 0:
+                continue
+            x = index % width
+            y = index // width
+            best = own
+            best_index = UNREACHABLE
+            for dx, dy, _ in NEIGHBOURS:
+                nx = x + dx
+                ny = y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                neighbour = ny * width + nx
+                candidate = distance[neighbour]
+                if candidate == UNREACHABLE or candidate >= best:
+                    continue
+                if dx and dy and not (
+                    walkable[y * width + nx] and walkable[ny * width + x]
+                ):
+                    continue
+                best = candidate
+                best_index = neighbour
+            next_tile[index] = best_index
+
+        self.target_tile = self._pending_target
+        self.distance = distance
+        self.next_tile = next_tile
+        self.last_nodes_expanded = self._pending_nodes
+        self.version += 1
+
+        self._pending_target = None
+        self._pending_distance = []
+        self._pending_heap = []
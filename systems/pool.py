@@ -0,0 +1,103 @@
+"""Pool de entidades com slots estáveis e lista livre."""
+
+from __future__ import annotations
+
+from typing import Callable, Generic, Iterator, Protocol, TypeVar
+
+
+class Poolable(Protocol):
+    pool_slot: int
+
+    def reset(self, *args, **kwargs) -> None:
+        ...
+
+
+T = TypeVar("T", bound=Poolable)
+
+
+class EntityPool(Generic[T]):
+    """Guarda entidades em slots fixos e reaproveita as instâncias liberadas.
+
+    Cada entidade fica sempre no mesmo slot (``pool_slot``) enquanto viva.
+    ``remove`` só marca o slot como livre, em O(1), e a instância continua
+    alocada nele; o próximo ``spawn`` reaproveita o último slot liberado e
+    chama ``reset`` com os argumentos do spawn, em vez de criar outro objeto.
+    Assim mortes e drops em massa não geram lixo para o coletor.
+
+    A interface (``spawn``, ``remove``, iteração e pertinência) é a mesma do
+    ``EnemySwarm``. A iteração percorre os slots vivos em ordem de slot.
+    """
+
+    def __init__(self, factory: Callable[..., T]) -> None:
+        self.factory = factory
+        self._slots: list[T] = []
+        self._alive: list[bool] = []
+        self._free: list[int] = []
+        self._count = 0
+        self.created = 0
+        self.reused = 0
+        self.high_water = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[T]:
+        alive = self._alive
+        return (entity for slot, entity in enumerate(self._slots) if alive[slot])
+
+    def __contains__(self, entity: object) -> bool:
+        slot = getattr(entity, "pool_slot", -1)
+        return (
+            0 <= slot < len(self._slots)
+            and self._slots[slot] is entity
+            and self._alive[slot]
+        )
+
+    def spawn(self, *args, **kwargs) -> T:
+        """Ativa uma entidade, reaproveitando uma instância livre se houver."""
+
+        if self._free:
+            slot = self._free.pop()
+            entity = self._slots[slot]
+            entity.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            slot = len(self._slots)
+            entity = self.factory(*args, **kwargs)
+            self._slots.append(entity)
+            self._alive.append(False)
+            self.created += 1
+
+        entity.pool_slot = slot
+        self._alive[slot] = True
+        self._count += 1
+        self.high_water = max(self.high_water, self._count)
+        return entity
+
+    def remove(self, entity: T) -> None:
+        """Libera o slot da entidade em O(1); a instância fica para reuso."""
+
+        if entity not in self:
+            raise ValueError("entidade não pertence a este pool")
+
+        slot = entity.pool_slot
+        self._alive[slot] = False
+        self._free.append(slot)
+        self._count -= 1
+
+    def discard(self, entity: T) -> None:
+        """Como ``remove``, mas ignora entidades que já não estão no pool."""
+
+        if entity in self:
+            self.remove(entity)
+
+    def stats(self) -> dict[str, float]:
+        spawned = self.created + self.reused
+        return {
+            "active": self._count,
+            "capacity": len(self._slots),
+            "created": self.created,
+            "reused": self.reused,
+            "high_water": self.high_water,
+            "reuse_rate": self.reused / spawned if spawned else 0.0,
+        }
@@ -0,0 +1,566 @@
+"""Projéteis em arrays paralelos, com varredura contínua contra a grade de tiles.
+
+Requer ``numpy``, importado só quando o primeiro ``ProjectileSystem`` é
+criado (veja ``systems.swarm``).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Mapping, NamedTuple, Sequence
+
+import pygame
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para type checkers
+    from core.atlas import TextureAtlas
+    from core.camera import Camera
+
+# Preenchido por ``_import_numpy`` no primeiro ``ProjectileSystem``.
+np = None
+
+OWNER_PLAYER = 0
+OWNER_ENEMY = 1
+PROJECTILE_COLORS = {
+    OWNER_PLAYER: (250, 235, 150),
+    OWNER_ENEMY: (235, 120, 210),
+}
+DEFAULT_LIFETIME = 2.0
+DEFAULT_SIZE = 8
+
+
+def _import_numpy() -> None:
+    global np
+    if np is not None:
+        return
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - dependência opcional
+        raise ImportError("ProjectileSystem requer numpy (pip install numpy)") from None
+    np = numpy
+
+
+class ProjectileHits(NamedTuple):
+    """Acertos de um ``update``, um por posição dos arrays.
+
+    ``target`` é o índice do alvo na sequência passada para o dono do
+    projétil; ``x``/``y`` é o centro do projétil no momento do impacto.
+    """
+
+    projectile: "np.ndarray"
+    owner: "np.ndarray"
+    target: "np.ndarray"
+    damage: "np.ndarray"
+    x: "np.ndarray"
+    y: "np.ndarray"
+
+    @property
+    def count(self) -> int:
+        return len(self.projectile)
+
+
+class ProjectileSystem:
+    """Projéteis guardados em arrays paralelos e integrados em lote.
+
+    Cada projétil é um quadrado (``size``) com centro, velocidade, tempo de
+    vida, dano, dono e quantos alvos ainda pode atravessar (``pierce``). A
+    cada ``update`` todos andam de uma vez; o trajeto é testado de forma
+    contínua (swept AABB) contra os tiles sólidos, então projéteis rápidos não
+    atravessam paredes, e depois contra os alvos de cada dono em uma única
+    passada vetorizada (sort-and-sweep no eixo X para achar os pares).
+
+    Um alvo só é atingido quando o projétil entra nele; no primeiro passo de
+    vida também conta começar sobreposto (tiro à queima-roupa). Assim um
+    projétil perfurante não acerta o mesmo alvo a cada passo enquanto o cruza.
+    """
+
+    def __init__(
+        self,
+        tilemap: Sequence[Sequence[int]],
+        tile_size: int,
+        capacity: int = 1024,
+        solid: int = 1,
+    ) -> None:
+        _import_numpy()
+
+        self.tile_size = tile_size
+        self.solid = np.array(
+            [[tile == solid for tile in row] for row in tilemap], dtype=bool
+        )
+        self._free: list[int] = []
+        self._count = 0
+        self._capacity = 0
+        self.wall_hits = 0
+        self.target_hits = 0
+        self.expired = 0
+        self._sprites: dict[tuple[int, int], pygame.Surface] = {}
+        self._allocate(max(1, capacity))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def spawn(
+        self,
+        position: tuple[float, float],
+        velocity: tuple[float, float],
+        damage: float,
+        lifetime: float = DEFAULT_LIFETIME,
+        owner: int = OWNER_PLAYER,
+        size: int = DEFAULT_SIZE,
+        pierce: int = 0,
+    ) -> int:
+        """Cria um projétil com centro em ``position``; retorna o slot."""
+
+        return int(
+            self.spawn_many(
+                [position], [velocity], damage, lifetime, owner, size, pierce
+            )[0]
+        )
+
+    def spawn_many(
+        self,
+        positions,
+        velocities,
+        damage: float,
+        lifetime: float = DEFAULT_LIFETIME,
+        owner: int = OWNER_PLAYER,
+        size: int = DEFAULT_SIZE,
+        pierce: int = 0,
+    ):
+        """Cria vários projéteis iguais de uma vez; retorna os slots.
+
+        ``positions`` e ``velocities`` são sequências (ou arrays ``N x 2``)
+        de centros e velocidades em pixels/segundo.
+        """
+
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        velocities = np.asarray(velocities, dtype=np.float64).reshape(-1, 2)
+        count = len(positions)
+        if len(velocities) != count:
+            raise ValueError("positions e velocities precisam ter o mesmo tamanho")
+        if count == 0:
+            return np.empty(0, dtype=np.int64)
+
+        capacity = self._capacity
+        while len(self._free) < count:
+            capacity *= 2
+            self._allocate(capacity)
+
+        slots = np.array(self._free[-count:][::-1], dtype=np.int64)
+        del self._free[-count:]
+        self.x[slots] = positions[:, 0]
+        self.y[slots] = positions[:, 1]
+        self.prev_x[slots] = positions[:, 0]
+        self.prev_y[slots] = positions[:, 1]
+        self.vx[slots] = velocities[:, 0]
+        self.vy[slots] = velocities[:, 1]
+        self.half[slots] = size / 2
+        self.lifetime[slots] = lifetime
+        self.damage[slots] = damage
+        self.owner[slots] = owner
+        self.hits_left[slots] = pierce + 1
+        self.fresh[slots] = True
+        self.active[slots] = True
+        self._count += count
+        return slots
+
+    def remove(self, slot: int) -> None:
+        """Libera o slot do projétil em O(1)."""
+
+        if not self.active[slot]:
+            raise ValueError("projétil inexistente")
+        self.active[slot] = False
+        self._free.append(slot)
+        self._count -= 1
+
+    def clear(self) -> None:
+        self.active[:] = False
+        self._free = list(range(self._capacity - 1, -1, -1))
+        self._count = 0
+
+    def swept_bounds(self, delta_time: float) -> pygame.Rect | None:
+        """Área do mundo que os projéteis vivos podem varrer no próximo passo.
+
+        Serve para buscar candidatos no hash espacial antes do ``update``.
+        """
+
+        live = np.flatnonzero(self.active)
+        if live.size == 0:
+            return None
+        x = self.x[live]
+        y = self.y[live]
+        end_x = x + self.vx[live] * delta_time
+        end_y = y + self.vy[live] * delta_time
+        half = self.half[live]
+        left = math.floor(float((np.minimum(x, end_x) - half).min()))
+        top = math.floor(float((np.minimum(y, end_y) - half).min()))
+        right = math.ceil(float((np.maximum(x, end_x) + half).max()))
+        bottom = math.ceil(float((np.maximum(y, end_y) + half).max()))
+        return pygame.Rect(left, top, right - left + 1, bottom - top + 1)
+
+    def update(
+        self,
+        delta_time: float,
+        targets: Mapping[int, Sequence[pygame.Rect]] | None = None,
+    ) -> ProjectileHits:
+        """Move todos os projéteis e resolve paredes, alvos e fim de vida.
+
+        ``targets`` associa cada dono à lista de retângulos que seus projéteis
+        podem atingir (por exemplo inimigos para ``OWNER_PLAYER`` e o player
+        para ``OWNER_ENEMY``). Projéteis que batem em parede, esgotam
+        ``pierce`` ou o tempo de vida são liberados; o dano dos acertos
+        retornados fica a cargo de quem chama.
+        """
+
+        live = np.flatnonzero(self.active)
+        if live.size == 0 or delta_time <= 0:
+            return self._no_hits()
+
+        x = self.x[live]
+        y = self.y[live]
+        self.prev_x[live] = x
+        self.prev_y[live] = y
+        dx = self.vx[live] * delta_time
+        dy = self.vy[live] * delta_time
+        half = self.half[live]
+
+        remaining = self.lifetime[live]
+        t_life = np.clip(remaining / delta_time, 0.0, 1.0)
+        t_wall = self._sweep_walls(x, y, dx, dy, half)
+        hit_wall = t_wall < t_life
+        t_end = np.minimum(t_wall, t_life)
+
+        pairs = self._find_hits(live, x, y, dx, dy, half, t_end, targets or {})
+        local, target, owner, t_hit = pairs
+        hits_left = self.hits_left[live]
+        used = np.bincount(local, minlength=live.size)
+        exhausted = (used >= hits_left) & (used > 0)
+        if exhausted.any():
+            # Sem perfuração restante, o projétil para no último alvo atingido.
+            t_stop = np.zeros(live.size)
+            np.maximum.at(t_stop, local, t_hit)
+            t_end = np.where(exhausted, t_stop, t_end)
+            hit_wall &= ~exhausted
+
+        self.x[live] = x + dx * t_end
+        self.y[live] = y + dy * t_end
+        self.lifetime[live] = remaining - delta_time
+        self.hits_left[live] = hits_left - used
+        self.fresh[live] = False
+
+        ended_life = ~hit_wall & ~exhausted & (remaining <= delta_time)
+        dead = hit_wall | exhausted | ended_life
+        self.wall_hits += int(hit_wall.sum())
+        self.expired += int(ended_life.sum())
+        self.target_hits += int(local.size)
+        if dead.any():
+            dead_slots = live[dead]
+            self.active[dead_slots] = False
+            self._free.extend(dead_slots[::-1].tolist())
+            self._count -= int(dead_slots.size)
+
+        slots = live[local]
+        return ProjectileHits(
+            slots,
+            owner,
+            target,
+            self.damage[slots],
+            x[local] + dx[local] * t_hit,
+            y[local] + dy[local] * t_hit,
+        )
+
+    def screen_bounds(self, camera: "Camera", alpha: float = 1.0) -> pygame.Rect | None:
+        """Área da tela coberta por ``draw``, ou ``None`` sem projéteis."""
+
+        live, left, top, size = self._screen_rects(camera, alpha)
+        if live.size == 0:
+            return None
+        x0 = int(left.min())
+        y0 = int(top.min())
+        return pygame.Rect(
+            x0, y0, int((left + size).max()) - x0, int((top + size).max()) - y0
+        )
+
+    def screen_signature(self, camera: "Camera", alpha: float = 1.0) -> bytes:
+        """Bytes que mudam sempre que algum projétil muda de lugar na tela."""
+
+        live, left, top, size = self._screen_rects(camera, alpha)
+        return np.stack((left, top, size, self.owner[live])).tobytes()
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        camera: "Camera",
+        alpha: float = 1.0,
+        atlas: "TextureAtlas | None" = None,
+    ) -> None:
+        """Desenha todos os projéteis com um ``fblits`` por tipo.
+
+        Com ``atlas`` os sprites saem dele; sem, de um cache próprio.
+        """
+
+        live, left, top, size = self._screen_rects(camera, alpha)
+        if live.size == 0:
+            return
+        owner = self.owner[live]
+        blit = surface.fblits if hasattr(surface, "fblits") else surface.blits
+        for kind_owner, kind_size in set(zip(owner.tolist(), size.tolist())):
+            mask = (owner == kind_owner) & (size == kind_size)
+            sprite = self._sprite(kind_owner, kind_size, atlas)
+            positions = zip(left[mask].tolist(), top[mask].tolist())
+            blit([(sprite, position) for position in positions])
+
+    def stats(self) -> dict[str, float]:
+        """Contadores no formato aceito pelo ``FrameProfiler``."""
+
+        return {
+            "live": self._count,
+            "capacity": self._capacity,
+            "wall_hits": self.wall_hits,
+            "target_hits": self.target_hits,
+            "expired": self.expired,
+        }
+
+    def _screen_rects(self, camera: "Camera", alpha: float):
+        live = np.flatnonzero(self.active)
+        alpha = min(1.0, max(0.0, alpha))
+        x = self.prev_x[live] + (self.x[live] - self.prev_x[live]) * alpha
+        y = self.prev_y[live] + (self.y[live] - self.prev_y[live]) * alpha
+        half = self.half[live]
+        size = np.rint(half * 2).astype(np.int64)
+        left = np.floor(x - half).astype(np.int64) - int(camera.render_position.x)
+        top = np.floor(y - half).astype(np.int64) - int(camera.render_position.y)
+        return live, left, top, size
+
+    def _sprite(
+        self, owner: int, size: int, atlas: "TextureAtlas | None"
+    ) -> pygame.Surface:
+        key = ("projectile", owner, size)
+        if atlas is not None:
+            sprite = atlas.region(key)
+            if sprite is None:
+                sprite = atlas.add(key, _bake_sprite(owner, size))
+            return sprite
+        sprite = self._sprites.get((owner, size))
+        if sprite is None:
+            sprite = self._sprites[(owner, size)] = _bake_sprite(owner, size)
+        return sprite
+
+    def _sweep_walls(self, x, y, dx, dy, half):
+        """Fração do passo (0..1) até o primeiro tile sólido; 1 sem colisão.
+
+        O passo é fatiado para que cada fatia ande no máximo um tile por eixo;
+        em cada fatia só os tiles tocados pela caixa varrida são testados.
+        """
+
+        tile = self.tile_size
+        t_hit = np.ones(x.shape)
+        pending = np.ones(x.shape, dtype=bool)
+        longest = float(np.maximum(np.abs(dx), np.abs(dy)).max())
+        slices = max(1, math.ceil(longest / tile))
+        for index in range(slices):
+            start = index / slices
+            end = (index + 1) / slices
+            start_x = x + dx * start
+            start_y = y + dy * start
+            end_x = x + dx * end
+            end_y = y + dy * end
+            first_x = np.floor((np.minimum(start_x, end_x) - half) / tile).astype(np.int64)
+            last_x = np.floor((np.maximum(start_x, end_x) + half) / tile).astype(np.int64)
+            first_y = np.floor((np.minimum(start_y, end_y) - half) / tile).astype(np.int64)
+            last_y = np.floor((np.maximum(start_y, end_y) + half) / tile).astype(np.int64)
+            span_x = int((last_x - first_x)[pending].max()) + 1
+            span_y = int((last_y - first_y)[pending].max()) + 1
+
+            best = np.full(x.shape, np.inf)
+            for offset_y in range(span_y):
+                row = first_y + offset_y
+                for offset_x in range(span_x):
+                    column = first_x + offset_x
+                    candidates = (
+                        pending
+                        & (column <= last_x)
+                        & (row <= last_y)
+                        & self._solid_at(column, row)
+                    )
+                    if not candidates.any():
+                        continue
+                    t = _entry_time(
+                        x,
+                        y,
+                        dx,
+                        dy,
+                        column * tile - half,
+                        row * tile - half,
+                        (column + 1) * tile + half,
+                        (row + 1) * tile + half,
+                    )
+                    best = np.where(candidates & (t < best), t, best)
+
+            found = pending & (best <= 1.0)
+            t_hit = np.where(found, best, t_hit)
+            pending &= ~found
+            if not pending.any():
+                break
+        return t_hit
+
+    def _find_hits(self, live, x, y, dx, dy, half, t_end, targets):
+        """Pares (projétil, alvo) atingidos neste passo, já limitados por ``pierce``.
+
+        Retorna arrays de índice local (em ``live``), índice do alvo, dono e
+        fração do passo do impacto.
+        """
+
+        owners = self.owner[live]
+        fresh = self.fresh[live]
+        all_local, all_target, all_owner, all_t = [], [], [], []
+        for owner, rects in targets.items():
+            mine = np.flatnonzero(owners == owner)
+            if mine.size == 0 or len(rects) == 0:
+                continue
+            boxes = np.array(
+                [(rect.left, rect.top, rect.right, rect.bottom) for rect in rects],
+                dtype=np.float64,
+            )
+            order = np.argsort(boxes[:, 0], kind="stable")
+            lefts = boxes[order, 0]
+            widest = float((boxes[:, 2] - boxes[:, 0]).max())
+
+            # Sort-and-sweep: alvos cuja faixa em X cruza a do trajeto.
+            end_x = x[mine] + dx[mine] * t_end[mine]
+            low = np.minimum(x[mine], end_x) - half[mine]
+            high = np.maximum(x[mine], end_x) + half[mine]
+            first = np.searchsorted(lefts, low - widest, side="left")
+            last = np.searchsorted(lefts, high, side="left")
+            counts = last - first
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            local = np.repeat(mine, counts)
+            starts = np.repeat(first - (np.cumsum(counts) - counts), counts)
+            target = order[starts + np.arange(total)]
+
+            # Corta pelas caixas varridas antes do teste exato, que é mais caro.
+            box = boxes[target]
+            end_y = y[local] + dy[local] * t_end[local]
+            h = half[local]
+            near = (
+                (box[:, 2] > np.repeat(low, counts))
+                & (box[:, 1] < np.maximum(y[local], end_y) + h)
+                & (box[:, 3] > np.minimum(y[local], end_y) - h)
+            )
+            local = local[near]
+            target = target[near]
+            box = box[near]
+            h = half[local]
+            t = _entry_time(
+                x[local],
+                y[local],
+                dx[local],
+                dy[local],
+                box[:, 0] - h,
+                box[:, 1] - h,
+                box[:, 2] + h,
+                box[:, 3] + h,
+                allow_inside=fresh[local],
+            )
+            valid = t <= t_end[local]
+            all_local.append(local[valid])
+            all_target.append(target[valid])
+            all_owner.append(np.full(int(valid.sum()), owner, dtype=np.int64))
+            all_t.append(t[valid])
+
+        if not all_local:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty, np.empty(0)
+
+        local = np.concatenate(all_local)
+        target = np.concatenate(all_target)
+        owner = np.concatenate(all_owner)
+        t = np.concatenate(all_t)
+
+        # Em cada projétil, só os primeiros ``hits_left`` alvos em ordem de impacto.
+        order = np.lexsort((target, t, local))
+        local, target, owner, t = local[order], target[order], owner[order], t[order]
+        group_start = np.r_[True, local[1:] != local[:-1]]
+        starts = np.maximum.accumulate(np.where(group_start, np.arange(local.size), 0))
+        rank = np.arange(local.size) - starts
+        keep = rank < self.hits_left[live][local]
+        return local[keep], target[keep], owner[keep], t[keep]
+
+    def _solid_at(self, columns, rows):
+        height, width = self.solid.shape
+        if width == 0 or height == 0:
+            return np.ones(columns.shape, dtype=bool)
+        inside = (columns >= 0) & (columns < width) & (rows >= 0) & (rows < height)
+        safe_columns = np.clip(columns, 0, width - 1)
+        safe_rows = np.clip(rows, 0, height - 1)
+        # Fora do mapa conta como parede, para nada escapar do mundo.
+        return ~inside | self.solid[safe_rows, safe_columns]
+
+    def _no_hits(self) -> ProjectileHits:
+        empty = np.empty(0, dtype=np.int64)
+        return ProjectileHits(empty, empty, empty, np.empty(0), np.empty(0), np.empty(0))
+
+    def _allocate(self, capacity: int) -> None:
+        """Cresce os arrays preservando os slots existentes."""
+
+        def grow(name: str, dtype, fill) -> None:
+            array = np.full(capacity, fill, dtype=dtype)
+            if self._capacity:
+                array[: self._capacity] = getattr(self, name)
+            setattr(self, name, array)
+
+        grow("x", np.float64, 0.0)
+        grow("y", np.float64, 0.0)
+        grow("prev_x", np.float64, 0.0)
+        grow("prev_y", np.float64, 0.0)
+        grow("vx", np.float64, 0.0)
+        grow("vy", np.float64, 0.0)
+        grow("half", np.float64, 0.0)
+        grow("lifetime", np.float64, 0.0)
+        grow("damage", np.float64, 0.0)
+        grow("owner", np.int64, 0)
+        grow("hits_left", np.int64, 0)
+        grow("fresh", bool, False)
+        grow("active", bool, False)
+
+        # Slots livres em ordem decrescente para que ``pop`` devolva o menor.
+        self._free = list(range(capacity - 1, self._capacity - 1, -1)) + self._free
+        self._capacity = capacity
+
+
+def _entry_time(x, y, dx, dy, left, top, right, bottom, allow_inside=None):
+    """Fração do segmento em que o ponto ``(x, y)`` entra na caixa (slab test).
+
+    A caixa já vem expandida pela metade do projétil (soma de Minkowski).
+    Retorna ``inf`` quando não há entrada em ``[0, 1]``; encostar na borda não
+    conta. Começar dentro da caixa conta como ``0`` onde ``allow_inside`` é
+    verdadeiro (por padrão em todos).
+    """
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        near_x, far_x = _slab(x, dx, left, right)
+        near_y, far_y = _slab(y, dy, top, bottom)
+    near = np.maximum(near_x, near_y)
+    far = np.minimum(far_x, far_y)
+    hit = (near < far) & (far > 0.0) & (near <= 1.0)
+    inside = near < 0.0
+    if allow_inside is not None:
+        hit &= ~inside | allow_inside
+    return np.where(hit, np.maximum(near, 0.0), np.inf)
+
+
+def _slab(origin, delta, low, high):
+    moving = delta != 0
+    t_low = (low - origin) / np.where(moving, delta, 1.0)
+    t_high = (high - origin) / np.where(moving, delta, 1.0)
+    between = (origin > low) & (origin < high)
+    near = np.where(moving, np.minimum(t_low, t_high), np.where(between, -np.inf, np.inf))
+    far = np.where(moving, np.maximum(t_low, t_high), np.where(between, np.inf, -np.inf))
+    return near, far
+
+
+def _bake_sprite(owner: int, size: int) -> pygame.Surface:
+    sprite = pygame.Surface((size, size))
+    sprite.fill(PROJECTILE_COLORS.get(owner, PROJECTILE_COLORS[OWNER_PLAYER]))
+    return sprite
@@ -0,0 +1,211 @@
+"""Hash espacial dinâmico para consultas de área sobre entidades móveis."""
+
+from __future__ import annotations
+
+import math
+from typing import Generic, Hashable, Iterator, TypeVar
+
+import pygame
+
+T = TypeVar("T", bound=Hashable)
+
+CellRange = tuple[int, int, int, int]
+
+
+class SpatialHash(Generic[T]):
+    """Distribui objetos em células uniformes a partir do seu ``Rect``.
+
+    Cada objeto guarda uma cópia do retângulo registrado e o intervalo de
+    células que ocupa, de modo que ``update`` só mexe nas células quando o
+    objeto realmente muda de célula e ``remove`` é O(1) no número de objetos.
+    As consultas devolvem os objetos na ordem em que foram inseridos, o que
+    mantém determinística qualquer lógica que dependa da ordem de iteração.
+    """
+
+    def __init__(self, cell_size: int) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size precisa ser positivo")
+
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], dict[T, None]] = {}
+        self._rects: dict[T, pygame.Rect] = {}
+        self._ranges: dict[T, CellRange] = {}
+        self._order: dict[T, int] = {}
+        self._next_order = 0
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __contains__(self, obj: object) -> bool:
+        return obj in self._rects
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._rects)
+
+    def insert(self, obj: T, rect: pygame.Rect) -> None:
+        """Registra ``obj`` ocupando ``rect``; reinserir equivale a ``update``."""
+
+        if obj in self._rects:
+            self.update(obj, rect)
+            return
+
+        cell_range = self._range_for(rect)
+        self._rects[obj] = rect.copy()
+        self._ranges[obj] = cell_range
+        self._order[obj] = self._next_order
+        self._next_order += 1
+        for cell in self._iter_cells(cell_range):
+            self._cells.setdefault(cell, {})[obj] = None
+
+    def update(self, obj: T, rect: pygame.Rect) -> None:
+        """Atualiza a posição registrada de ``obj`` (insere se for novo)."""
+
+        stored = self._rects.get(obj)
+        if stored is None:
+            self.insert(obj, rect)
+            return
+
+        stored.update(rect)
+        cell_range = self._range_for(rect)
+        old_range = self._ranges[obj]
+        if cell_range == old_range:
+            return
+
+        self._unlink(obj, old_range)
+        self._ranges[obj] = cell_range
+        for cell in self._iter_cells(cell_range):
+            self._cells.setdefault(cell, {})[obj] = None
+
+    def remove(self, obj: T) -> None:
+        """Remove ``obj`` do índice; ignora objetos desconhecidos."""
+
+        if self._rects.pop(obj, None) is None:
+            return
+
+        self._unlink(obj, self._ranges.pop(obj))
+        del self._order[obj]
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._rects.clear()
+        self._ranges.clear()
+        self._order.clear()
+
+    def rect_of(self, obj: T) -> pygame.Rect | None:
+        """Retorna o retângulo registrado para ``obj`` (ou ``None``)."""
+
+        return self._rects.get(obj)
+
+    def query_rect(self, rect: pygame.Rect) -> list[T]:
+        """Objetos cujo retângulo intersecta ``rect``."""
+
+        rects = self._rects
+        return [
+            obj
+            for obj in self._candidates(self._range_for(rect))
+            if rects[obj].colliderect(rect)
+        ]
+
+    def query_radius(self, center: tuple[float, float], radius: float) -> list[T]:
+        """Objetos cujo retângulo toca o círculo de ``radius`` em ``center``."""
+
+        cx, cy = center
+        bounds = pygame.Rect(
+            int(cx - radius), int(cy - radius), int(radius * 2) + 2, int(radius * 2) + 2
+        )
+        radius_sq = radius * radius
+        found: list[T] = []
+        for obj in self._candidates(self._range_for(bounds)):
+            rect = self._rects[obj]
+            nearest_x = min(max(cx, rect.left), rect.right)
+            nearest_y = min(max(cy, rect.top), rect.bottom)
+            dx = cx - nearest_x
+            dy = cy - nearest_y
+            if dx * dx + dy * dy <= radius_sq:
+                found.append(obj)
+        return found
+
+    def query_cone(
+        self,
+        origin: tuple[float, float],
+        direction: tuple[float, float],
+        radius: float,
+        half_angle_degrees: float,
+    ) -> list[T]:
+        """Objetos dentro do raio cujo centro cai no cone a partir de ``origin``."""
+
+        dir_x, dir_y = direction
+        length = math.hypot(dir_x, dir_y)
+        if length == 0:
+            return self.query_radius(origin, radius)
+
+        dir_x /= length
+        dir_y /= length
+        min_cos = math.cos(math.radians(half_angle_degrees))
+        found: list[T] = []
+        for obj in self.query_radius(origin, radius):
+            center_x, center_y = self._rects[obj].center
+            to_x = center_x - origin[0]
+            to_y = center_y - origin[1]
+            distance = math.hypot(to_x, to_y)
+            if distance == 0 or (to_x * dir_x + to_y * dir_y) / distance >= min_cos:
+                found.append(obj)
+        return found
+
+    def query_segment(
+        self, start: tuple[float, float], end: tuple[float, float], width: float = 0
+    ) -> list[T]:
+        """Objetos atravessados pelo segmento ``start``-``end`` com espessura ``width``.
+
+        Útil para projéteis perfurantes: o teste usa ``Rect.clipline`` contra o
+        retângulo de cada candidato inflado pela espessura.
+        """
+
+        pad = int(math.ceil(width))
+        bounds = pygame.Rect(
+            int(min(start[0], end[0])) - pad,
+            int(min(start[1], end[1])) - pad,
+            int(abs(end[0] - start[0])) + pad * 2 + 2,
+            int(abs(end[1] - start[1])) + pad * 2 + 2,
+        )
+        found: list[T] = []
+        for obj in self._candidates(self._range_for(bounds)):
+            if self._rects[obj].inflate(pad, pad).clipline(start, end):
+                found.append(obj)
+        return found
+
+    def _candidates(self, cell_range: CellRange) -> list[T]:
+        seen: dict[T, None] = {}
+        for cell in self._iter_cells(cell_range):
+            bucket = self._cells.get(cell)
+            if bucket:
+                seen.update(bucket)
+        if len(seen) < 2:
+            return list(seen)
+        order = self._order
+        return sorted(seen, key=order.__getitem__)
+
+    def _unlink(self, obj: T, cell_range: CellRange) -> None:
+        for cell in self._iter_cells(cell_range):
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                continue
+            bucket.pop(obj, None)
+            if not bucket:
+                del self._cells[cell]
+
+    def _range_for(self, rect: pygame.Rect) -> CellRange:
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size if rect.width > 0 else rect.left // size,
+            (rect.bottom - 1) // size if rect.height > 0 else rect.top // size,
+        )
+
+    @staticmethod
+    def _iter_cells(cell_range: CellRange) -> Iterator[tuple[int, int]]:
+        first_x, first_y, last_x, last_y = cell_range
+        for cell_y in range(first_y, last_y + 1):
+            for cell_x in range(first_x, last_x + 1):
+                yield (cell_x, cell_y)
@@ -0,0 +1,237 @@
+"""Streaming do mundo em chunks ao redor da câmera."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Sequence
+
+import pygame
+
+from systems.collision_grid import CollisionGrid
+from systems.wall_merge import merge_tiles
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para type checkers
+    from core.tile_layer import ChunkedTileLayer
+
+ChunkKey = tuple[int, int]
+# Inimigo adormecido: centro em pixels e vida (``None`` = vida cheia).
+DormantEnemy = tuple[tuple[int, int], "float | None"]
+
+
+class ChunkData:
+    """Resultado do carregamento de um chunk, montado fora da thread principal."""
+
+    __slots__ = ("key", "colliders", "surface")
+
+    def __init__(
+        self,
+        key: ChunkKey,
+        colliders: list[pygame.Rect],
+        surface: pygame.Surface | None,
+    ) -> None:
+        self.key = key
+        self.colliders = colliders
+        self.surface = surface
+
+
+class WorldStreamer:
+    """Mantém residentes só os chunks próximos de um ponto (o centro da câmera).
+
+    Chunks a até ``load_radius`` chunks (distância de Chebyshev) são
+    carregados: colisores mesclados entram na ``collision_world``, a superfície
+    do chunk é preparada para a ``tile_layer`` e os inimigos adormecidos do
+    chunk ficam disponíveis em ``take_dormant``. Um chunk só é descarregado
+    quando passa de ``load_radius + unload_margin``, a histerese que evita
+    carregar e descarregar sem parar quando a câmera anda sobre uma borda.
+
+    Com ``threaded`` a montagem dos chunks roda em uma thread de trabalho e a
+    thread principal apenas integra resultados prontos, no máximo
+    ``max_integrations`` por frame. Sem thread o carregamento é feito na hora,
+    o que mantém a simulação determinística (benchmarks e replays).
+    """
+
+    def __init__(
+        self,
+        tilemap: Sequence[Sequence[int]],
+        tile_size: int,
+        collision_world: CollisionGrid,
+        tile_layer: "ChunkedTileLayer | None" = None,
+        enemy_spawns: Sequence[tuple[int, int]] = (),
+        chunk_tiles: int = 16,
+        load_radius: int = 1,
+        unload_margin: int = 1,
+        threaded: bool = True,
+        max_integrations: int = 2,
+        solid: int = 1,
+    ) -> None:
+        if tile_layer is not None and tile_layer.chunk_tiles != chunk_tiles:
+            raise ValueError("chunk_tiles precisa ser igual ao da tile_layer")
+
+        self.tilemap = tilemap
+        self.tile_size = tile_size
+        self.collision_world = collision_world
+        self.tile_layer = tile_layer
+        self.chunk_tiles = chunk_tiles
+        self.chunk_pixels = chunk_tiles * tile_size
+        self.load_radius = load_radius
+        self.unload_margin = unload_margin
+        self.max_integrations = max_integrations
+        self.solid = solid
+        rows = len(tilemap)
+        columns = max((len(row) for row in tilemap), default=0)
+        self.chunks_x = -(-columns // chunk_tiles)
+        self.chunks_y = -(-rows // chunk_tiles)
+
+        self.loaded: dict[ChunkKey, list[int]] = {}
+        self._pending: dict[ChunkKey, Future[ChunkData]] = {}
+        self._dormant: dict[ChunkKey, list[DormantEnemy]] = {}
+        for x, y in enemy_spawns:
+            center = (x * tile_size + tile_size // 2, y * tile_size + tile_size // 2)
+            self._dormant.setdefault(self.chunk_of(center), []).append((center, None))
+
+        self._executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="chunk-stream")
+            if threaded
+            else None
+        )
+        self.loads_total = 0
+        self.unloads_total = 0
+        self.last_integrate_ms = 0.0
+
+    def chunk_of(self, position: tuple[float, float]) -> ChunkKey:
+        size = self.chunk_pixels
+        return (int(position[0] // size), int(position[1] // size))
+
+    def chunk_rect(self, key: ChunkKey) -> pygame.Rect:
+        size = self.chunk_pixels
+        return pygame.Rect(key[0] * size, key[1] * size, size, size)
+
+    def update(
+        self, center: tuple[float, float], blocking: bool = False
+    ) -> tuple[list[ChunkKey], list[ChunkKey]]:
+        """Pede, integra e descarrega chunks; retorna ``(carregados, descarregados)``.
+
+        Com ``blocking`` espera todos os chunks pedidos ficarem prontos, útil
+        no início da cena para o player não nascer sem paredes ao redor.
+        """
+
+        center_key = self.chunk_of(center)
+        for key in self._keys_within(center_key, self.load_radius):
+            if key not in self.loaded and key not in self._pending:
+                self._request(key)
+
+        unloaded: list[ChunkKey] = []
+        keep = self.load_radius + self.unload_margin
+        for key in list(self.loaded):
+            if self._distance(key, center_key) > keep:
+                self._unload(key)
+                unloaded.append(key)
+        for key in list(self._pending):
+            if self._distance(key, center_key) > keep:
+                self._pending.pop(key).cancel()
+
+        start = time.perf_counter()
+        loaded: list[ChunkKey] = []
+        for key, future in list(self._pending.items()):
+            if not blocking and (
+                len(loaded) >= self.max_integrations or not future.done()
+            ):
+                continue
+            del self._pending[key]
+            self._integrate(future.result())
+            loaded.append(key)
+        self.last_integrate_ms = (time.perf_counter() - start) * 1000.0
+        return loaded, unloaded
+
+    def take_dormant(self, key: ChunkKey) -> list[DormantEnemy]:
+        """Retira os inimigos adormecidos de um chunk para acordá-los."""
+
+        return self._dormant.pop(key, [])
+
+    def store_dormant(self, key: ChunkKey, enemies: list[DormantEnemy]) -> None:
+        """Guarda inimigos de um chunk descarregado até ele voltar."""
+
+        if enemies:
+            self._dormant.setdefault(key, []).extend(enemies)
+
+    def is_loaded(self, position: tuple[float, float]) -> bool:
+        return self.chunk_of(position) in self.loaded
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "loaded": len(self.loaded),
+            "pending": len(self._pending),
+            "dormant": sum(len(enemies) for enemies in self._dormant.values()),
+            "integrate_ms": self.last_integrate_ms,
+        }
+
+    def shutdown(self) -> None:
+        """Cancela carregamentos pendentes e encerra a thread de trabalho."""
+
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _request(self, key: ChunkKey) -> None:
+        if self._executor is None:
+            future: Future[ChunkData] = Future()
+            future.set_result(self._build(key))
+        else:
+            future = self._executor.submit(self._build, key)
+        self._pending[key] = future
+
+    def _build(self, key: ChunkKey) -> ChunkData:
+        """Monta colisores e superfície de um chunk sem tocar no estado compartilhado."""
+
+        chunk_x, chunk_y = key
+        first_col = chunk_x * self.chunk_tiles
+        first_row = chunk_y * self.chunk_tiles
+        grid = [
+            row[first_col : first_col + self.chunk_tiles]
+            for row in self.tilemap[first_row : first_row + self.chunk_tiles]
+        ]
+        tile = self.tile_size
+        colliders = [
+            pygame.Rect(
+                (first_col + x) * tile, (first_row + y) * tile, width * tile, rows * tile
+            )
+            for x, y, width, rows in merge_tiles(grid, self.solid)
+        ]
+        surface = None
+        if self.tile_layer is not None:
+            surface = self.tile_layer.prepare_chunk(chunk_x, chunk_y)
+        return ChunkData(key, colliders, surface)
+
+    def _integrate(self, chunk: ChunkData) -> None:
+        self.loaded[chunk.key] = [
+            self.collision_world.add(collider) for collider in chunk.colliders
+        ]
+        if chunk.surface is not None and self.tile_layer is not None:
+            self.tile_layer.adopt_chunk(*chunk.key, chunk.surface)
+        self.loads_total += 1
+
+    def _unload(self, key: ChunkKey) -> None:
+        for index in self.loaded.pop(key):
+            self.collision_world.remove(index)
+        if self.tile_layer is not None:
+            self.tile_layer.drop_chunk(*key)
+        self.unloads_total += 1
+
+    def _keys_within(self, center: ChunkKey, radius: int) -> list[ChunkKey]:
+        return [
+            (chunk_x, chunk_y)
+            for chunk_y in range(
+                max(0, center[1] - radius), min(self.chunks_y, center[1] + radius + 1)
+            )
+            for chunk_x in range(
+                max(0, center[0] - radius), min(self.chunks_x, center[0] + radius + 1)
+            )
+        ]
+
+    @staticmethod
+    def _distance(key: ChunkKey, center: ChunkKey) -> int:
+        return max(abs(key[0] - center[0]), abs(key[1] - center[1]))
@@ -0,0 +1,394 @@
+"""Armazenamento vetorizado (struct-of-arrays) para hordas de inimigos.
+
+Requer ``numpy``, que é uma dependência opcional do protótipo; sem ela o
+módulo continua importável, mas ``EnemySwarm`` não pode ser instanciado. O
+``numpy`` só é importado quando o primeiro ``EnemySwarm`` é criado, para não
+pesar na partida do jogo quando o enxame não é usado.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator, Sequence
+
+import pygame
+
+from entities.enemy import Enemy
+
+if TYPE_CHECKING:  # pragma: no cover - apenas para type checkers
+    from systems.flow_field import FlowField
+
+# Preenchido por ``_import_numpy`` no primeiro ``EnemySwarm``.
+np = None
+
+
+def _import_numpy() -> None:
+    global np
+    if np is not None:
+        return
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - dependência opcional
+        raise ImportError("EnemySwarm requer numpy (pip install numpy)") from None
+    np = numpy
+
+
+class SwarmEnemy:
+    """Visão de um inimigo do enxame com a mesma interface de ``Enemy``.
+
+    Os atributos são propriedades que leem e escrevem direto nos arrays do
+    ``EnemySwarm``, então a cena pode tratar a horda como uma lista comum.
+    """
+
+    __slots__ = ("_swarm", "index")
+
+    def __init__(self, swarm: "EnemySwarm", index: int) -> None:
+        self._swarm = swarm
+        self.index = index
+
+    @property
+    def rect(self) -> pygame.Rect:
+        swarm = self._swarm
+        i = self.index
+        size = int(swarm.size[i])
+        return pygame.Rect(int(swarm.x[i]), int(swarm.y[i]), size, size)
+
+    @rect.setter
+    def rect(self, value: pygame.Rect) -> None:
+        self._swarm.x[self.index] = value.x
+        self._swarm.y[self.index] = value.y
+
+    @property
+    def previous_topleft(self) -> tuple[int, int]:
+        return (int(self._swarm.prev_x[self.index]), int(self._swarm.prev_y[self.index]))
+
+    @previous_topleft.setter
+    def previous_topleft(self, value: tuple[int, int]) -> None:
+        self._swarm.prev_x[self.index] = value[0]
+        self._swarm.prev_y[self.index] = value[1]
+
+    @property
+    def alive(self) -> bool:
+        return bool(self._swarm.alive[self.index])
+
+    @alive.setter
+    def alive(self, value: bool) -> None:
+        self._swarm.alive[self.index] = value
+
+    @property
+    def health(self) -> float:
+        return float(self._swarm.health[self.index])
+
+    @health.setter
+    def health(self, value: float) -> None:
+        self._swarm.health[self.index] = value
+
+    @property
+    def max_health(self) -> float:
+        return float(self._swarm.max_health[self.index])
+
+    @property
+    def speed(self) -> float:
+        return float(self._swarm.speed[self.index])
+
+    @property
+    def contact_damage(self) -> float:
+        return float(self._swarm.contact_damage[self.index])
+
+    @property
+    def hit_cooldown(self) -> float:
+        return float(self._swarm.hit_cooldown[self.index])
+
+    @property
+    def hit_timer(self) -> float:
+        return float(self._swarm.hit_timer[self.index])
+
+    @hit_timer.setter
+    def hit_timer(self, value: float) -> None:
+        self._swarm.hit_timer[self.index] = value
+
+    # A lógica de dano e desenho só depende dos atributos acima, então é
+    # reaproveitada diretamente de ``Enemy``.
+    try_hit = Enemy.try_hit
+    take_damage = Enemy.take_damage
+    draw = Enemy.draw
+    queue_draw = Enemy.queue_draw
+    screen_bounds = Enemy.screen_bounds
+
+
+class EnemySwarm:
+    """Inimigos guardados em arrays paralelos e atualizados em lote.
+
+    Posições são inteiras como em ``pygame.Rect`` e o passo de cada eixo é
+    arredondado da mesma forma que em ``move_with_collisions``, então as
+    trajetórias coincidem com as da classe ``Enemy`` em mapas de tiles. A
+    colisão é resolvida contra a grade de tiles sólidos (primeiro X, depois Y)
+    sem percorrer listas de colisores.
+    """
+
+    def __init__(
+        self,
+        tilemap: Sequence[Sequence[int]],
+        tile_size: int,
+        capacity: int = 256,
+        solid: int = 1,
+    ) -> None:
+        _import_numpy()
+
+        self.tile_size = tile_size
+        self.solid = np.array(
+            [[tile == solid for tile in row] for row in tilemap], dtype=bool
+        )
+        self._views: list[SwarmEnemy | None] = []
+        self._flow_version: tuple[int, int] | None = None
+        self._flow_next = None
+        self._free: list[int] = []
+        self._count = 0
+        self._capacity = 0
+        self._allocate(max(1, capacity))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[SwarmEnemy]:
+        return iter([view for view in self._views if view is not None])
+
+    def __contains__(self, enemy: object) -> bool:
+        if not isinstance(enemy, SwarmEnemy) or enemy._swarm is not self:
+            return False
+        return self._views[enemy.index] is enemy
+
+    def spawn(
+        self,
+        spawn_pos: tuple[int, int],
+        size: int = 28,
+        speed: float = 140.0,
+        health: int = 30,
+        contact_damage: float = 10.0,
+        hit_cooldown: float = 0.6,
+    ) -> SwarmEnemy:
+        """Cria um inimigo com os mesmos parâmetros padrão de ``Enemy``."""
+
+        if not self._free:
+            self._allocate(self._capacity * 2)
+
+        index = self._free.pop()
+        rect = pygame.Rect(0, 0, size, size)
+        rect.center = spawn_pos
+        self.x[index] = rect.x
+        self.y[index] = rect.y
+        self.prev_x[index] = rect.x
+        self.prev_y[index] = rect.y
+        self.size[index] = size
+        self.speed[index] = speed
+        self.max_health[index] = health
+        self.health[index] = float(health)
+        self.contact_damage[index] = contact_damage
+        self.hit_cooldown[index] = hit_cooldown
+        self.hit_timer[index] = 0.0
+        self.alive[index] = True
+        self.active[index] = True
+
+        view = SwarmEnemy(self, index)
+        self._views[index] = view
+        self._count += 1
+        return view
+
+    def remove(self, enemy: SwarmEnemy) -> None:
+        """Libera o slot do inimigo em O(1)."""
+
+        if enemy not in self:
+            raise ValueError("inimigo não pertence a este enxame")
+
+        index = enemy.index
+        self._views[index] = None
+        self.active[index] = False
+        self.alive[index] = False
+        self._free.append(index)
+        self._count -= 1
+
+    def store_previous(self) -> None:
+        """Copia as posições atuais para a interpolação de desenho."""
+
+        np.copyto(self.prev_x, self.x)
+        np.copyto(self.prev_y, self.y)
+
+    def update(
+        self,
+        delta_time: float,
+        player_center: tuple[float, float],
+        colliders: object = None,
+        flow_field: "FlowField | None" = None,
+        scheduled: Sequence[tuple[SwarmEnemy, float]] | None = None,
+    ) -> None:
+        """Avança temporizadores e move todos os inimigos vivos em direção ao player.
+
+        ``colliders`` é aceito apenas para manter a assinatura de ``Enemy``; a
+        colisão usa sempre a grade de tiles do enxame. Com ``flow_field`` o
+        alvo de cada inimigo é o próximo tile do caminho, amostrado em lote.
+        ``scheduled`` é a saída de ``AILevelOfDetail.schedule``: só os
+        inimigos listados atualizam, cada um com o seu tempo acumulado, e os
+        demais ficam parados, exatamente como no caminho com objetos ``Enemy``.
+        """
+
+        if scheduled is None:
+            active = self.active
+            delta = np.full(self._capacity, delta_time)
+        else:
+            count = len(scheduled)
+            indices = np.fromiter(
+                (enemy.index for enemy, _ in scheduled), np.int64, count
+            )
+            active = np.zeros(self._capacity, dtype=bool)
+            active[indices] = True
+            delta = np.zeros(self._capacity)
+            delta[indices] = np.fromiter(
+                (elapsed for _, elapsed in scheduled), np.float64, count
+            )
+        timers = self.hit_timer[active] - delta[active]
+        self.hit_timer[active] = np.maximum(0.0, timers)
+
+        moving = np.flatnonzero(active & self.alive)
+        if moving.size == 0:
+            return
+
+        x = self.x[moving]
+        y = self.y[moving]
+        size = self.size[moving]
+        half = size // 2
+        center_x = x + half
+        center_y = y + half
+        target_x, target_y = self._targets(center_x, center_y, player_center, flow_field)
+        dir_x = target_x - center_x.astype(np.float64)
+        dir_y = target_y - center_y.astype(np.float64)
+        length = np.sqrt(dir_x * dir_x + dir_y * dir_y)
+
+        has_direction = length > 0
+        safe_length = np.where(has_direction, length, 1.0)
+        speed = self.speed[moving]
+        elapsed = delta[moving]
+        step_x = np.rint(dir_x / safe_length * speed * elapsed).astype(np.int64)
+        step_y = np.rint(dir_y / safe_length * speed * elapsed).astype(np.int64)
+        step_x[~has_direction] = 0
+        step_y[~has_direction] = 0
+
+        x = self._resolve_axis(x, y, size, step_x, horizontal=True)
+        y = self._resolve_axis(y, x, size, step_y, horizontal=False)
+        self.x[moving] = x
+        self.y[moving] = y
+
+    def _targets(self, center_x, center_y, player_center, flow_field):
+        """Ponto que cada inimigo deve buscar neste passo."""
+
+        target_x = np.full(center_x.shape, float(player_center[0]))
+        target_y = np.full(center_y.shape, float(player_center[1]))
+        if flow_field is None:
+            return target_x, target_y
+
+        version = (id(flow_field), flow_field.version)
+        if version != self._flow_version:
+            self._flow_next = np.array(flow_field.next_tile, dtype=np.int64)
+            self._flow_version = version
+
+        width = flow_field.width
+        tile = flow_field.tile_size
+        tile_x = center_x // tile
+        tile_y = center_y // tile
+        inside = (
+            (tile_x >= 0) & (tile_x < width) & (tile_y >= 0) & (tile_y < flow_field.height)
+        )
+        next_index = np.full(center_x.shape, -1, dtype=np.int64)
+        if self._flow_next.size:
+            flat = np.where(inside, tile_y * width + tile_x, 0)
+            next_index = np.where(inside, self._flow_next[flat], -1)
+
+        routed = next_index >= 0
+        half = tile / 2
+        target_x = np.where(routed, (next_index % max(1, width)) * tile + half, target_x)
+        target_y = np.where(routed, (next_index // max(1, width)) * tile + half, target_y)
+        return target_x, target_y
+
+    def _resolve_axis(self, pos, other, size, step, horizontal: bool):
+        """Desloca ``pos`` por ``step`` e encosta na primeira parede atravessada.
+
+        Só são testadas as linhas/colunas de tiles em que o retângulo entra
+        neste passo; para retângulos que não começam dentro de paredes isso
+        equivale à varredura completa de ``move_with_collisions``.
+        """
+
+        tile = self.tile_size
+        moved = pos + step
+        forward = step > 0
+        backward = step < 0
+        if not (forward.any() or backward.any()):
+            return moved
+
+        old_lead = np.where(forward, (pos + size - 1) // tile, pos // tile)
+        new_lead = np.where(forward, (moved + size - 1) // tile, moved // tile)
+        cross_first = other // tile
+        cross_last = (other + size - 1) // tile
+
+        # Sem colisão, a linha "mais próxima" fica além do passo inteiro.
+        blocked = np.where(forward, new_lead + 1, new_lead - 1)
+        max_lines = int(np.abs(new_lead - old_lead).max())
+        max_cross = int((cross_last - cross_first).max()) + 1
+        for offset in range(1, max_lines + 1):
+            line = np.where(forward, old_lead + offset, old_lead - offset)
+            in_step = np.where(forward, line <= new_lead, line >= new_lead) & (
+                forward | backward
+            )
+            not_blocked_yet = np.where(forward, line < blocked, line > blocked)
+            candidates = in_step & not_blocked_yet
+            if not candidates.any():
+                continue
+            hit = np.zeros_like(candidates)
+            for cross_offset in range(max_cross):
+                cross = cross_first + cross_offset
+                within = candidates & (cross <= cross_last)
+                if horizontal:
+                    hit |= within & self._solid_at(line, cross)
+                else:
+                    hit |= within & self._solid_at(cross, line)
+            blocked = np.where(hit, line, blocked)
+
+        hit_forward = forward & (blocked <= new_lead)
+        hit_backward = backward & (blocked >= new_lead)
+        moved = np.where(hit_forward, blocked * tile - size, moved)
+        moved = np.where(hit_backward, (blocked + 1) * tile, moved)
+        return moved
+
+    def _solid_at(self, columns, rows):
+        height, width = self.solid.shape
+        inside = (columns >= 0) & (columns < width) & (rows >= 0) & (rows < height)
+        safe_columns = np.clip(columns, 0, max(0, width - 1))
+        safe_rows = np.clip(rows, 0, max(0, height - 1))
+        if width == 0 or height == 0:
+            return np.zeros_like(inside)
+        return inside & self.solid[safe_rows, safe_columns]
+
+    def _allocate(self, capacity: int) -> None:
+        """Cresce os arrays preservando os slots existentes."""
+
+        def grow(name: str, dtype, fill) -> None:
+            array = np.full(capacity, fill, dtype=dtype)
+            if self._capacity:
+                array[: self._capacity] = getattr(self, name)
+            setattr(self, name, array)
+
+        grow("x", np.int64, 0)
+        grow("y", np.int64, 0)
+        grow("prev_x", np.int64, 0)
+        grow("prev_y", np.int64, 0)
+        grow("size", np.int64, 0)
+        grow("speed", np.float64, 0.0)
+        grow("health", np.float64, 0.0)
+        grow("max_health", np.float64, 0.0)
+        grow("contact_damage", np.float64, 0.0)
+        grow("hit_cooldown", np.float64, 0.0)
+        grow("hit_timer", np.float64, 0.0)
+        grow("alive", bool, False)
+        grow("active", bool, False)
+
+        self._views.extend([None] * (capacity - self._capacity))
+        # Slots livres em ordem decrescente para que ``pop`` devolva o menor.
+        self._free = list(range(capacity - 1, self._capacity - 1, -1)) + self._free
+        self._capacity = capacity
@@ -0,0 +1,73 @@
+"""Compila os tiles sólidos de um tilemap em poucos retângulos de colisão."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import pygame
+
+TileRect = tuple[int, int, int, int]
+
+
+def merge_tiles(tilemap: Sequence[Sequence[int]], solid: int = 1) -> list[TileRect]:
+    """Agrupa tiles sólidos contíguos em retângulos ``(x, y, largura, altura)``.
+
+    Varredura gulosa linha a linha: a partir de cada tile sólido ainda livre,
+    estende a faixa para a direita e depois desce enquanto a linha inteira de
+    baixo também for sólida e livre. Os retângulos não se sobrepõem, cobrem
+    exatamente os mesmos tiles e saem em ordem de linha pelo canto superior
+    esquerdo, o que mantém a ordem de resolução das colisões determinística.
+    """
+
+    height = len(tilemap)
+    taken = [[False] * len(row) for row in tilemap]
+    merged: list[TileRect] = []
+
+    def free(x: int, y: int) -> bool:
+        row = tilemap[y]
+        return x < len(row) and row[x] == solid and not taken[y][x]
+
+    for y in range(height):
+        for x in range(len(tilemap[y])):
+            if not free(x, y):
+                continue
+
+            width = 1
+            while free(x + width, y):
+                width += 1
+
+            rows = 1
+            while y + rows < height and all(
+                free(column, y + rows) for column in range(x, x + width)
+            ):
+                rows += 1
+
+            for row in range(y, y + rows):
+                for column in range(x, x + width):
+                    taken[row][column] = True
+            merged.append((x, y, width, rows))
+    return merged
+
+
+def merge_walls(
+    tilemap: Sequence[Sequence[int]], tile_size: int, solid: int = 1
+) -> list[pygame.Rect]:
+    """Retângulos de colisão em pixels para os tiles sólidos já mesclados.
+
+    Serve tanto para a lista simples de ``move_with_collisions`` quanto para a
+    ``CollisionGrid``. Para retângulos que não começam dentro de uma parede o
+    resultado do movimento é o mesmo de um colisor por tile: em cada eixo o
+    retângulo encosta na borda mais próxima da área sólida, que é igual nas
+    duas representações.
+    """
+
+    return [
+        pygame.Rect(x * tile_size, y * tile_size, width * tile_size, rows * tile_size)
+        for x, y, width, rows in merge_tiles(tilemap, solid)
+    ]
+
+
+def count_solid(tilemap: Sequence[Sequence[int]], solid: int = 1) -> int:
+    """Quantidade de tiles sólidos, ou seja, de colisores antes da mescla."""
+
+    return sum(1 for row in tilemap for tile in row if tile == solid)
@@ -0,0 +1,6 @@
+"""Ferramentas de linha de comando (benchmarks e utilitários headless)."""
+
+import os
+
+# Mantém a saída das ferramentas limpa (ex.: ``--json`` lido por CI).
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
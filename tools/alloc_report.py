@@ -0,0 +1,125 @@
+"""Mede com ``tracemalloc`` a memória temporária dos caminhos quentes por chamada.
+
+Cada método quente é chamado muitas vezes; antes de cada chamada o pico do
+``tracemalloc`` é zerado e, depois, a diferença entre o pico e a memória no
+início da chamada é a memória temporária que ela precisou alocar. O próprio
+laço de medição custa cerca de 4 bytes, então um caminho sem alocações fica
+nesse valor. ``--max-bytes`` faz o script falhar (código 1) se algum caminho
+passar do limite, o que permite usá-lo como verificação em CI.
+
+Os caminhos quentes não criam listas, ``Rect`` nem ``Vector2`` em Python, mas
+algumas chamadas à API em C ainda deixam um objeto temporário de cerca de 72
+bytes cada: ``Vector2.update``/``Rect.update`` com argumentos posicionais, o
+``round`` do deslocamento em ``CollisionGrid.move_ip`` e o ``Rect`` devolvido
+por ``pygame.draw.rect``. Medidos assim, movimento, IA e câmera ficam entre
+~76 e ~92 bytes e o desenho em ~148 bytes (dois objetos ao mesmo tempo). O
+limite de 150 bytes do exemplo é o maior desses valores; caminhos que montam
+listas por chamada passam dele (``Player.move`` media ~216 bytes enquanto
+``CollisionGrid.move_ip`` montava listas de candidatos).
+
+Exemplo::
+
+    python -m tools.alloc_report --calls 2000 --max-bytes 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from typing import Callable
+
+import pygame
+
+from core.camera import Camera
+from core.game import Game
+from entities.enemy import Enemy
+from entities.pickup import LootPickup
+from entities.player import Player
+from tools.arena import make_bench_scene
+
+
+def transient_bytes(call: Callable[[], object], calls: int) -> float:
+    """Média do pico de memória temporária de ``call`` (em bytes por chamada)."""
+
+    for _ in range(16):
+        call()
+    total = 0
+    for _ in range(calls):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+        total += max(0, peak - current)
+    return total / calls
+
+
+def hot_paths(game: Game) -> dict[str, Callable[[], object]]:
+    scene = make_bench_scene(game, (32, 32), 64, seed=0)
+    game.set_scene(scene)
+    game.run_headless(30)
+
+    walls = scene.collision_world
+    player = Player((80, 80))
+    enemy = Enemy((400, 400))
+    pickup = LootPickup((120, 120), "coin")
+    camera = Camera(game.size)
+    surface = game.screen
+    right = pygame.Vector2(1, 0)
+    left = -right
+    steps = iter(range(sys.maxsize))
+
+    def move_player() -> None:
+        player.move(right if next(steps) % 40 < 20 else left, 1 / 60, walls)
+
+    def update_enemy() -> None:
+        enemy.update(1 / 60, player.rect.center, walls, scene.flow_field)
+
+    return {
+        "Player.move": move_player,
+        "Enemy.update": update_enemy,
+        "Enemy.draw": lambda: enemy.draw(surface, camera, 0.5),
+        "LootPickup.draw": lambda: pickup.draw(surface, camera),
+        "Camera.follow": lambda: camera.follow(player.rect.center),
+        "Camera.interpolate": lambda: camera.interpolate(0.5),
+        "GameScene.update": lambda: scene.update(1 / 60),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument(
+        "--max-bytes",
+        type=float,
+        default=None,
+        help="falha se algum método (exceto GameScene.update) passar deste valor",
+    )
+    args = parser.parse_args(argv)
+
+    game = Game(headless=True)
+    paths = hot_paths(game)
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        results = {name: transient_bytes(call, args.calls) for name, call in paths.items()}
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+
+    failed = False
+    for name, value in results.items():
+        over = (
+            args.max_bytes is not None
+            and name != "GameScene.update"
+            and value > args.max_bytes
+        )
+        failed = failed or over
+        print(f"{name:<20} {value:>10.1f} B/chamada{'  <- acima do limite' if over else ''}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""Mapas e cenas sintéticas usados pelos benchmarks headless."""
+
+from __future__ import annotations
+
+import random
+
+from core.game import Game
+from core.input import ScriptedInput
+from scenes.game_scene import GameScene
+
+BENCH_HP = 1_000_000.0
+
+
+def build_arena(
+    width: int, height: int, seed: int = 0, pillar_density: float = 0.08
+) -> list[list[int]]:
+    """Gera um mapa ``width`` x ``height`` com borda sólida e pilares aleatórios.
+
+    O canto superior esquerdo fica livre para o spawn do player.
+    """
+
+    if width < 3 or height < 3:
+        raise ValueError("o mapa precisa ter pelo menos 3x3 tiles")
+
+    rng = random.Random(seed)
+    tilemap = [[0] * width for _ in range(height)]
+    for x in range(width):
+        tilemap[0][x] = 1
+        tilemap[height - 1][x] = 1
+    for y in range(height):
+        tilemap[y][0] = 1
+        tilemap[y][width - 1] = 1
+
+    for y in range(2, height - 2, 2):
+        for x in range(2, width - 2, 2):
+            if rng.random() < pillar_density:
+                tilemap[y][x] = 1
+    tilemap[1][1] = 0
+    return tilemap
+
+
+def floor_tiles(tilemap: list[list[int]]) -> list[tuple[int, int]]:
+    return [
+        (x, y)
+        for y, row in enumerate(tilemap)
+        for x, tile in enumerate(row)
+        if tile == 0
+    ]
+
+
+def build_scenario(
+    map_size: tuple[int, int], enemy_count: int, seed: int = 0
+) -> tuple[list[list[int]], list[tuple[int, int]]]:
+    """Arena e spawns de inimigos sorteados a partir de ``seed``.
+
+    Ponto único da montagem usada por benchmarks, ``tools.balance`` e
+    ``tools.replay``: a mesma seed gera sempre o mesmo cenário em todos eles.
+    O tile de spawn do player (1, 1) nunca recebe inimigos.
+    """
+
+    tilemap = build_arena(*map_size, seed=seed)
+    rng = random.Random(seed)
+    candidates = [tile for tile in floor_tiles(tilemap) if tile != (1, 1)]
+    spawns = [rng.choice(candidates) for _ in range(enemy_count)]
+    return tilemap, spawns
+
+
+def make_bench_scene(
+    game: Game,
+    map_size: tuple[int, int],
+    enemy_count: int,
+    seed: int = 0,
+    use_swarm: bool = False,
+    streaming: bool = False,
+    ai_lod: bool = True,
+) -> GameScene:
+    """Cria uma ``GameScene`` com arena gerada, inimigos sorteados e patrulha.
+
+    O player recebe vida praticamente infinita para que a simulação não pare
+    em ``game_over`` no meio da medição.
+    """
+
+    tilemap, spawns = build_scenario(map_size, enemy_count, seed)
+    scene = GameScene(
+        game,
+        use_swarm=use_swarm,
+        tilemap=tilemap,
+        enemy_spawns=spawns,
+        input_source=ScriptedInput.patrol(),
+        streaming=streaming,
+        ai_lod=ai_lod,
+        seed=seed,
+    )
+    scene.player.max_hp = BENCH_HP
+    scene.player.hp = BENCH_HP
+    return scene
+
+
+def parse_size(text: str) -> tuple[int, int]:
+    """Converte ``"64"`` ou ``"64x32"`` em ``(largura, altura)``."""
+
+    width, _, height = text.lower().partition("x")
+    return (int(width), int(height or width))
@@ -0,0 +1,202 @@
+"""Roda simulações headless de balanceamento em paralelo e agrega por classe.
+
+Cada execução é uma ``GameScene`` com uma arena, spawns e loot sorteados a
+partir da própria seed, jogada por um bot roteirizado (``ChaseBot``) até o
+player morrer ou acabar o limite de ticks. As execuções são distribuídas entre
+processos (``ProcessPoolExecutor``) em lotes e sem estado compartilhado, então
+a vazão cresce quase linearmente com os núcleos; cada processo cria um único
+``Game`` headless e o reaproveita.
+
+Exemplo::
+
+    python -m tools.balance --seeds 200 --ticks 3600 --enemies 40
+    python -m tools.balance --classes warrior mage --workers 1 --seeds 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from core.game import Game
+from core.input import IDLE, InputFrame
+from scenes.game_scene import CLASSES_PATH, GameScene
+from tools.arena import build_scenario, parse_size
+
+SIGHT_RADIUS = 480.0
+
+
+class RunSpec(NamedTuple):
+    player_class: str
+    seed: int
+    map_size: tuple[int, int]
+    enemies: int
+    ticks: int
+
+
+class ChaseBot:
+    """Política simples: persegue o inimigo mais próximo e ataca ao alcance.
+
+    Sem inimigos à vista, vai até o item mais próximo; sem itens, fica parado.
+    Só lê o estado da cena, então a execução continua determinística.
+    """
+
+    def __init__(self) -> None:
+        self.scene: GameScene | None = None
+
+    def poll(self) -> InputFrame:
+        scene = self.scene
+        if scene is None:
+            return IDLE
+
+        player = scene.player
+        px, py = player.rect.center
+        enemies = scene.enemy_index.query_radius((px, py), SIGHT_RADIUS)
+        target = _nearest(enemies, px, py)
+        if target is None:
+            pickups = scene.pickup_index.query_radius((px, py), SIGHT_RADIUS)
+            target = _nearest(pickups, px, py)
+            if target is None:
+                return IDLE
+
+        tx, ty = target.rect.center
+        dx, dy = tx - px, ty - py
+        reach = player.attack_range + player.rect.width // 2
+        attack = target in enemies and max(abs(dx), abs(dy)) <= reach
+        # Quase alinhado em um eixo: anda só no outro, para o ataque sair de frente.
+        slack = player.rect.width // 2
+        return InputFrame(
+            up=dy < -slack or (dy < 0 and abs(dy) >= abs(dx)),
+            down=dy > slack or (dy > 0 and abs(dy) > abs(dx)),
+            left=dx < -slack or (dx < 0 and abs(dx) > abs(dy)),
+            right=dx > slack or (dx > 0 and abs(dx) > abs(dy)),
+            attack=attack,
+        )
+
+
+def _nearest(candidates, px: float, py: float):
+    best = None
+    best_distance = float("inf")
+    for candidate in candidates:
+        cx, cy = candidate.rect.center
+        distance = (cx - px) ** 2 + (cy - py) ** 2
+        if distance < best_distance:
+            best, best_distance = candidate, distance
+    return best
+
+
+_game: Game | None = None
+
+
+def run_one(spec: RunSpec) -> dict[str, object]:
+    """Executa uma partida; roda dentro dos processos do pool."""
+
+    global _game
+    if _game is None:
+        _game = Game(headless=True)
+    game = _game
+
+    tilemap, spawns = build_scenario(spec.map_size, spec.enemies, spec.seed)
+    bot = ChaseBot()
+    scene = GameScene(
+        game,
+        tilemap=tilemap,
+        enemy_spawns=spawns,
+        input_source=bot,
+        seed=spec.seed,
+        player_class=spec.player_class,
+    )
+    bot.scene = scene
+    game.running = True
+    game.set_scene(scene)
+
+    ticks = 0
+    while ticks < spec.ticks and not scene.game_over:
+        game.update(game.fixed_delta)
+        ticks += 1
+
+    return {
+        "class": spec.player_class,
+        "seed": spec.seed,
+        "died": scene.game_over,
+        "seconds_alive": ticks * game.fixed_delta,
+        "kills": scene.kills,
+        "coins": scene.coins_collected,
+        "items": scene.items_collected,
+        "hp_left": max(0.0, scene.player.hp),
+    }
+
+
+def summarize(results: list[dict[str, object]]) -> dict[str, dict[str, float]]:
+    """Agrega as execuções por classe."""
+
+    report: dict[str, dict[str, float]] = {}
+    for name in sorted({result["class"] for result in results}):
+        runs = [result for result in results if result["class"] == name]
+        deaths = [run["seconds_alive"] for run in runs if run["died"]]
+        time_to_death = round(statistics.median(deaths), 2) if deaths else None
+        report[name] = {
+            "runs": len(runs),
+            "death_rate": round(len(deaths) / len(runs), 3),
+            "time_to_death_p50": time_to_death,
+            "kills_mean": round(statistics.fmean(run["kills"] for run in runs), 2),
+            "coins_mean": round(statistics.fmean(run["coins"] for run in runs), 2),
+            "items_mean": round(statistics.fmean(run["items"] for run in runs), 2),
+            "hp_left_mean": round(statistics.fmean(run["hp_left"] for run in runs), 1),
+        }
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--classes", nargs="*", help="padrão: todas de classes.json")
+    parser.add_argument("--seeds", type=int, default=50, help="execuções por classe")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--map-size", type=parse_size, default=(32, 32))
+    parser.add_argument("--enemies", type=int, default=40)
+    parser.add_argument("--ticks", type=int, default=3600, help="limite por execução")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--json", action="store_true", help="imprime JSON")
+    args = parser.parse_args(argv)
+
+    with CLASSES_PATH.open(encoding="utf-8") as file:
+        classes = args.classes or list(json.load(file))
+    # Classes intercaladas para que cada processo receba uma mistura parecida.
+    specs = [
+        RunSpec(name, seed, args.map_size, args.enemies, args.ticks)
+        for seed in range(args.first_seed, args.first_seed + args.seeds)
+        for name in classes
+    ]
+
+    start = time.perf_counter()
+    if args.workers <= 1:
+        results = [run_one(spec) for spec in specs]
+    else:
+        chunksize = max(1, len(specs) // (args.workers * 8))
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(run_one, specs, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+
+    report = summarize(results)
+    if args.json:
+        print(json.dumps({"seconds": round(elapsed, 3), "classes": report}, indent=2))
+        return
+
+    print(
+        f"{len(specs)} execuções em {elapsed:.2f} s com {args.workers} processo(s) "
+        f"({len(specs) / elapsed:.1f} execuções/s)"
+    )
+    columns = list(next(iter(report.values())))
+    print(f"{'classe':<10}" + "".join(f"{column:>19}" for column in columns))
+    for name, values in report.items():
+        cells = ("-" if values[column] is None else values[column] for column in columns)
+        print(f"{name:<10}" + "".join(f"{cell:>19}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Benchmark de escala da separação de multidão (``CrowdSeparation``).
+
+Empilha N inimigos em uma região aberta da arena e mede o custo por frame da
+separação por grade, comparando com a versão ingênua de todos os pares nos
+tamanhos menores. Por padrão usa o mesmo limite de separações por frame da
+``GameScene`` (``CROWD_MAX_RESOLUTIONS``) e falha (código 1) se a média por
+frame de algum tamanho passar de ``--max-ms``. Distribuir os inimigos na grade
+continua linear na quantidade, então a partir de alguns milhares de inimigos
+esse custo fixo sozinho se aproxima do orçamento.
+
+Exemplo::
+
+    python -m tools.bench_crowd --counts 250 500 1000 2000 4000 --frames 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from entities.enemy import Enemy
+from scenes.game_scene import CROWD_MAX_RESOLUTIONS, TILE_SIZE
+from systems.collision import soft_separate
+from systems.collision_grid import CollisionGrid
+from systems.crowd import CrowdSeparation
+from tools.arena import build_arena
+
+NAIVE_LIMIT = 1000
+# Um quarto de um frame a 60 FPS.
+DEFAULT_MAX_MS = 4.0
+
+
+def spawn_clump(count: int, arena_tiles: int, seed: int) -> list[Enemy]:
+    """Espalha ``count`` inimigos em um quadrado com ~2 inimigos por tile."""
+
+    rng = random.Random(seed)
+    side = max(2, int((count / 2) ** 0.5)) * TILE_SIZE
+    origin = (arena_tiles * TILE_SIZE - side) // 2
+    return [
+        Enemy((origin + rng.randrange(side), origin + rng.randrange(side)))
+        for _ in range(count)
+    ]
+
+
+def naive_frame(enemies: list[Enemy], colliders: CollisionGrid) -> None:
+    """Separação ingênua O(n²) usada apenas como referência."""
+
+    for i, enemy in enumerate(enemies):
+        for other in enemies[i + 1 :]:
+            if enemy.rect.colliderect(other.rect):
+                enemy.rect, other.rect = soft_separate(
+                    enemy.rect, other.rect, colliders, push_share_a=0.5
+                )
+
+
+def bench(
+    count: int, frames: int, seed: int, solver: CrowdSeparation
+) -> dict[str, float]:
+    arena_tiles = max(16, int((count / 2) ** 0.5) + 8)
+    tilemap = build_arena(arena_tiles, arena_tiles, seed=seed, pillar_density=0.0)
+    colliders = CollisionGrid.from_tilemap(tilemap, TILE_SIZE)
+    enemies = spawn_clump(count, arena_tiles, seed)
+
+    timings: list[float] = []
+    resolved = 0
+    exhausted = 0
+    for _ in range(frames):
+        solver.resolve(enemies, colliders)
+        timings.append(solver.last_ms)
+        resolved += solver.last_pairs_resolved
+        exhausted += int(solver.last_budget_exhausted)
+
+    result = {
+        "mean_ms": sum(timings) / len(timings),
+        "max_ms": max(timings),
+        "resolved_per_frame": resolved / frames,
+        "budget_frames": exhausted,
+        "naive_ms": float("nan"),
+    }
+    if count <= NAIVE_LIMIT:
+        enemies = spawn_clump(count, arena_tiles, seed)
+        start = time.perf_counter()
+        naive_frame(enemies, colliders)
+        result["naive_ms"] = (time.perf_counter() - start) * 1000.0
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[250, 500, 1000, 2000])
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-pair-tests", type=int, default=8000)
+    parser.add_argument(
+        "--max-resolutions",
+        type=int,
+        default=CROWD_MAX_RESOLUTIONS,
+        help="separações por frame; 0 desliga o limite",
+    )
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=DEFAULT_MAX_MS,
+        help="falha se a média por frame passar deste valor",
+    )
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'inimigos':>9} {'média ms':>9} {'máx ms':>8} {'pares/frame':>12} "
+        f"{'frames c/ orçamento':>20} {'ingênuo ms (1 frame)':>21}"
+    )
+    failed = False
+    for count in args.counts:
+        solver = CrowdSeparation(
+            args.max_pair_tests, args.budget_ms, args.max_resolutions or None
+        )
+        result = bench(count, args.frames, args.seed, solver)
+        over = result["mean_ms"] > args.max_ms
+        failed = failed or over
+        print(
+            f"{count:>9} {result['mean_ms']:>9.2f} {result['max_ms']:>8.2f} "
+            f"{result['resolved_per_frame']:>12.1f} {result['budget_frames']:>20} "
+            f"{result['naive_ms']:>21.2f}"
+            + (f"  <- acima de {args.max_ms} ms" if over else "")
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
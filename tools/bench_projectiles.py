@@ -0,0 +1,119 @@
+"""Mede o custo por tick do ``ProjectileSystem`` com milhares de projéteis vivos.
+
+Mantém ``--counts`` projéteis em uma arena (os que morrem são repostos a
+cada tick) disparando contra ``--enemies`` alvos parados e mede o tempo médio
+de ``update`` (paredes e alvos) e de ``draw``.
+
+Exemplo::
+
+    python -m tools.bench_projectiles --counts 1000 5000 20000 --ticks 120
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+import pygame
+
+from core.camera import Camera
+from core.game import Game
+from systems.projectiles import OWNER_PLAYER, ProjectileSystem
+from tools.arena import build_arena, floor_tiles, parse_size
+
+TILE_SIZE = 32
+
+
+def run_case(
+    game: Game,
+    map_size: tuple[int, int],
+    count: int,
+    enemies: int,
+    ticks: int,
+    speed: float,
+    seed: int,
+) -> dict[str, object]:
+    tilemap = build_arena(*map_size, seed=seed)
+    rng = random.Random(seed)
+    floor = floor_tiles(tilemap)
+    targets = [
+        pygame.Rect(x * TILE_SIZE + 2, y * TILE_SIZE + 2, 28, 28)
+        for x, y in (rng.choice(floor) for _ in range(enemies))
+    ]
+    system = ProjectileSystem(tilemap, TILE_SIZE, capacity=count)
+
+    def refill() -> None:
+        missing = count - len(system)
+        if missing <= 0:
+            return
+        positions = []
+        velocities = []
+        for _ in range(missing):
+            x, y = rng.choice(floor)
+            positions.append(((x + 0.5) * TILE_SIZE, (y + 0.5) * TILE_SIZE))
+            velocities.append((rng.uniform(-speed, speed), rng.uniform(-speed, speed)))
+        system.spawn_many(positions, velocities, 1.0, lifetime=2.0, pierce=1)
+
+    camera = Camera(game.size)
+    camera.follow((map_size[0] * TILE_SIZE / 2, map_size[1] * TILE_SIZE / 2))
+    camera.interpolate(1.0)
+    delta = game.fixed_delta
+    update_s = 0.0
+    draw_s = 0.0
+    hits = 0
+    for _ in range(ticks):
+        refill()
+        start = time.perf_counter()
+        hits += system.update(delta, {OWNER_PLAYER: targets}).count
+        update_s += time.perf_counter() - start
+        start = time.perf_counter()
+        system.draw(game.screen, camera)
+        draw_s += time.perf_counter() - start
+
+    stats = system.stats()
+    return {
+        "map": f"{map_size[0]}x{map_size[1]}",
+        "projectiles": count,
+        "enemies": enemies,
+        "update_ms": round(update_s * 1000.0 / ticks, 4),
+        "draw_ms": round(draw_s * 1000.0 / ticks, 4),
+        "hits_per_tick": round(hits / ticks, 1),
+        "wall_hits_per_tick": round(stats["wall_hits"] / ticks, 1),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--enemies", type=int, default=500)
+    parser.add_argument("--map-size", type=parse_size, default=(128, 128))
+    parser.add_argument("--ticks", type=int, default=120)
+    parser.add_argument("--speed", type=float, default=1500.0, help="pixels/s por eixo")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="saída em JSON (para CI)")
+    args = parser.parse_args(argv)
+
+    game = Game(headless=True)
+    results = [
+        run_case(
+            game, args.map_size, count, args.enemies, args.ticks, args.speed, args.seed
+        )
+        for count in args.counts
+    ]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for result in results:
+        print(
+            f"projéteis {result['projectiles']:>6}  alvos {result['enemies']:>5}: "
+            f"update {result['update_ms']:>8.3f} ms  draw {result['draw_ms']:>7.3f} ms  "
+            f"({result['hits_per_tick']} acertos e "
+            f"{result['wall_hits_per_tick']} paredes por tick)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Compara linha de visão por retângulos de parede com o DDA do ``Raycaster``.
+
+Sorteia inimigos em uma arena e, a cada frame, checa a linha de visão de
+todos até o player (que anda um pouco entre frames) de três formas:
+``clipline`` contra cada retângulo de ``wall_rects`` (o caminho ingênuo), o
+DDA sem cache (``Raycaster.cast``) e ``Raycaster.visible_many``, que reusa a
+visibilidade entre pares de tiles.
+
+Exemplo::
+
+    python -m tools.bench_raycast --map-size 64 256 --rays 100 1000 --frames 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+from systems.raycast import Raycaster
+from systems.wall_merge import merge_walls
+from tools.arena import build_arena, floor_tiles, parse_size
+
+TILE_SIZE = 32
+
+
+def rects_visible(walls, origin, target) -> bool:
+    return not any(wall.clipline(origin, target) for wall in walls)
+
+
+def run_case(
+    map_size: tuple[int, int], rays: int, frames: int, seed: int
+) -> dict[str, object]:
+    tilemap = build_arena(*map_size, seed=seed)
+    walls = merge_walls(tilemap, TILE_SIZE)
+    rng = random.Random(seed)
+    floor = floor_tiles(tilemap)
+
+    def center(tile):
+        return (tile[0] * TILE_SIZE + TILE_SIZE // 2, tile[1] * TILE_SIZE + TILE_SIZE // 2)
+
+    origins = [center(rng.choice(floor)) for _ in range(rays)]
+    # O player percorre alguns tiles vizinhos, como em uma perseguição.
+    start = rng.choice(floor)
+    targets = [
+        center(tile)
+        for tile in floor
+        if abs(tile[0] - start[0]) + abs(tile[1] - start[1]) <= 2
+    ]
+    path = [targets[i % len(targets)] for i in range(frames)]
+
+    timings: dict[str, float] = {}
+
+    began = time.perf_counter()
+    expected = [
+        [rects_visible(walls, origin, target) for origin in origins] for target in path
+    ]
+    timings["rects_ms"] = time.perf_counter() - began
+
+    raycaster = Raycaster(tilemap, TILE_SIZE)
+    began = time.perf_counter()
+    for target in path:
+        [not raycaster.cast(origin, target).blocked for origin in origins]
+    timings["dda_ms"] = time.perf_counter() - began
+
+    cached = Raycaster(tilemap, TILE_SIZE)
+    began = time.perf_counter()
+    results = [cached.visible_many(origins, target) for target in path]
+    timings["dda_cached_ms"] = time.perf_counter() - began
+
+    agree = sum(
+        a == b for row, other in zip(expected, results) for a, b in zip(row, other)
+    )
+    result: dict[str, object] = {
+        "map": f"{map_size[0]}x{map_size[1]}",
+        "walls": len(walls),
+        "rays": rays,
+    }
+    for name, seconds in timings.items():
+        result[name] = round(seconds * 1000.0 / frames, 4)
+    result["cache_hit_rate"] = round(cached.stats()["cache_hit_rate"], 3)
+    result["agreement"] = round(agree / (rays * frames), 4)
+    return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--map-size", nargs="+", default=["64", "256"])
+    parser.add_argument("--rays", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="saída em JSON (para CI)")
+    args = parser.parse_args(argv)
+
+    results = [
+        run_case(parse_size(size), rays, args.frames, args.seed)
+        for size in args.map_size
+        for rays in args.rays
+    ]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for result in results:
+        print(
+            f"mapa {result['map']:>9} ({result['walls']} paredes)  raios {result['rays']:>5}: "
+            f"retângulos {result['rects_ms']:>9.3f} ms  dda {result['dda_ms']:>8.3f} ms  "
+            f"dda+cache {result['dda_cached_ms']:>7.3f} ms/frame  "
+            f"(acertos do cache {result['cache_hit_rate']:.0%}, "
+            f"concordância {result['agreement']:.1%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
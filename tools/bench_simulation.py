@@ -0,0 +1,129 @@
+"""Benchmark headless de vazão da simulação da ``GameScene``.
+
+Exemplo::
+
+    python -m tools.bench_simulation --enemies 10 100 1000 --map-size 32 128 --ticks 600
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from core.game import Game
+from tools.arena import make_bench_scene, parse_size
+
+
+def run_case(
+    game: Game,
+    map_size: tuple[int, int],
+    enemy_count: int,
+    ticks: int,
+    seed: int,
+    use_swarm: bool,
+    render: bool,
+    streaming: bool = False,
+    ai_lod: bool = True,
+) -> dict[str, object]:
+    """Roda um cenário e retorna ticks/s e o tempo médio por fase (ms/tick)."""
+
+    game.running = True
+    game.set_scene(
+        make_bench_scene(
+            game, map_size, enemy_count, seed, use_swarm, streaming, ai_lod
+        )
+    )
+    game.profiler.reset()
+
+    start = time.perf_counter()
+    completed = game.run_headless(ticks, render=render)
+    elapsed = time.perf_counter() - start
+
+    per_tick = max(1, completed)
+    scene = game.active_scene
+    phases = {
+        name: round(total * 1000.0 / per_tick, 4)
+        for name, total in sorted(game.profiler.totals.items())
+    }
+    result: dict[str, object] = {
+        "map": f"{map_size[0]}x{map_size[1]}",
+        "enemies": enemy_count,
+        "swarm": use_swarm,
+        "streaming": streaming,
+        "ai_lod": ai_lod,
+        "ticks": completed,
+        "seconds": round(elapsed, 4),
+        "ticks_per_sec": round(completed / elapsed, 1) if elapsed > 0 else 0.0,
+        "phases_ms": phases,
+    }
+    if render and game.dirty_rects:
+        tracker = scene.dirty_tracker
+        frames = tracker.full_redraws + tracker.partial_redraws
+        screen_area = tracker.screen.width * tracker.screen.height
+        result["partial_redraw_ratio"] = (
+            round(tracker.partial_redraws / frames, 3) if frames else 0.0
+        )
+        result["dirty_area_ratio"] = (
+            round(tracker.total_dirty_area / (frames * screen_area), 3) if frames else 0.0
+        )
+    return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--enemies", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--map-size", nargs="+", default=["32"], help="ex.: 64 ou 64x32")
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--swarm", action="store_true", help="usa o EnemySwarm (numpy)")
+    parser.add_argument("--render", action="store_true", help="desenha a cada tick")
+    parser.add_argument(
+        "--streaming", action="store_true", help="carrega só os chunks ao redor da câmera"
+    )
+    parser.add_argument(
+        "--no-ai-lod", action="store_true", help="atualiza todos os inimigos a cada tick"
+    )
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        help="com --render, redesenha só as áreas alteradas",
+    )
+    parser.add_argument("--json", action="store_true", help="saída em JSON (para CI)")
+    args = parser.parse_args(argv)
+
+    game = Game(headless=True, dirty_rects=args.dirty_rects)
+    results = [
+        run_case(
+            game,
+            parse_size(size),
+            enemy_count,
+            args.ticks,
+            args.seed,
+            args.swarm,
+            args.render,
+            args.streaming,
+            not args.no_ai_lod,
+        )
+        for size in args.map_size
+        for enemy_count in args.enemies
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for result in results:
+        print(
+            f"mapa {result['map']:>9}  inimigos {result['enemies']:>6}  "
+            f"{result['ticks_per_sec']:>9} ticks/s"
+        )
+        if "partial_redraw_ratio" in result:
+            print(f"    frames parciais        {result['partial_redraw_ratio']:>9.1%}")
+            print(f"    área suja média        {result['dirty_area_ratio']:>9.1%}")
+        for name, value in result["phases_ms"].items():
+            print(f"    {name:<22} {value:>9.4f} ms/tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Compara o desenho de entidades com ``pygame.draw.rect`` e com atlas + ``fblits``.
+
+Espalha inimigos (com vida variada) e itens pela tela e mede o tempo médio de
+desenho por frame nos dois caminhos: ``draw`` de cada entidade, com várias
+chamadas de ``pygame.draw.rect``, e ``queue_draw`` com sprites de um
+``TextureAtlas`` enviados em uma única chamada pela ``RenderQueue``. Também
+confere se os dois caminhos produzem os mesmos pixels.
+
+Exemplo::
+
+    python -m tools.bench_sprites --counts 500 2000 5000 --frames 120
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+
+import pygame
+
+from core.atlas import RenderQueue, TextureAtlas
+from core.camera import Camera
+from core.game import Game
+from entities.enemy import Enemy
+from entities.pickup import LootPickup
+
+BACKGROUND = (20, 20, 28)
+PICKUP_SHARE = 4  # um item a cada quatro entidades
+
+
+def build_entities(
+    count: int, size: tuple[int, int], seed: int
+) -> tuple[list[Enemy], list[LootPickup]]:
+    rng = random.Random(seed)
+    width, height = size
+    pickup_count = count // PICKUP_SHARE
+    pickups = [
+        LootPickup(
+            (rng.randrange(width), rng.randrange(height)),
+            "coin" if rng.random() < 0.7 else "item",
+        )
+        for _ in range(pickup_count)
+    ]
+    enemies = []
+    for _ in range(count - pickup_count):
+        enemy = Enemy((rng.randrange(width), rng.randrange(height)))
+        enemy.take_damage(rng.randrange(0, int(enemy.max_health) + 1))
+        enemies.append(enemy)
+    return enemies, pickups
+
+
+def draw_rects(surface, camera, enemies, pickups) -> None:
+    surface.fill(BACKGROUND)
+    for pickup in pickups:
+        pickup.draw(surface, camera)
+    for enemy in enemies:
+        enemy.draw(surface, camera)
+
+
+def draw_atlas(surface, camera, enemies, pickups, atlas, queue) -> None:
+    surface.fill(BACKGROUND)
+    for pickup in pickups:
+        pickup.queue_draw(queue, atlas, camera)
+    queue.flush(surface)
+    for enemy in enemies:
+        enemy.queue_draw(queue, atlas, camera)
+    queue.flush(surface)
+
+
+def time_frames(draw, frames: int) -> float:
+    """Tempo médio por frame (ms), após um frame de aquecimento."""
+
+    draw()
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw()
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+def run_case(game: Game, count: int, frames: int, seed: int) -> dict[str, object]:
+    surface = game.screen
+    camera = Camera(game.size)
+    camera.interpolate(1.0)
+    enemies, pickups = build_entities(count, game.size, seed)
+    atlas = TextureAtlas(like=surface)
+    queue = RenderQueue()
+
+    draw_atlas(surface, camera, enemies, pickups, atlas, queue)
+    batched = pygame.image.tobytes(surface, "RGB")
+    draw_rects(surface, camera, enemies, pickups)
+    identical = batched == pygame.image.tobytes(surface, "RGB")
+
+    rects_ms = time_frames(lambda: draw_rects(surface, camera, enemies, pickups), frames)
+    atlas_ms = time_frames(
+        lambda: draw_atlas(surface, camera, enemies, pickups, atlas, queue), frames
+    )
+    return {
+        "entities": count,
+        "draw_rect_ms": round(rects_ms, 3),
+        "atlas_ms": round(atlas_ms, 3),
+        "speedup": round(rects_ms / atlas_ms, 2) if atlas_ms > 0 else 0.0,
+        "atlas_sprites": len(atlas),
+        "identical": identical,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[500, 2000, 5000])
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="saída em JSON (para CI)")
+    args = parser.parse_args(argv)
+
+    game = Game(headless=True)
+    results = [run_case(game, count, args.frames, args.seed) for count in args.counts]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        blit = "fblits" if hasattr(game.screen, "fblits") else "blits"
+        print(f"{'entidades':>10} {'draw.rect':>11} {f'atlas+{blit}':>13} {'ganho':>7}")
+        for result in results:
+            print(
+                f"{result['entities']:>10} {result['draw_rect_ms']:>8.3f} ms "
+                f"{result['atlas_ms']:>10.3f} ms {result['speedup']:>6.2f}x"
+                + ("" if result["identical"] else "  (pixels diferentes!)")
+            )
+    return 0 if all(result["identical"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Mede a partida a frio do jogo: imports, init e tempo até o primeiro frame.
+
+Cada execução roda em um processo Python novo (com ``SDL_VIDEODRIVER=dummy``),
+para que imports e caches do sistema não venham aquecidos da execução
+anterior. São reportadas as medianas de:
+
+- ``process``: do lançamento do processo até o fim da medição;
+- ``import``: importar ``core.game`` e as cenas;
+- ``init``: construir o ``Game`` (subsistemas do pygame e janela);
+- ``first_frame``: do fim do init até o primeiro frame desenhado;
+- ``ready``: do fim do init até o primeiro frame da ``GameScene``.
+
+``--eager`` mede também o caminho antigo, com ``pygame.init()`` completo e a
+``GameScene`` construída antes do primeiro frame.
+
+Exemplo::
+
+    python -m tools.bench_startup --runs 10 --eager
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+METRICS = ("process", "import", "init", "first_frame", "ready")
+
+
+def measure_child(eager: bool) -> dict[str, float]:
+    """Roda dentro do processo filho e mede cada etapa em milissegundos."""
+
+    start = time.perf_counter()
+    import pygame
+
+    from core.game import Game
+    from scenes.game_scene import GameScene
+    from scenes.loading_scene import LoadingScene
+
+    imported = time.perf_counter()
+    if eager:
+        pygame.init()
+    game = Game()
+    initialized = time.perf_counter()
+
+    if eager:
+        game.set_scene(GameScene(game))
+    else:
+        game.set_scene(
+            LoadingScene(
+                game, GameScene.preload(game.resources), lambda: GameScene(game)
+            )
+        )
+
+    first_frame = None
+    while True:
+        game.handle_events()
+        game.advance(game.clock.tick() / 1000.0)
+        game.draw(game.interpolation_alpha())
+        now = time.perf_counter()
+        if first_frame is None:
+            first_frame = now
+        if isinstance(game.active_scene, GameScene):
+            break
+    pygame.quit()
+
+    def ms(begin: float, end: float) -> float:
+        return round((end - begin) * 1000.0, 3)
+
+    return {
+        "import": ms(start, imported),
+        "init": ms(imported, initialized),
+        "first_frame": ms(initialized, first_frame),
+        "ready": ms(initialized, now),
+    }
+
+
+def run_child(eager: bool) -> dict[str, float]:
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    command = [sys.executable, "-m", "tools.bench_startup", "--child"]
+    if eager:
+        command.append("--eager")
+
+    start = time.perf_counter()
+    output = subprocess.run(
+        command, cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result["process"] = round((time.perf_counter() - start) * 1000.0, 3)
+    return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--eager", action="store_true", help="mede também o caminho antigo")
+    parser.add_argument("--json", action="store_true", help="imprime JSON")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure_child(args.eager)))
+        return
+
+    modes = [("eager", True), ("lazy", False)] if args.eager else [("lazy", False)]
+    report = {}
+    for name, eager in modes:
+        runs = [run_child(eager) for _ in range(args.runs)]
+        report[name] = {
+            metric: round(statistics.median(run[metric] for run in runs), 3)
+            for metric in METRICS
+        }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{'modo':<8}" + "".join(f"{metric:>14}" for metric in METRICS))
+    for name, values in report.items():
+        print(f"{name:<8}" + "".join(f"{values[metric]:>11.1f} ms" for metric in METRICS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Relatório de colisores por tile vs. colisores mesclados.
+
+Mostra, para o mapa padrão e para arenas geradas, quantos retângulos de
+colisão existem antes e depois de ``merge_walls``.
+
+Exemplo::
+
+    python -m tools.collider_report --map-size 32 128 --seed 0
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from scenes.game_scene import TILE_SIZE, TILEMAP
+from systems.wall_merge import count_solid, merge_walls
+from tools.arena import build_arena, parse_size
+
+
+def report(name: str, tilemap: list[list[int]]) -> None:
+    before = count_solid(tilemap)
+    after = len(merge_walls(tilemap, TILE_SIZE))
+    ratio = after / before if before else 1.0
+    print(f"{name:>12}  tiles sólidos {before:>7}  mesclados {after:>7}  ({ratio:.1%})")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--map-size", nargs="*", default=["32", "128"], help="ex.: 64 ou 64x32")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    report("padrão", TILEMAP)
+    for size in args.map_size:
+        width, height = parse_size(size)
+        report(f"{width}x{height}", build_arena(width, height, seed=args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Compila mapas Tiled/JSON para o cache binário e compara os tempos de carga.
+
+Exemplo::
+
+    python -m tools.compile_maps data/maps/*.json
+    python -m tools.compile_maps --arena 512 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from core.map_format import DEFAULT_CACHE_DIR, cache_path, compile_map, load_map
+from scenes.game_scene import TILE_SIZE
+from tools.arena import build_arena
+
+MAPS_DIR = Path(__file__).resolve().parent.parent / "data" / "maps"
+
+
+def write_arena_json(path: Path, size: int, seed: int) -> None:
+    """Grava uma arena gerada no formato JSON do Tiled (para medir mapas grandes)."""
+
+    tilemap = build_arena(size, size, seed=seed)
+    document = {
+        "width": size,
+        "height": size,
+        "tilewidth": TILE_SIZE,
+        "tileheight": TILE_SIZE,
+        "layers": [
+            {
+                "name": "tiles",
+                "type": "tilelayer",
+                "width": size,
+                "height": size,
+                "data": [tile for row in tilemap for tile in row],
+            }
+        ],
+    }
+    path.write_text(json.dumps(document), encoding="utf-8")
+
+
+def measure(source: Path, cache_dir: Path, repeat: int) -> None:
+    start = time.perf_counter()
+    size = compile_map(source, cache_path(source, cache_dir))
+    compile_ms = (time.perf_counter() - start) * 1000.0
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        json.loads(source.read_bytes())
+    json_ms = (time.perf_counter() - start) * 1000.0 / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        compiled = load_map(source, cache_dir)
+    load_ms = (time.perf_counter() - start) * 1000.0 / repeat
+
+    dimensions = f"{compiled.width}x{compiled.height}"
+    print(
+        f"{source.name:<24} {dimensions:>10}  "
+        f"fonte {source.stat().st_size:>10} B  binário {size:>10} B  "
+        f"colisores {len(compiled.colliders):>6}  compilar {compile_ms:>8.2f} ms  "
+        f"json.loads {json_ms:>8.2f} ms  load_map {load_ms:>7.2f} ms"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("maps", nargs="*", type=Path)
+    parser.add_argument("--arena", type=int, nargs="*", default=[], help="gera arenas NxN")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args(argv)
+
+    sources = list(args.maps) or sorted(MAPS_DIR.glob("*.json"))
+    for source in sources:
+        measure(source, args.cache_dir, args.repeat)
+
+    # Arenas geradas ficam fora do cache do projeto.
+    with tempfile.TemporaryDirectory() as scratch:
+        for size in args.arena:
+            path = Path(scratch) / f"arena_{size}.json"
+            write_arena_json(path, size, args.seed)
+            measure(path, Path(scratch), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
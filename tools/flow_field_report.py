@@ -0,0 +1,65 @@
+"""Verifica se o campo de fluxo fatiado continua publicando campos com alvo em movimento.
+
+Move o alvo para um tile novo a cada ``--retarget-every`` passos e conta
+quantos campos ficaram prontos e quantos passos no máximo um campo ficou sem
+ser renovado. Sai com código 1 se nenhum campo ficar pronto ou se o maior
+intervalo passar de ``--max-stale`` passos (starvation).
+
+Exemplo::
+
+    python -m tools.flow_field_report --map-size 128 --budget 800 --retarget-every 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+
+from systems.flow_field import FlowField
+from tools.arena import build_arena, floor_tiles, parse_size
+
+TILE_SIZE = 48
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--map-size", type=parse_size, default=(128, 128))
+    parser.add_argument("--budget", type=int, default=800, help="nós por passo")
+    parser.add_argument("--retarget-every", type=int, default=10)
+    parser.add_argument("--ticks", type=int, default=3000)
+    parser.add_argument("--max-stale", type=int, default=120, help="passos")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    tilemap = build_arena(*args.map_size, seed=args.seed)
+    rng = random.Random(args.seed)
+    floor = floor_tiles(tilemap)
+    field = FlowField(tilemap, TILE_SIZE, nodes_per_update=args.budget)
+
+    target = rng.choice(floor)
+    builds = 0
+    stale = 0
+    worst_stale = 0
+    for tick in range(args.ticks):
+        if tick % args.retarget_every == 0:
+            target = rng.choice(floor)
+        center = ((target[0] + 0.5) * TILE_SIZE, (target[1] + 0.5) * TILE_SIZE)
+        if field.update(center):
+            builds += 1
+            stale = 0
+        else:
+            stale += 1
+            worst_stale = max(worst_stale, stale)
+
+    print(
+        f"mapa {args.map_size[0]}x{args.map_size[1]}, {args.budget} nós/passo, "
+        f"alvo novo a cada {args.retarget_every} passos: {builds} campos em "
+        f"{args.ticks} passos, maior intervalo {worst_stale} passos, "
+        f"versão {field.version}"
+    )
+    return 0 if builds > 0 and worst_stale <= args.max_stale else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""Grava e reproduz replays de input como cargas fixas para comparar desempenho.
+
+``record`` joga uma arena gerada com o bot de ``tools.balance`` e grava o log;
+``play`` reproduz um log headless o mais rápido possível, confere os
+checksums dos checkpoints e mostra ticks/s e o tempo médio por fase. Rodar o
+mesmo log antes e depois de uma mudança dá uma comparação com carga idêntica
+(partidas gravadas com ``python main.py --record`` também servem).
+
+Exemplo::
+
+    python -m tools.replay record replays/arena.prpl --map-size 64 --enemies 400
+    python -m tools.replay play replays/arena.prpl --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from core.game import Game
+from core.replay import InputRecorder, ReplayLog, ReplayMismatch, play
+from scenes.game_scene import GameScene
+from tools.arena import build_scenario, parse_size
+from tools.balance import ChaseBot
+
+
+def record(args: argparse.Namespace) -> int:
+    game = Game(headless=True)
+    tilemap, spawns = build_scenario(args.map_size, args.enemies, args.seed)
+
+    bot = ChaseBot()
+    recorder = InputRecorder(args.path, checkpoint_every=args.checkpoint_every)
+    scene = GameScene(
+        game,
+        use_swarm=args.swarm,
+        tilemap=tilemap,
+        enemy_spawns=spawns,
+        input_source=bot,
+        seed=args.seed,
+        player_class=args.player_class,
+        recorder=recorder,
+    )
+    bot.scene = scene
+    game.set_scene(scene)
+    game.run_headless(args.ticks)
+    scene.exit()
+
+    size = args.path.stat().st_size
+    print(
+        f"{args.path}: {recorder.log.ticks} ticks, "
+        f"{len(recorder.log.checkpoints)} checkpoints, {size} B"
+    )
+    return 0
+
+
+def replay(args: argparse.Namespace) -> int:
+    log = ReplayLog.load(args.path)
+    game = Game(headless=True, sim_hz=log.metadata["sim_hz"])
+
+    rates: list[float] = []
+    phases: dict[str, list[float]] = {}
+    for _ in range(args.repeat):
+        game.profiler.reset()
+        start = time.perf_counter()
+        try:
+            play(log, game, verify=not args.no_verify, render=args.render)
+        except ReplayMismatch as error:
+            print(f"{args.path}: {error}", file=sys.stderr)
+            return 1
+        elapsed = time.perf_counter() - start
+        rates.append(log.ticks / elapsed if elapsed > 0 else 0.0)
+        for name, total in game.profiler.totals.items():
+            phases.setdefault(name, []).append(total * 1000.0 / max(1, log.ticks))
+
+    result = {
+        "replay": str(args.path),
+        "ticks": log.ticks,
+        "checkpoints": 0 if args.no_verify else len(log.checkpoints),
+        "ticks_per_sec": round(statistics.median(rates), 1),
+        "phases_ms": {
+            name: round(statistics.median(values), 4)
+            for name, values in sorted(phases.items())
+        },
+    }
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+
+    print(
+        f"{args.path}: {log.ticks} ticks, {result['checkpoints']} checkpoints ok, "
+        f"{result['ticks_per_sec']:.1f} ticks/s (mediana de {args.repeat})"
+    )
+    for name, value in result["phases_ms"].items():
+        print(f"  {name:<24} {value:>9.4f} ms/tick")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    recording = commands.add_parser("record", help="grava um replay de arena com bot")
+    recording.add_argument("path", type=Path)
+    recording.add_argument("--map-size", type=parse_size, default=(48, 48))
+    recording.add_argument("--enemies", type=int, default=200)
+    recording.add_argument("--ticks", type=int, default=1800)
+    recording.add_argument("--seed", type=int, default=0)
+    recording.add_argument("--player-class", default=None)
+    recording.add_argument("--swarm", action="store_true")
+    recording.add_argument("--checkpoint-every", type=int, default=60)
+    recording.set_defaults(handler=record)
+
+    playing = commands.add_parser("play", help="reproduz e mede um replay")
+    playing.add_argument("path", type=Path)
+    playing.add_argument("--repeat", type=int, default=3)
+    playing.add_argument("--render", action="store_true", help="desenha cada tick")
+    playing.add_argument("--no-verify", action="store_true", help="ignora checksums")
+    playing.add_argument("--json", action="store_true", help="imprime JSON")
+    playing.set_defaults(handler=replay)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())